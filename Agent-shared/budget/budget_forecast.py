@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bütçe tüketim hızı tahmini
+Canlı oran (çalışan işlerin oran toplamı), bekleyen işler ve ajan başına geçmiş iş süreleri
+kullanılarak bütçe eşiklerine ulaşma zamanı (ETA) tahmin edilir
+
+Çıktılar:
+- Agent-shared/budget/snapshots/forecast.json (PM için; iş gönderimini kısma önerisi içerir)
+- Agent-shared/budget/snapshots/budget_forecast.prom (Prometheus textfile biçimi)
+
+Senaryolar:
+- committed: yalnızca çalışan + bekleyen işler (yeni iş gönderilmezse)
+- live: şu anki canlı oran sürerse
+- trend: son TREND_WINDOW_MIN dakikadaki ortalama tüketim hızı sürerse
+"""
+
+import re
+import json
+import math
+import statistics
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from budget_timeline import BudgetTimeline, parse_time, from_epoch
+
+TREND_WINDOW_MIN = 60  # Trend hızı için geriye bakılan süre
+DEFAULT_JOB_DURATION_SEC = 1800  # Geçmiş iş yoksa varsayılan süre
+DEFAULT_HORIZON_HOURS = 1.0  # Öneriler için planlama ufku
+
+PENDING_STATUSES = {'pending', 'queued', 'submitted', 'waiting', 'hold'}
+TERMINAL_STATUSES = {'success', 'completed', 'error', 'timeout', 'cancelled', 'failed'}
+
+# Prometheus'ta öneri durumu kodu
+STATUS_CODES = {'ok': 0, 'caution': 1, 'throttle': 2, 'stop': 3}
+
+
+def extract_agent_id(path: str) -> str:
+    """ChangeLog yolundan ajan ID'si (PG1, PG1.2 ...) çıkar"""
+    match = re.search(r'PG\d+(?:\.\d+)*', path or '')
+    return match.group() if match else 'unknown'
+
+
+def is_pending(job: Dict) -> bool:
+    """Kuyrukta bekleyen (henüz başlamamış) iş mi"""
+    status = (job.get('status') or '').lower()
+    if status in PENDING_STATUSES:
+        return True
+    return not job.get('start_time') and status not in TERMINAL_STATUSES and status != 'running'
+
+
+class BudgetForecaster:
+    """Bütçe tükenme zamanı tahmincisi"""
+
+    def __init__(self, tracker, limits: Optional[Dict[str, float]] = None,
+                 horizon_hours: float = DEFAULT_HORIZON_HOURS, target: str = 'expected'):
+        """
+        Args:
+            tracker: BudgetTracker (iş çıkarımı, ücret tablosu, zaman çizelgesi)
+            limits: Eşik adı → puan (varsayılan: tracker.limits, budget_tracker.BUDGET_THRESHOLDS)
+            horizon_hours: Eşzamanlı iş önerilerinin planlama ufku (saat)
+            target: Kısma önerisinin hedef aldığı eşik
+        """
+        self.tracker = tracker
+        self.limits = limits or tracker.limits
+        self.horizon_sec = horizon_hours * 3600
+        self.target = target if target in self.limits else 'expected'
+
+    def job_durations(self, jobs: List[Dict]) -> Dict[str, List[float]]:
+        """Biten işlerin ajan başına süreleri (saniye)"""
+        durations: Dict[str, List[float]] = {}
+        for job in jobs:
+            start = parse_time(job.get('start_time'))
+            end = parse_time(job.get('end_time') or job.get('cancelled_time'))
+            if start is None or end is None or end <= start:
+                continue
+            durations.setdefault(extract_agent_id(job.get('path')), []).append(end - start)
+        return durations
+
+    @staticmethod
+    def expected_duration(agent_id: str, durations: Dict[str, List[float]]) -> float:
+        """Ajanın beklenen iş süresi (medyan; geçmişi yoksa tüm ajanların medyanı)"""
+        if durations.get(agent_id):
+            return statistics.median(durations[agent_id])
+        all_durations = [d for values in durations.values() for d in values]
+        return statistics.median(all_durations) if all_durations else DEFAULT_JOB_DURATION_SEC
+
+    @staticmethod
+    def _eta(current: float, limit: float, times: np.ndarray, points: np.ndarray) -> Optional[float]:
+        """Parçalı doğrusal eğrinin limite ulaştığı an"""
+        if current >= limit:
+            return times[0]
+        reached = np.nonzero(points >= limit)[0]
+        if reached.size == 0:
+            return None
+        k = reached[0]
+        t0, t1, p0, p1 = times[k - 1], times[k], points[k - 1], points[k]
+        if not math.isfinite(t1):
+            return None
+        return t0 + (limit - p0) / (p1 - p0) * (t1 - t0)
+
+    def forecast(self, jobs: List[Dict], now: Optional[float] = None) -> Dict:
+        """Tahmin raporu üret"""
+        now = datetime.now(timezone.utc).timestamp() if now is None else now
+        timeline: BudgetTimeline = self.tracker.build_timeline(jobs)
+
+        current = timeline.points_at(now, now=now)
+        live_rate = timeline.rate_at(now, now=now)
+        window_start = max(now - TREND_WINDOW_MIN * 60, timeline.origin)
+        trend_rate = ((current - timeline.points_at(window_start, now=now)) / (now - window_start)
+                      if now > window_start else 0.0)
+
+        durations = self.job_durations(jobs)
+
+        # Beklenen işler: çalışanların kalan süresi ve bekleyenlerin tamamı (şimdi başlar varsayımı)
+        projected = []
+        running_count = pending_count = 0
+        for job in jobs:
+            agent_id = extract_agent_id(job.get('path'))
+            expected = self.expected_duration(agent_id, durations)
+            if job.get('status') == 'running' and not (job.get('end_time') or job.get('cancelled_time')):
+                start = parse_time(job.get('start_time'))
+                if start is None:
+                    continue
+                running_count += 1
+                remaining = max(expected - (now - start), 0.0)
+                projected.append((now, now + remaining, self.tracker.job_rate(job), job.get('resource_group')))
+            elif is_pending(job):
+                pending_count += 1
+                projected.append((now, now + expected, self.tracker.job_rate(job), job.get('resource_group')))
+
+        committed_series = BudgetTimeline(projected, now).series
+        committed_points = current + (float(committed_series.cum[-1]) if committed_series.times.size else 0.0)
+
+        # Eğriler: (zaman, puan) kırılma noktaları
+        curves = {
+            'committed': (np.concatenate([[now], committed_series.times]),
+                          current + np.concatenate([[0.0], committed_series.cum])),
+            'live': (np.array([now, math.inf]), np.array([current, math.inf if live_rate > 0 else current])),
+            'trend': (np.array([now, math.inf]), np.array([current, math.inf if trend_rate > 0 else current])),
+        }
+
+        limits_report = {}
+        for name, limit in self.limits.items():
+            entry = {'limit': limit, 'remaining_points': max(limit - current, 0.0),
+                     'used_percent': current / limit * 100 if limit > 0 else 0.0}
+            for scenario, rate in (('committed', None), ('live', live_rate), ('trend', trend_rate)):
+                if rate is None:
+                    eta = self._eta(current, limit, *curves[scenario])
+                else:
+                    eta = now if current >= limit else (now + (limit - current) / rate if rate > 0 else None)
+                entry[f'eta_{scenario}'] = from_epoch(eta).strftime('%Y-%m-%dT%H:%M:%SZ') if eta is not None else None
+                entry[f'hours_{scenario}'] = (eta - now) / 3600 if eta is not None else None
+            limits_report[name] = entry
+
+        report = {
+            'generated_at': from_epoch(now).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'current_points': current,
+            'live_rate_per_hour': live_rate * 3600,
+            'trend_rate_per_hour': trend_rate * 3600,
+            'committed_points': committed_points,
+            'running_jobs': running_count,
+            'pending_jobs': pending_count,
+            'expected_job_duration_sec': {agent: statistics.median(values)
+                                          for agent, values in sorted(durations.items())},
+            'limits': limits_report,
+            'hints': self.hints(limits_report[self.target], committed_points, live_rate, trend_rate, now),
+        }
+        return report
+
+    def hints(self, target: Dict, committed_points: float, live_rate: float,
+              trend_rate: float, now: float) -> Dict:
+        """PM için iş gönderimi önerisi"""
+        limit = target['limit']
+        headroom = max(limit - committed_points, 0.0)
+        horizon_h = self.horizon_sec / 3600
+
+        if committed_points >= limit:
+            status = 'stop'  # Çalışan/bekleyen işler bile eşiği aşıyor
+        elif target['hours_live'] is not None and target['hours_live'] <= horizon_h:
+            status = 'throttle'  # Mevcut oranla ufuk içinde eşiğe ulaşılıyor
+        elif target['hours_trend'] is not None and target['hours_trend'] <= 2 * horizon_h:
+            status = 'caution'
+        else:
+            status = 'ok'
+
+        # Ufuk boyunca sürecek yeni iş sayısı (kaynak grubu başına)
+        rates = self.tracker.rates
+        max_new_jobs = {}
+        affordable_hours = {}
+        for group in rates.names:
+            rate = rates.rate(group)
+            if rate <= 0:
+                continue
+            affordable_hours[group] = headroom / (rate * 3600)
+            max_new_jobs[group] = int(headroom // (rate * self.horizon_sec))
+
+        return {
+            'status': status,
+            'target_limit': self.target,
+            'horizon_hours': horizon_h,
+            'headroom_points': headroom,
+            'affordable_job_hours': affordable_hours,
+            'max_new_concurrent_jobs': max_new_jobs,
+        }
+
+
+def format_prometheus(report: Dict) -> str:
+    """Tahmin raporunu Prometheus metin biçimine dönüştür"""
+    def value(v):
+        return '+Inf' if v is None else f"{v:.6g}"
+
+    lines = [
+        '# HELP vibecodehpc_budget_points_total Consumed budget points',
+        '# TYPE vibecodehpc_budget_points_total gauge',
+        f"vibecodehpc_budget_points_total {value(report['current_points'])}",
+        '# HELP vibecodehpc_budget_burn_rate_points_per_hour Budget burn rate',
+        '# TYPE vibecodehpc_budget_burn_rate_points_per_hour gauge',
+        f"vibecodehpc_budget_burn_rate_points_per_hour{{scenario=\"live\"}} {value(report['live_rate_per_hour'])}",
+        f"vibecodehpc_budget_burn_rate_points_per_hour{{scenario=\"trend\"}} {value(report['trend_rate_per_hour'])}",
+        '# HELP vibecodehpc_budget_committed_points Points including expected remaining work of running and pending jobs',
+        '# TYPE vibecodehpc_budget_committed_points gauge',
+        f"vibecodehpc_budget_committed_points {value(report['committed_points'])}",
+        '# HELP vibecodehpc_budget_jobs Jobs by state',
+        '# TYPE vibecodehpc_budget_jobs gauge',
+        f"vibecodehpc_budget_jobs{{state=\"running\"}} {report['running_jobs']}",
+        f"vibecodehpc_budget_jobs{{state=\"pending\"}} {report['pending_jobs']}",
+        '# HELP vibecodehpc_budget_exhaustion_eta_seconds Seconds until the limit is reached (+Inf if never)',
+        '# TYPE vibecodehpc_budget_exhaustion_eta_seconds gauge',
+    ]
+    for name, entry in report['limits'].items():
+        for scenario in ('committed', 'live', 'trend'):
+            hours = entry[f'hours_{scenario}']
+            lines.append(f"vibecodehpc_budget_exhaustion_eta_seconds{{limit=\"{name}\",scenario=\"{scenario}\"}} "
+                         f"{value(hours * 3600 if hours is not None else None)}")
+    lines += [
+        '# HELP vibecodehpc_budget_submission_status Job submission hint (0=ok 1=caution 2=throttle 3=stop)',
+        '# TYPE vibecodehpc_budget_submission_status gauge',
+        f"vibecodehpc_budget_submission_status {STATUS_CODES[report['hints']['status']]}",
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def write_forecast(report: Dict, snapshot_dir: Path):
+    """forecast.json ve budget_forecast.prom dosyalarını yaz (PM/Prometheus yarım dosya okumasın diye rename ile)"""
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    json_tmp = snapshot_dir / 'forecast.json.tmp'
+    json_tmp.write_text(json.dumps(report, indent=2))
+    json_tmp.replace(snapshot_dir / 'forecast.json')
+    prom_tmp = snapshot_dir / 'budget_forecast.prom.tmp'
+    prom_tmp.write_text(format_prometheus(report))
+    prom_tmp.replace(snapshot_dir / 'budget_forecast.prom')
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Süpürme çizgisi (sweep-line) bütçe motoru
+İş aralıklarından olay zaman çizelgesini bir kez sıralı NumPy dizilerine dönüştürür;
+as_of, kilometre taşı ve "t0-t1 arası kaynak grubu başına puan" sorguları ikili arama ile yanıtlanır
+
+Zamanlar UNIX epoch saniyesi (float) olarak tutulur.
+Bitişi bilinmeyen (çalışan) işlerin aralığı açıktır (end=inf); sorgular `now` ile sınırlandırılır.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple, Optional, Iterable
+
+import numpy as np
+
+
+def to_epoch(value: datetime) -> float:
+    """datetime → epoch saniyesi (saat dilimi yoksa UTC kabul edilir)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def from_epoch(value: float) -> datetime:
+    """epoch saniyesi → UTC datetime"""
+    return datetime.fromtimestamp(value, timezone.utc)
+
+
+def parse_time(value: Optional[str]) -> Optional[float]:
+    """ChangeLog zaman dizgesini (YYYY-MM-DDTHH:MM:SSZ) epoch saniyesine çevir"""
+    if not value:
+        return None
+    try:
+        return to_epoch(datetime.fromisoformat(value.replace('Z', '+00:00')))
+    except ValueError:
+        return None
+
+
+class RateSeries:
+    """Tek bir aralık kümesinin sıralı olay dizileri
+
+    times[k] anındaki kümülatif puan cum[k], bu andan sonraki toplam oran rate[k]'dir.
+    """
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, rates: np.ndarray):
+        finite = np.isfinite(ends)
+        event_times = np.concatenate([starts, ends[finite]])
+        deltas = np.concatenate([rates, -rates[finite]])
+
+        if event_times.size == 0:
+            self.times = np.empty(0)
+            self.rate = np.empty(0)
+            self.cum = np.empty(0)
+            return
+
+        order = np.argsort(event_times, kind='stable')
+        event_times = event_times[order]
+        deltas = deltas[order]
+
+        # Aynı andaki olaylar tek noktada birleştirilir
+        self.times, first = np.unique(event_times, return_index=True)
+        rate = np.cumsum(np.add.reduceat(deltas, first))
+        rate[np.abs(rate) < 1e-12] = 0.0  # Kayan nokta artığı
+        self.rate = rate
+        self.cum = np.concatenate([[0.0], np.cumsum(rate[:-1] * np.diff(self.times))])
+
+    def points_at(self, t) -> np.ndarray:
+        """t anına kadar tüketilen puan (t skaler ya da dizi olabilir)"""
+        t = np.asarray(t, dtype=float)
+        if self.times.size == 0:
+            return np.zeros_like(t)
+        i = np.searchsorted(self.times, t, side='right') - 1
+        ic = np.clip(i, 0, None)
+        value = self.cum[ic] + self.rate[ic] * (t - self.times[ic])
+        return np.where(i >= 0, value, 0.0)
+
+    def rate_at(self, t) -> np.ndarray:
+        """t anındaki toplam tüketim oranı (puan/saniye)"""
+        t = np.asarray(t, dtype=float)
+        if self.times.size == 0:
+            return np.zeros_like(t)
+        i = np.searchsorted(self.times, t, side='right') - 1
+        return np.where(i >= 0, self.rate[np.clip(i, 0, None)], 0.0)
+
+
+class BudgetTimeline:
+    """İş aralıklarından bir kez kurulan bütçe zaman çizelgesi"""
+
+    def __init__(self, intervals: Iterable[Tuple[float, float, float, str]], project_start: float):
+        """
+        Args:
+            intervals: (başlangıç, bitiş, puan/saniye, kaynak grubu) listesi;
+                bitiş bilinmiyorsa (çalışan iş) float('inf')
+            project_start: Proje başlangıç zamanı (epoch saniyesi)
+        """
+        intervals = list(intervals)
+        self.starts = np.array([iv[0] for iv in intervals], dtype=float)
+        self.ends = np.array([iv[1] for iv in intervals], dtype=float)
+        self.rates = np.array([iv[2] for iv in intervals], dtype=float)
+        self.groups = [iv[3] for iv in intervals]
+
+        self.project_start = project_start
+        self.series = RateSeries(self.starts, self.ends, self.rates)
+        # Zaman çizelgesinin başlangıcı (proje başlangıcından önce başlamış iş olabilir)
+        self.origin = min(project_start, self.series.times[0]) if self.series.times.size else project_start
+
+        self.group_series: Dict[str, RateSeries] = {}
+        group_array = np.array(self.groups, dtype=object)
+        for group in sorted(set(self.groups)):
+            mask = group_array == group
+            self.group_series[group] = RateSeries(self.starts[mask], self.ends[mask], self.rates[mask])
+
+    @staticmethod
+    def _clamp(t: Optional[float], now: Optional[float]) -> float:
+        """Sorgu zamanını şimdiki zamanla sınırla (açık aralıklar geleceğe uzatılmaz)"""
+        now = time.time() if now is None else now
+        return now if t is None else min(t, now)
+
+    def points_at(self, t: Optional[float] = None, now: Optional[float] = None) -> float:
+        """t anına kadar (None ise şimdiye kadar) toplam tüketim"""
+        return float(self.series.points_at(self._clamp(t, now)))
+
+    def rate_at(self, t: Optional[float] = None, now: Optional[float] = None) -> float:
+        """t anındaki toplam tüketim oranı (puan/saniye)"""
+        return float(self.series.rate_at(self._clamp(t, now)))
+
+    def active_count(self, t: Optional[float] = None, now: Optional[float] = None) -> int:
+        """t anında çalışmakta olan aralık sayısı"""
+        t = self._clamp(t, now)
+        return int(np.count_nonzero((self.starts <= t) & (t < self.ends)))
+
+    def points_between(self, t0: float, t1: float, now: Optional[float] = None) -> Dict[str, float]:
+        """t0-t1 arasında kaynak grubu başına tüketilen puan"""
+        t0, t1 = self._clamp(t0, now), self._clamp(t1, now)
+        return {group: float(series.points_at(t1) - series.points_at(t0))
+                for group, series in self.group_series.items()}
+
+    def timeline(self, as_of: Optional[float] = None, now: Optional[float] = None) -> List[Tuple[datetime, float]]:
+        """Grafik/rapor için (zaman, kümülatif puan) listesi
+
+        Kesim anına kadarki olay noktaları döndürülür; kesim anında hâlâ çalışan iş varsa
+        kesim anı da son nokta olarak eklenir.
+        """
+        cutoff = self._clamp(as_of, now)
+        series = self.series
+        count = int(np.searchsorted(series.times, cutoff, side='right'))
+
+        result = [(from_epoch(self.origin), 0.0)]
+        result.extend((from_epoch(t), float(p))
+                      for t, p in zip(series.times[:count], series.cum[:count]))
+
+        if count and series.rate[count - 1] > 0 and series.times[count - 1] < cutoff:
+            result.append((from_epoch(cutoff), float(series.points_at(cutoff))))
+        return result
@@ -3,15 +3,21 @@
 """
 Durumsuz bütçe toplama sistemi
 ChangeLog.md'den zaman bilgisi okunarak doğrudan hesaplanır
+Zaman çizelgesi budget_timeline.BudgetTimeline ile bir kez kurulur, as_of sorguları ikili arama ile yanıtlanır
 """
 
-import re
 import json
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Tuple
 import sys
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "change_log"))
+from changelog_index import ChangeLogIndex, parse_changelog_text
+from budget_timeline import BudgetTimeline, parse_time, to_epoch
+from rate_table import RateTable, load_rate_table
+from budget_forecast import BudgetForecaster, DEFAULT_HORIZON_HOURS, write_forecast
+
 
 def find_project_root(start_path):
     """Proje kökünü bul (VibeCodeHPC yapısı)"""
@@ -25,205 +31,217 @@ def find_project_root(start_path):
     return None
 
 
+# Bütçe eşikleri (eşik adı: puan); grafik, özet ve tahmin (budget_forecast.py) bunları kullanır
+BUDGET_THRESHOLDS = {'minimum': 100, 'expected': 500, 'deadline': 1000}
+
+# Grafik etiketi: puan (ör: 'Minimum (100pt)')
+BUDGET_LIMITS = {f"{name.capitalize()} ({limit}pt)": limit for name, limit in BUDGET_THRESHOLDS.items()}
+
+# print_summary etiketleri
+SUMMARY_LABELS = {'minimum': 'Minimum', 'expected': 'Beklenen', 'deadline': 'Üst sınır'}
+
+
 class BudgetTracker:
-    def __init__(self, project_root: Path):
+    limits = BUDGET_THRESHOLDS  # BudgetForecaster'ın varsayılan eşikleri
+
+    def __init__(self, project_root: Path, cluster: str = None, renderer=None):
         self.project_root = Path(project_root)
+        self.cluster = cluster
+        self._renderer = renderer  # Grafik çizim servisi (render_service.RenderService; None: ilk grafikte)
         self.rates = self.load_rates()
+        self.changelog_index = None
+        self._timeline_key = None
+        self._timeline = None
         
-    def load_rates(self) -> Dict:
-        """Kaynak gruplarına göre ücret oranı ayarı"""
-# Varsayılan ayarlar (Furou TypeII)
-        rates = {
-            'cx-share': {'gpu': 1, 'rate': 0.007},
-            'cx-interactive': {'gpu': 1, 'rate': 0.007},
-            'cx-debug': {'gpu': 1, 'rate': 0.007},
-            'cx-single': {'gpu': 4, 'rate': 0.007},
-            'cx-small': {'gpu': 4, 'rate': 0.007},
-            'cx-middle': {'gpu': 4, 'rate': 0.007},
-            'cx-large': {'gpu': 4, 'rate': 0.007},
-            'cx-middle2': {'gpu': 4, 'rate': 0.014},  # 2x oran
-            'cxgfs-small': {'gpu': 4, 'rate': 0.007},
-            'cxgfs-middle': {'gpu': 4, 'rate': 0.007},
-        }
-        
-        # node_resource_groups.md'den ek bilgi yükleme (gelecekte)
-        # config_path = self.project_root / "_remote_info/flow/node_resource_groups.md"
+    @property
+    def renderer(self):
+        """Grafik çizim servisi (telemetry/render_service.py yalnızca grafik çizilirken yüklenir; varsayılan: aynı süreç)"""
+        if self._renderer is None:
+            sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "telemetry"))
+            from render_service import RenderService
+            self._renderer = RenderService()
+        return self._renderer
+    
+    def load_rates(self) -> RateTable:
+        """Kaynak gruplarına göre ücret oranı ayarı
         
-        return rates
+        _remote_info/<süper bilgisayar>/node_resource_groups.{json,yaml,yml,md} varsa oradan,
+        yoksa Furou TypeII varsayılanlarından derlenir (bkz. rate_table.py)
+        """
+        return load_rate_table(self.project_root, self.cluster)
     
     def extract_jobs(self) -> List[Dict]:
-        """Tüm ChangeLog.md dosyalarından iş bilgilerini çıkar"""
-        all_jobs = []
-        
-        for changelog in self.project_root.glob('**/ChangeLog.md'):
-            # Agent-shared hariç tutulur
-            if 'Agent-shared' in str(changelog) or '.git' in str(changelog):
-                continue
-                
-            jobs = self.parse_changelog(changelog)
-            all_jobs.extend(jobs)
-            
-        return all_jobs
+        """Tüm ChangeLog.md dosyalarından iş bilgilerini çıkar
+
+        Ortak ChangeLog dizini kullanılır; yalnızca değişen dosyalar yeniden ayrıştırılır.
+        """
+        if self.changelog_index is None:
+            self.changelog_index = ChangeLogIndex(self.project_root)
+        self.changelog_index.refresh()
+
+        # Agent-shared hariç tutulur
+        jobs = self.changelog_index.jobs(exclude=('Agent-shared',))
+        return [self.complete_job(job) for job in jobs
+                if job['job_id'] and job['resource_group']]
     
     def parse_changelog(self, changelog_path: Path) -> List[Dict]:
-        """ChangeLog.md içinden iş bilgilerini çıkar"""
-        jobs = []
-        
+        """ChangeLog.md içinden iş bilgilerini çıkar (dizini kullanmadan)"""
         try:
             with open(changelog_path, 'r', encoding='utf-8') as f:
                 content = f.read()
         except:
-            return jobs
-        
-# Her versiyon girdisi için işlem
-        version_pattern = r'### v(\d+\.\d+\.\d+)(.*?)(?=###|\Z)'
+            return []
         
-        for match in re.finditer(version_pattern, content, re.DOTALL):
-            version, section = match.groups()
-            
-# job bölümünü ara
-            job_match = re.search(r'- \[.\] \*\*job\*\*(.*?)(?=- \[.\] \*\*|\Z)', section, re.DOTALL)
-            if not job_match:
+        jobs = []
+        for record in parse_changelog_text(content):
+            job = record.get('job')
+            if not job:
                 continue
-                
-            job_section = job_match.group(1)
             
-# Gerekli alanları çıkar
             job_info = {
-                'version': version,
+                'version': record['version'],
                 'path': str(changelog_path),
-                'job_id': self.extract_field(job_section, 'id'),
-                'resource_group': self.extract_field(job_section, 'resource_group'),
-                'start_time': self.extract_field(job_section, 'start_time'),
-                'end_time': self.extract_field(job_section, 'end_time'),
-                'cancelled_time': self.extract_field(job_section, 'cancelled_time'),
-                'runtime_sec': self.extract_field(job_section, 'runtime_sec'),
-                'status': self.extract_field(job_section, 'status'),
+                'job_id': job['id'],
+                'resource_group': job['resource_group'],
+                'start_time': job['start_time'],
+                'end_time': job['end_time'],
+                'cancelled_time': job['cancelled_time'],
+                'runtime_sec': job['runtime_sec'],
+                'status': job['status'],
+                'nodes': job.get('nodes'),
             }
             
 # Yalnızca geçerli işleri ekle
             if job_info['job_id'] and job_info['resource_group']:
-                # runtime_sec yoksa hesaplansın
-                if not job_info['runtime_sec'] and job_info['start_time'] and job_info['end_time']:
-                    try:
-                        start = datetime.fromisoformat(job_info['start_time'].replace('Z', '+00:00'))
-                        end = datetime.fromisoformat(job_info['end_time'].replace('Z', '+00:00'))
-                        job_info['runtime_sec'] = str(int((end - start).total_seconds()))
-                    except:
-                        pass
-                        
-                jobs.append(job_info)
+                jobs.append(self.complete_job(job_info))
                 
         return jobs
     
-    def extract_field(self, text: str, field: str) -> str:
-        """Alan değerini çıkar"""
-        pattern = rf'- {field}:\s*`([^`]*)`'
-        match = re.search(pattern, text)
-        return match.group(1) if match else None
+    def complete_job(self, job_info: Dict) -> Dict:
+        """runtime_sec yoksa başlangıç/bitiş zamanından hesapla"""
+        if not job_info['runtime_sec'] and job_info['start_time'] and job_info['end_time']:
+            try:
+                start = datetime.fromisoformat(job_info['start_time'].replace('Z', '+00:00'))
+                end = datetime.fromisoformat(job_info['end_time'].replace('Z', '+00:00'))
+                job_info['runtime_sec'] = str(int((end - start).total_seconds()))
+            except:
+                pass
+        return job_info
     
-    def calculate_timeline(self, jobs: List[Dict], as_of: datetime = None) -> List[Tuple[datetime, float]]:
-        """Olay tabanlı bütçe tüketimini hesapla
-         
-        Args:
-            jobs: İş listesi
-            as_of: Bu zamana kadar olan veriyi hesapla (None ise şu an)
-        """
-        events = []
-        
-# Proje başlangıç zamanı
+    def load_project_start(self) -> datetime:
+        """Proje başlangıç zamanı (dosya yoksa/okunamazsa 1 saat önce)"""
         start_file = self.project_root / "Agent-shared/project_start_time.txt"
         if start_file.exists():
             try:
                 project_start = datetime.fromisoformat(
                     start_file.read_text().strip().replace('Z', '+00:00')
                 )
+                if project_start.tzinfo is None:
+                    project_start = project_start.replace(tzinfo=timezone.utc)
+                return project_start
             except:
-                project_start = datetime.now(timezone.utc) - timedelta(hours=1)
+                pass
+        return datetime.now(timezone.utc) - timedelta(hours=1)
+    
+    def job_nodes(self, job: Dict) -> int:
+        """İşin düğüm sayısı (ChangeLog params.nodes; yoksa 1)"""
+        try:
+            return max(int(job.get('nodes') or 1), 1)
+        except (TypeError, ValueError):
+            return 1
+    
+    def job_rate(self, job: Dict) -> float:
+        """İşin saniye başına puan tüketimi (tarife çarpanı hariç)"""
+        return self.rates.rate(job.get('resource_group', 'cx-small'), self.job_nodes(job))
+    
+    def job_intervals(self, job: Dict, now: float = None) -> List[Tuple[float, float, float, str]]:
+        """İşi sabit oranlı (başlangıç, bitiş, puan/saniye, kaynak grubu) aralıklarına dönüştür
+        
+        Günün saatine göre fiyatlandırılan gruplarda aralık tarife sınırlarında bölünür.
+        
+        Returns:
+            Aralık listesi; bütçeye yansımayan (pending vb.) işler için boş liste
+        """
+        start = parse_time(job.get('start_time'))
+        if start is None:
+            return []
+        
+# Bitiş zamanını belirle
+        end_time_str = job.get('end_time') or job.get('cancelled_time')
+        if end_time_str:
+            end = parse_time(end_time_str)
+            if end is None or end < start:
+                return []
+        elif job.get('status') == 'running':
+# running durumunda bitiş açık kalır, sorgu anında şimdiki zamanla sınırlanır
+            end = float('inf')
         else:
-            project_start = datetime.now(timezone.utc) - timedelta(hours=1)
+# pending veya diğer durumlarda atla
+            return []
         
-# Her işten etkinlik oluştur
+        resource_group = job.get('resource_group', 'cx-small')
+        return [(seg_start, seg_end, rate, resource_group) for seg_start, seg_end, rate
+                in self.rates.segments(start, end, resource_group, self.job_nodes(job), now)]
+    
+    def job_points(self, job: Dict, now: float = None) -> float:
+        """İşin tükettiği puan (çalışan işler şimdiki zamana kadar)"""
+        now = datetime.now(timezone.utc).timestamp() if now is None else now
+        return sum((min(end, now) - start) * rate
+                   for start, end, rate, _ in self.job_intervals(job, now) if start < now)
+
+    def version_points(self, jobs: List[Dict] = None, now: float = None) -> Dict[Tuple[str, str], float]:
+        """Sürüm başına tüketilen puan
+
+        Returns:
+            {(proje köküne göre ChangeLog yolu, sürüm): puan}; aynı sürümün birden çok işi toplanır,
+            henüz başlamamış (bütçeye yansımayan) işlerin sürümleri yer almaz
+        """
+        if jobs is None:
+            jobs = self.extract_jobs()
+        points: Dict[Tuple[str, str], float] = {}
         for job in jobs:
-            if not job.get('start_time'):
+            if not self.job_intervals(job, now):
                 continue
-                
-# Bitiş zamanını belirle
-            end_time_str = job.get('end_time') or job.get('cancelled_time')
-            if not end_time_str:
-# running durumunda mevcut zamanı kullan (pending hariç)
-                if job.get('status') == 'running':
-                    end_time_str = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-                else:
-# pending veya diğer durumlarda atla
-                    continue
-            
             try:
-                start_time = datetime.fromisoformat(job['start_time'].replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-            except:
-                continue
-            
-# Oran hesaplama
-            resource_group = job.get('resource_group', 'cx-small')
-            rate_info = self.rates.get(resource_group, {'gpu': 4, 'rate': 0.007})
-            points_per_sec = rate_info['rate'] * rate_info['gpu']
-            
-            events.append({
-                'time': start_time,
-                'type': 'start',
-                'rate': points_per_sec,
-                'job': job
-            })
-            events.append({
-                'time': end_time,
-                'type': 'end',
-                'rate': points_per_sec,
-                'job': job
-            })
-        
-# Zamanla sırala
-        events.sort(key=lambda x: x['time'])
-        
-# Zaman çizelgesi oluştur
-        timeline = [(project_start, 0.0)]
-        current_rate = 0.0
-        total_points = 0.0
-        last_time = project_start
-        
-        for event in events:
-# Önceki etkinlikten tüketimi hesapla
-            duration = (event['time'] - last_time).total_seconds()
-            if duration > 0:
-                total_points += current_rate * duration
-            
-            timeline.append((event['time'], total_points))
-            
-# Oran güncelle
-            if event['type'] == 'start':
-                current_rate += event['rate']
-            else:
-                current_rate -= event['rate']
-                
-            last_time = event['time']
-        
-        # Çalışan işler olsa bile, mevcut zaman noktasını ekleme
-            
-# Zaman çizelgesi sadece etkinliklerden (başlat/durdur) oluşur
-        return timeline
+                rel_path = Path(job['path']).relative_to(self.project_root).as_posix()
+            except ValueError:
+                rel_path = job['path']
+            key = (rel_path, job['version'])
+            points[key] = points.get(key, 0.0) + self.job_points(job, now)
+        return points
+
+    def build_timeline(self, jobs: List[Dict]) -> BudgetTimeline:
+        """İşlerden zaman çizelgesini kur (aynı iş kümesi için önbellekten döner)"""
+        project_start = to_epoch(self.load_project_start())
+        now = datetime.now(timezone.utc).timestamp()
+        # Çalışan işler tarife sınırında bölündüğünden tarife dönemi de anahtara girer
+        key = (project_start, self.rates.period_key(now), tuple(
+            (j.get('job_id'), j.get('resource_group'), j.get('start_time'), j.get('end_time'),
+             j.get('cancelled_time'), j.get('status'), j.get('nodes')) for j in jobs))
+        if key != self._timeline_key:
+            intervals = [iv for job in jobs for iv in self.job_intervals(job, now)]
+            self._timeline = BudgetTimeline(intervals, project_start)
+            self._timeline_key = key
+        return self._timeline
     
-    def generate_report(self, as_of: datetime = None) -> Dict:
-        """Rapor üretimi"""
-        jobs = self.extract_jobs()
+    def calculate_timeline(self, jobs: List[Dict], as_of: datetime = None) -> List[Tuple[datetime, float]]:
+        """Olay tabanlı bütçe tüketimini hesapla
+         
+        Args:
+            jobs: İş listesi
+            as_of: Bu zamana kadar olan veriyi hesapla (None ise şu an)
+        """
+        timeline = self.build_timeline(jobs)
+        return timeline.timeline(to_epoch(as_of) if as_of else None)
+    
+    def build_report(self, jobs: List[Dict], as_of: datetime = None) -> Tuple[Dict, List[Tuple[datetime, float]]]:
+        """Rapor sözlüğünü ve zaman çizelgesini hesapla (dosyaya yazmadan)"""
+        budget_timeline = self.build_timeline(jobs)
         timeline = self.calculate_timeline(jobs, as_of)
         
 # Mevcut toplam tüketim
         current_total = timeline[-1][1] if timeline else 0
         
-# Anlık görüntü kaydet
-        snapshot_dir = self.project_root / 'Agent-shared/budget/snapshots'
-        snapshot_dir.mkdir(parents=True, exist_ok=True)
-        
         cutoff_time = as_of if as_of else datetime.now(timezone.utc)
         timestamp = cutoff_time.strftime('%Y-%m-%dT%H-%M-%SZ')
         
@@ -231,10 +249,25 @@ class BudgetTracker:
         report = {
             'timestamp': timestamp,
             'total_points': current_total,
-            'job_count': len([j for j in jobs if j.get('start_time')]),
-            'running_jobs': len([j for j in jobs if j.get('status') == 'running']),
+            'job_count': self.count_started_jobs(jobs, as_of),
+            'running_jobs': (budget_timeline.active_count(to_epoch(as_of)) if as_of
+                             else len([j for j in jobs if j.get('status') == 'running'])),
             'timeline_points': len(timeline),
+            'by_group': budget_timeline.points_between(budget_timeline.origin, to_epoch(cutoff_time)),
+            'rate_source': self.rates.source,
         }
+        if self.rates.unknown_groups:
+            report['unknown_groups'] = sorted(self.rates.unknown_groups)
+        return report, timeline
+    
+    def generate_report(self, as_of: datetime = None) -> Dict:
+        """Rapor üretimi"""
+        jobs = self.extract_jobs()
+        report, timeline = self.build_report(jobs, as_of)
+        
+# Anlık görüntü kaydet
+        snapshot_dir = self.project_root / 'Agent-shared/budget/snapshots'
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
         
 # JSON kaydetme
         report_full = {
@@ -249,195 +282,186 @@ class BudgetTracker:
         
         return report
     
-    def visualize_budget(self, output_path: Path = None, as_of: datetime = None):
-        """Bütçe tüketim eğrisini görselleştir"""
-        try:
-            import matplotlib.pyplot as plt
-            import matplotlib.dates as mdates
-            from matplotlib import rcParams
-            import numpy as np
-            from scipy import stats
-            
+    def generate_forecast(self, horizon_hours: float = DEFAULT_HORIZON_HOURS,
+                          target: str = 'expected', now: float = None) -> Dict:
+        """Tükenme zamanı tahmini üret (snapshots/forecast.json ve budget_forecast.prom)"""
+        jobs = self.extract_jobs()
+        forecast = BudgetForecaster(self, horizon_hours=horizon_hours, target=target).forecast(jobs, now)
+        write_forecast(forecast, self.project_root / 'Agent-shared/budget/snapshots')
+        return forecast
+    
+    def count_started_jobs(self, jobs: List[Dict], as_of: datetime = None) -> int:
+        """as_of anına kadar başlamış iş sayısı"""
+        if as_of is None:
+            return len([j for j in jobs if j.get('start_time')])
+        cutoff = to_epoch(as_of)
+        return len([j for j in jobs
+                    if (parse_time(j.get('start_time')) or float('inf')) <= cutoff])
+    
+    @staticmethod
+    def create_budget_figure() -> Dict:
+        """Bütçe grafiği için Figure ve güncellenebilir sanatçıları (artist) oluştur
+        
+        Kilometre taşı modunda aynı Figure her anlık görüntü için yeniden kullanılır.
+        """
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+        from matplotlib import rcParams
+        
 # Japonca font ayarı (mevcutsa)
-            try:
-                rcParams['font.sans-serif'] = ['DejaVu Sans', 'Helvetica', 'Arial', 'sans-serif']
-            except:
-                pass
-            
-            jobs = self.extract_jobs()
-            timeline = self.calculate_timeline(jobs, as_of)
-            
-            if not timeline:
-                print("Grafiğe dönüştürülecek veri yok")
-                return
-            
-# Zaman çizelgesi verilerini grafik için düzenleme
-            times = [t[0] for t in timeline]
-            points = [t[1] for t in timeline]
-            
+        try:
+            rcParams['font.sans-serif'] = ['DejaVu Sans', 'Helvetica', 'Arial', 'sans-serif']
+        except:
+            pass
+        
 # Grafik oluşturma
-            fig, ax = plt.subplots(figsize=(14, 7))
-            
+        fig, ax = plt.subplots(figsize=(14, 7))
+        
 # Çizgi grafiği (iş çalışırken doğrusal artış)
-            ax.plot(times, points, linewidth=2, color='blue', label='Budget Usage', marker='o', markersize=4)
-            ax.fill_between(times, points, alpha=0.3, color='blue')
-            
-# Çalışan iş olup olmadığını kontrol et
-            running_jobs = [j for j in jobs if j.get('status') == 'running']
-            
+        line, = ax.plot([], [], linewidth=2, color='blue', label='Budget Usage', marker='o', markersize=4)
+        prediction, = ax.plot([], [], '--', linewidth=2, color='purple', alpha=0.7)
+        
+# Bütçe eşiği için yatay çizgi
+        colors = ['green', 'orange', 'red']
+        for (label, limit), color in zip(BUDGET_LIMITS.items(), colors):
+            ax.axhline(y=limit, color=color, linestyle='--', alpha=0.7, label=label)
+        
+# Tahmin bilgileri (sağ üst köşe) ve çalışan iş açıklaması
+        eta_text = ax.text(0.98, 0.98, '', transform=ax.transAxes,
+                           verticalalignment='top', horizontalalignment='right', fontsize=10,
+                           bbox=dict(boxstyle='round,pad=0.5', facecolor='lightgray', alpha=0.8))
+        running_note = ax.annotate('Running jobs\n(estimated)', xy=(0, 0),
+                                   xytext=(10, 10), textcoords='offset points',
+                                   bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
+                                   arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
+        
+# Eksen ayarları
+        ax.set_xlabel('Time (UTC)')
+        ax.set_ylabel('Points')
+        ax.set_title('YBH Budget Usage Timeline')
+        
+# X ekseni tarih formatı
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+        ax.xaxis.set_major_locator(mdates.AutoDateLocator())
+        ax.grid(True, alpha=0.3)
+        
+        return {'fig': fig, 'ax': ax, 'line': line, 'fill': None, 'prediction': prediction,
+                'eta_text': eta_text, 'running_note': running_note}
+    
+    @staticmethod
+    def draw_budget(artists: Dict, timeline: List[Tuple[datetime, float]],
+                    running_count: int):
+        """Zaman çizelgesini Figure üzerindeki sanatçılara uygula"""
+        import numpy as np
+        
+        ax = artists['ax']
+        
+# Zaman çizelgesi verilerini grafik için düzenleme
+        times = [t[0] for t in timeline]
+        points = [t[1] for t in timeline]
+        
+        artists['line'].set_data(times, points)
+        if artists['fill'] is not None:
+            artists['fill'].remove()
+        artists['fill'] = ax.fill_between(times, points, alpha=0.3, color='blue')
+        
+        artists['prediction'].set_data([], [])
+        artists['prediction'].set_label('_nolegend_')
+        artists['eta_text'].set_text('')
+        artists['eta_text'].set_visible(False)
+        
 # Doğrusal regresyon ile tahmin (en son veriler kullanılarak)
-            if len(times) >= 2:
+        if len(times) >= 2:
 # Zamanı sayısala dönüştürme (ilk zamandan itibaren saniye cinsinden)
-                times_numeric = [(t - times[0]).total_seconds() for t in times]
-                
+            times_numeric = np.array([(t - times[0]).total_seconds() for t in times])
+            
 # En son verilerle doğrusal regresyon (son %30 veri kullanılarak)
-                recent_start = max(0, int(len(times) * 0.7))
-                recent_times = times_numeric[recent_start:]
-                recent_points = points[recent_start:]
+            recent_start = max(0, int(len(times) * 0.7))
+            recent_times = times_numeric[recent_start:]
+            recent_points = np.array(points[recent_start:])
+            
+            if len(recent_times) >= 2 and np.ptp(recent_times) > 0:
+# Doğrusal regresyon (en küçük kareler; scipy.stats.linregress ile aynı eğim/kesişim)
+                slope, intercept = np.polyfit(recent_times, recent_points, 1)
+                
+# Tahmin çizgisi (son noktadan 1 saat sonrasına)
+                last_time = times[-1]
+                future_time = last_time + timedelta(hours=1)
+                pred_times_numeric = [(last_time - times[0]).total_seconds(),
+                                      (future_time - times[0]).total_seconds()]
+                pred_points = [slope * t + intercept for t in pred_times_numeric]
+                
+                artists['prediction'].set_data([last_time, future_time], pred_points)
+                artists['prediction'].set_label(f'Prediction (rate: {slope*3600:.1f} pt/hr)')
                 
-                if len(recent_times) >= 2:
-# Doğrusal regresyon
-                    slope, intercept, r_value, p_value, std_err = stats.linregress(recent_times, recent_points)
-                    
-# Şimdiki zaman ayarı
-                    current_time = as_of or datetime.now(timezone.utc)
-                    
-# Çalışan iş varsa mevcut oranı dikkate al
-                    if running_jobs:
-# Son olaydan şu ana kadar çalışma
-                        last_time = times[-1]
-                        
-# Şu an çalışan oranı hesaplama
-                        current_rate = 0
-                        for job in running_jobs:
-                            resource_group = job.get('resource_group', 'cx-small')
-                            rate_info = self.rates.get(resource_group, {'gpu': 4, 'rate': 0.007})
-                            current_rate += rate_info['rate'] * rate_info['gpu']
-                        
-# Çalışan işlere göre şu ana kadar tahmini değer
-                        duration = (current_time - last_time).total_seconds()
-                        estimated_current = points[-1] + current_rate * duration
-                        
-# Tahmin çizgisi oluşturma (doğrusal regresyon kullanılarak, son noktadan)
-                        future_time = last_time + timedelta(hours=1)
-                        
-# Tahmin için zaman noktalarını sayısala dönüştürme
-                        pred_times = [last_time, future_time]
-                        pred_times_numeric = [
-                            (last_time - times[0]).total_seconds(),
-                            (future_time - times[0]).total_seconds()
-                        ]
-# Doğrusal regresyona dayalı tahmin değerleri
-                        pred_points = [slope * t + intercept for t in pred_times_numeric]
-                    else:
-                        # Çalışan bir iş olmadığında bile doğrusal regresyon kullanılır
-                        last_time = times[-1]
-                        future_time = last_time + timedelta(hours=1)
-                        
-# Tahmin için zaman noktalarını sayısala dönüştürme
-                        pred_times = [last_time, future_time]
-                        pred_times_numeric = [
-                            (last_time - times[0]).total_seconds(),
-                            (future_time - times[0]).total_seconds()
-                        ]
-# Doğrusal regresyona dayalı tahmin değerleri
-                        pred_points = [slope * t + intercept for t in pred_times_numeric]
-                        
-# Çalışan iş olmadığından tahmini değer son nokta
-                        estimated_current = points[-1]
-                    
-# Tahmin çizgisini çiz (doğrusal regresyon sonucu kullanılarak)
-                    ax.plot(pred_times, pred_points, '--', linewidth=2, color='purple', 
-                           label=f'Prediction (rate: {slope*3600:.1f} pt/hr)', alpha=0.7)
-                    
-# Eşik değere ulaşma zamanının hesaplanması
-                    budget_limits = {
-                        'Minimum (100pt)': 100,
-                        'Expected (500pt)': 500,
-                        'Deadline (1000pt)': 1000
-                    }
-                    
-# Mevcut nokta (çalışan iş varsa tahmini değer)
-                    if running_jobs:
-                        current_points = estimated_current
-                    else:
-                        current_points = points[-1]
-                    
 # Her eşik değere ulaşma tahmini
-                    predictions_text = []
-                    for label, limit in budget_limits.items():
-                        if current_points < limit and slope > 0:
-# Doğrusal regresyona dayalı tahmin
+                current_points = points[-1]
+                predictions_text = []
+                for label, limit in BUDGET_LIMITS.items():
+                    if current_points < limit and slope > 0:
 # Ulaşana kadar geçen saniye sayısı
-                            seconds_to_limit = (limit - intercept) / slope
-# Ulaşma zamanı
-                            eta = times[0] + timedelta(seconds=seconds_to_limit)
+                        seconds_to_limit = (limit - intercept) / slope
+                        eta = times[0] + timedelta(seconds=seconds_to_limit)
 # Son veri noktasından geçen süre
-                            hours_from_last = (eta - times[-1]).total_seconds() / 3600
-                            if hours_from_last > 0:
-                                predictions_text.append(f"{label}: {eta.strftime('%m-%d %H:%M')} (+{hours_from_last:.1f}h from last data)")
-                    
-# Tahmin bilgilerini grafiğe ekle (sağ üst köşeye yerleştir)
-                    if predictions_text:
-                        prediction_str = "ETA:\n" + "\n".join(predictions_text)
-                        ax.text(0.98, 0.98, prediction_str, transform=ax.transAxes,
-                               verticalalignment='top', horizontalalignment='right', fontsize=10,
-                               bbox=dict(boxstyle='round,pad=0.5', facecolor='lightgray', alpha=0.8))
-            
-# Bütçe eşiği için yatay çizgi
-            budget_limits = {
-                'Minimum (100pt)': 100,
-                'Expected (500pt)': 500,
-                'Deadline (1000pt)': 1000
-            }
-            
-            colors = ['green', 'orange', 'red']
-            for (label, limit), color in zip(budget_limits.items(), colors):
-                ax.axhline(y=limit, color=color, linestyle='--', alpha=0.7, label=label)
-            
-# Çalışan iş varsa açıklama
-            running_jobs = [j for j in jobs if j.get('status') == 'running']
-            if running_jobs:
-# Son noktaya açıklama ekle
-                ax.annotate('Running jobs\n(estimated)', 
-                           xy=(times[-1], points[-1]),
-                           xytext=(10, 10), textcoords='offset points',
-                           bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.5),
-                           arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0'))
-            
-# Eksen ayarları
-            ax.set_xlabel('Time (UTC)')
-            ax.set_ylabel('Points')
-            ax.set_title('YBH Budget Usage Timeline')
-            
-# X ekseni tarih formatı
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-            ax.xaxis.set_major_locator(mdates.AutoDateLocator())
-            fig.autofmt_xdate()  # Tarih etiketlerini eğimli yap
+                        hours_from_last = (eta - times[-1]).total_seconds() / 3600
+                        if hours_from_last > 0:
+                            predictions_text.append(f"{label}: {eta.strftime('%m-%d %H:%M')} (+{hours_from_last:.1f}h from last data)")
+                
+                if predictions_text:
+                    artists['eta_text'].set_text("ETA:\n" + "\n".join(predictions_text))
+                    artists['eta_text'].set_visible(True)
+        
+# Çalışan iş varsa son noktaya açıklama
+        artists['running_note'].set_visible(bool(running_count) and bool(times))
+        if running_count and times:
+            artists['running_note'].xy = (times[-1], points[-1])
+        
+# Eksen aralığı ve açıklama yeniden hesaplanır
+        # (önceki çizimdeki set_ylim y ekseninin otomatik ölçeğini kapatır; yeniden kullanımda açılır)
+        ax.set_autoscaley_on(True)
+        ax.relim()
+        ax.autoscale_view()
+        ax.set_ylim(bottom=0)
+        ax.legend(loc='upper left')
+    
+    @staticmethod
+    def save_budget_figure(artists: Dict, output_path: Path):
+        """Figure'ü kaydet (kapatmadan)"""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fig = artists['fig']
+        fig.autofmt_xdate()  # Tarih etiketlerini eğimli yap
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=100, bbox_inches='tight')
+    
+    def visualize_budget(self, output_path: Path = None, as_of: datetime = None):
+        """Bütçe tüketim eğrisini görselleştir"""
+        try:
+            import matplotlib
             
-# Izgara ve açıklama
-            ax.grid(True, alpha=0.3)
-            ax.legend(loc='upper left')
+            jobs = self.extract_jobs()
+            report, timeline = self.build_report(jobs, as_of)
             
-# Y eksenini 0'dan başlat
-            ax.set_ylim(bottom=0)
+            if not timeline:
+                print("Grafiğe dönüştürülecek veri yok")
+                return
             
 # Çıktı hedefini belirle
             if output_path is None:
                 output_path = self.project_root / "User-shared" / "visualizations" / "budget_usage.png"
             
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-# Kaydet
-            plt.tight_layout()
-            plt.savefig(output_path, dpi=100, bbox_inches='tight')
-            plt.close()
+            # Çizim servisinde (kalıcı süreçte Figure ve sanatçılar yeniden kullanılır)
+            spec = {'output': str(output_path), 'timeline': timeline,
+                    'running_count': report['running_jobs']}
+            if self.renderer.render(render_budget_graph, spec) is None:
+                return
             
             print(f"Grafik kaydedildi: {output_path}")
             
             # Çalışan işlerin uyarısı
-            if running_jobs:
-                print(f"Not: {len(running_jobs)} adet çalışan iş içerdiği için grafiğin sağ uç değerleri tahminidir")
+            if report['running_jobs']:
+                print(f"Not: {report['running_jobs']} adet çalışan iş içerdiği için grafiğin sağ uç değerleri tahminidir")
             
         except ImportError:
             print("ERROR: matplotlib kurulu değil")
@@ -445,13 +469,66 @@ class BudgetTracker:
         except Exception as e:
             print(f"Grafik oluşturma hatası: {e}")
     
+    def generate_milestones(self, minutes: List[int], graph_dir: Path = None) -> List[Dict]:
+        """Kilometre taşı anlık görüntüleri ve grafiklerini tek çalıştırmada üret
+        
+        ChangeLog'lar bir kez okunur, zaman çizelgesi bir kez kurulur ve tüm grafikler
+        aynı Figure üzerinde sanatçılar güncellenerek çizilir.
+        
+        Args:
+            minutes: Proje başlangıcından itibaren dakika listesi (ör: [30, 60, 90, 120, 180])
+            graph_dir: PNG çıktı dizini (varsayılan: User-shared/visualizations)
+        
+        Returns:
+            Üretilen kilometre taşı raporlarının listesi
+        """
+        import matplotlib.pyplot as plt
+        
+        jobs = self.extract_jobs()
+        project_start = self.load_project_start()
+        now = datetime.now(timezone.utc)
+        
+        graph_dir = graph_dir or self.project_root / "User-shared" / "visualizations"
+        snapshot_dir = self.project_root / 'Agent-shared/budget/snapshots'
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+        
+        reports = []
+        artists = self.create_budget_figure()
+        try:
+            for minute in minutes:
+                as_of = project_start + timedelta(minutes=minute)
+                if as_of > now:
+                    print(f"{minute} dakika kilometre taşına henüz ulaşılmadı, atlanıyor")
+                    continue
+                
+                report, timeline = self.build_report(jobs, as_of)
+                report['milestone_min'] = minute
+                
+                output_path = graph_dir / f"budget_usage_{minute}min.png"
+                self.draw_budget(artists, timeline, report['running_jobs'])
+                self.save_budget_figure(artists, output_path)
+                
+                report_path = snapshot_dir / f"milestone_{minute}min.json"
+                with open(report_path, 'w') as f:
+                    json.dump(report, f, indent=2, default=str)
+                
+                print(f"{minute}min: {report['total_points']:.1f} puan → {output_path.name}, {report_path.name}")
+                reports.append(report)
+        finally:
+            plt.close(artists['fig'])
+        
+        return reports
+    
     def print_summary(self, as_of: datetime = None):
         """Basit özet gösterimi"""
         jobs = self.extract_jobs()
         timeline = self.calculate_timeline(jobs, as_of)
         
         total = timeline[-1][1] if timeline else 0
-        running = len([j for j in jobs if j.get('status') == 'running'])
+        if as_of:
+            running = self.build_timeline(jobs).active_count(to_epoch(as_of))
+        else:
+            running = len([j for j in jobs if j.get('status') == 'running'])
         completed = len([j for j in jobs if j.get('status') == 'completed'])
         
         print(f"=== Bütçe Toplama Özeti ===")
@@ -459,15 +536,44 @@ class BudgetTracker:
         print(f"İş sayısı: tamamlanan={completed}, çalışan={running}")
         
         # Bütçeye oran (varsayılan değer)
-        budget_limits = {'Minimum': 100, 'Beklenen': 500, 'Üst sınır': 1000}
-        for label, limit in budget_limits.items():
+        for name, limit in BUDGET_THRESHOLDS.items():
             percentage = (total / limit * 100) if limit > 0 else 0
-            print(f"{label}: {percentage:.1f}%")
+            print(f"{SUMMARY_LABELS.get(name, name)}: {percentage:.1f}%")
         
         if running > 0:
             print(f"Not: {running} adet çalışan iş için değerler mevcut zamana kadar tahmindir")
 
 
+_BUDGET_ARTISTS = None  # Süreç başına yeniden kullanılan bütçe Figure'ü
+
+
+def render_budget_graph(spec: Dict) -> Path:
+    """Bütçe tüketim grafiği; çizim servisi işi (Figure süreç içinde yeniden kullanılır)"""
+    global _BUDGET_ARTISTS
+    if _BUDGET_ARTISTS is None:
+        _BUDGET_ARTISTS = BudgetTracker.create_budget_figure()
+    BudgetTracker.draw_budget(_BUDGET_ARTISTS, spec['timeline'], spec['running_count'])
+    output_path = Path(spec['output'])
+    BudgetTracker.save_budget_figure(_BUDGET_ARTISTS, output_path)
+    return output_path
+
+
+def print_forecast(forecast: Dict):
+    """Tahmin özetini yazdır"""
+    print(f"Mevcut tüketim: {forecast['current_points']:.1f} puan "
+          f"(canlı oran {forecast['live_rate_per_hour']:.1f} puan/saat, "
+          f"trend {forecast['trend_rate_per_hour']:.1f} puan/saat)")
+    print(f"Çalışan iş: {forecast['running_jobs']}, bekleyen iş: {forecast['pending_jobs']}, "
+          f"taahhüt edilen: {forecast['committed_points']:.1f} puan")
+    for name, entry in forecast['limits'].items():
+        etas = ', '.join(f"{scenario}={entry[f'eta_{scenario}'] or '-'}"
+                         for scenario in ('committed', 'live', 'trend'))
+        print(f"{name} ({entry['limit']}pt): {etas}")
+    hints = forecast['hints']
+    print(f"Öneri: {hints['status']} (hedef {hints['target_limit']}, "
+          f"kalan pay {hints['headroom_points']:.1f} puan)")
+
+
 def main():
     import argparse
     
@@ -476,8 +582,18 @@ def main():
     parser.add_argument('--report', action='store_true', help='Ayrıntılı rapor oluştur')
     parser.add_argument('--json', action='store_true', help='JSON formatında çıktı ver')
     parser.add_argument('--graph', action='store_true', help='Bütçe tüketim grafiği oluştur (önerilmez: varsayılan olarak oluşturulur)')
-    parser.add_argument('--output', type=str, help='Grafik çıktı yolu')
+    parser.add_argument('--output', type=str, help='Grafik çıktı yolu (--milestones ile: çıktı dizini)')
     parser.add_argument('--as-of', type=str, help='Belirtilen zamana kadar olan verileri göster (YYYY-MM-DDTHH:MM:SSZ)')
+    parser.add_argument('--cluster', type=str,
+                        help='Ücret tablosu için _remote_info altındaki süper bilgisayar dizini (ör: flow)')
+    parser.add_argument('--milestones', type=str,
+                        help='Kilometre taşı anlık görüntülerini tek çalıştırmada üret (dakika, ör: 30,60,90,120,180)')
+    parser.add_argument('--forecast', action='store_true',
+                        help='Bütçe tükenme zamanı tahmini (forecast.json + Prometheus textfile)')
+    parser.add_argument('--horizon', type=float, default=DEFAULT_HORIZON_HOURS,
+                        help='--forecast önerileri için planlama ufku (saat)')
+    parser.add_argument('--target', choices=list(BUDGET_THRESHOLDS), default='expected',
+                        help='--forecast kısma önerisinin hedef eşiği')
     
     args = parser.parse_args()
     
@@ -487,7 +603,7 @@ def main():
         print("ERROR: Proje kökü bulunamadı", file=sys.stderr)
         sys.exit(1)
     
-    tracker = BudgetTracker(project_root)
+    tracker = BudgetTracker(project_root, args.cluster)
     
     # --as-of parametresinin analizi
     as_of = None
@@ -504,7 +620,23 @@ def main():
             print("Doğru biçim: YYYY-MM-DDTHH:MM:SSZ (ör.: 2025-08-20T01:00:00Z)")
             sys.exit(1)
     
-    if args.summary:
+    if args.milestones:
+        try:
+            minutes = [int(m) for m in args.milestones.split(',') if m.strip()]
+        except ValueError:
+            print(f"ERROR: --milestones biçimi geçersiz: {args.milestones}")
+            print("Doğru biçim: virgülle ayrılmış dakikalar (ör.: 30,60,90,120,180)")
+            sys.exit(1)
+        graph_dir = Path(args.output) if args.output else None
+        reports = tracker.generate_milestones(minutes, graph_dir)
+        print(f"{len(reports)} kilometre taşı anlık görüntüsü oluşturuldu")
+    elif args.forecast:
+        forecast = tracker.generate_forecast(args.horizon, args.target)
+        if args.json:
+            print(json.dumps(forecast, indent=2))
+        else:
+            print_forecast(forecast)
+    elif args.summary:
         tracker.print_summary(as_of)
     elif args.json:
         report = tracker.generate_report(as_of)
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kaynak grubu ücret tabloları
+_remote_info/<süper bilgisayar>/node_resource_groups.{json,yaml,yml,md} dosyalarından yüklenir
+
+Desteklenenler:
+- GPU başına / düğüm başına ücretlendirme (charge: gpu | node)
+- Düğüm sayısı çarpanı (ChangeLog'daki nodes parametresi)
+- Günün saatine göre fiyatlandırma (time_of_day; yalnızca JSON/YAML)
+
+Tablo bir kez derlenir: grup adı → indeks, puan/saniye dizisi ve tarife kırılma noktaları.
+Zaman çizelgesi kurulurken iş başına yalnızca bir sözlük araması yapılır.
+
+JSON/YAML biçimi:
+    {
+      "cluster": "flow-typeII",
+      "default_group": "cx-small",          # bilinmeyen gruplar için (isteğe bağlı)
+      "timezone": "+09:00",                 # time_of_day saatlerinin yorumlandığı dilim
+      "groups": {
+        "cx-small": {"rate": 0.007, "gpus_per_node": 4, "charge": "gpu"},
+        "cx-middle2": {"rate": 0.014, "gpus_per_node": 4},
+        "cx-night": {"rate": 0.007, "gpus_per_node": 4,
+                     "time_of_day": [{"start": "09:00", "end": "18:00", "multiplier": 1.0},
+                                     {"start": "18:00", "end": "09:00", "multiplier": 0.5}]}
+      }
+    }
+
+Markdown biçimi: başlık satırında "Kaynak grubu" / "Ücret oranı" (veya "rate") /
+"GPU" / "Ücretlendirme" (veya "charge") sütunları bulunan tablo
+"""
+
+import re
+import sys
+import json
+import math
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+DAY_SEC = 86400
+RATE_FILE_STEM = "node_resource_groups"
+RATE_FILE_SUFFIXES = ('.json', '.yaml', '.yml', '.md')
+
+# Varsayılan ayarlar (Furou TypeII)
+DEFAULT_GROUPS = {
+    'cx-share': {'gpus_per_node': 1, 'rate': 0.007},
+    'cx-interactive': {'gpus_per_node': 1, 'rate': 0.007},
+    'cx-debug': {'gpus_per_node': 1, 'rate': 0.007},
+    'cx-single': {'gpus_per_node': 4, 'rate': 0.007},
+    'cx-small': {'gpus_per_node': 4, 'rate': 0.007},
+    'cx-middle': {'gpus_per_node': 4, 'rate': 0.007},
+    'cx-large': {'gpus_per_node': 4, 'rate': 0.007},
+    'cx-middle2': {'gpus_per_node': 4, 'rate': 0.014},  # 2x oran
+    'cxgfs-small': {'gpus_per_node': 4, 'rate': 0.007},
+    'cxgfs-middle': {'gpus_per_node': 4, 'rate': 0.007},
+}
+FALLBACK_GROUP = {'gpus_per_node': 4, 'rate': 0.007}
+
+
+def _parse_clock(value: str) -> int:
+    """"HH:MM" → gün içi saniye"""
+    hours, minutes = str(value).split(':')[:2]
+    return (int(hours) * 3600 + int(minutes) * 60) % DAY_SEC
+
+
+def _parse_utc_offset(value) -> int:
+    """"+09:00" / 9 → saniye"""
+    if value is None:
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value * 3600)
+    match = re.match(r'^(?:UTC)?([+-])(\d{1,2}):?(\d{2})?$', str(value).strip())
+    if not match:
+        return 0
+    sign = -1 if match.group(1) == '-' else 1
+    return sign * (int(match.group(2)) * 3600 + int(match.group(3) or 0) * 60)
+
+
+def _compile_time_of_day(windows: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """Tarife pencerelerini gün içi kırılma noktaları ve çarpanlara dönüştür
+
+    Tanımlanmayan saatlerin çarpanı 1.0'dır.
+
+    Returns:
+        (kırılma noktaları [0 ile başlar], her aralığın çarpanı)
+    """
+    cuts = {0}
+    spans = []
+    for window in windows:
+        start = _parse_clock(window['start'])
+        end = _parse_clock(window['end'])
+        multiplier = float(window.get('multiplier', 1.0))
+        # Gece yarısını geçen pencere iki parçaya bölünür
+        parts = [(start, end)] if start < end else [(start, DAY_SEC), (0, end)]
+        for a, b in parts:
+            cuts.update((a, b % DAY_SEC))
+            spans.append((a, b, multiplier))
+
+    breakpoints = np.array(sorted(cuts), dtype=float)
+    multipliers = np.ones(len(breakpoints))
+    for a, b, multiplier in spans:
+        multipliers[(breakpoints >= a) & (breakpoints < (b if b > a else DAY_SEC))] = multiplier
+    return breakpoints, multipliers
+
+
+class RateTable:
+    """Derlenmiş kaynak grubu ücret tablosu"""
+
+    def __init__(self, groups: Dict[str, Dict], default_group: Optional[str] = None,
+                 utc_offset: int = 0, source: str = 'default'):
+        """
+        Args:
+            groups: Grup adı → {'rate', 'gpus_per_node', 'charge', 'time_of_day'}
+            default_group: Bilinmeyen gruplar için kullanılacak grup
+            utc_offset: time_of_day saatlerinin UTC farkı (saniye)
+            source: Tablonun kaynağı (rapor/uyarı için)
+        """
+        self.source = source
+        self.utc_offset = utc_offset
+        self.names = list(groups)
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+        # Düğüm başına puan/saniye (gpu ücretlendirmesinde GPU sayısı dahil)
+        self.node_rate = np.array([
+            float(g['rate']) * (float(g.get('gpus_per_node', 1)) if g.get('charge', 'gpu') == 'gpu' else 1.0)
+            for g in groups.values()])
+        self.tariffs: Dict[int, Tuple[np.ndarray, np.ndarray]] = {
+            self.index[name]: _compile_time_of_day(g['time_of_day'])
+            for name, g in groups.items() if g.get('time_of_day')}
+
+        self.default_index = self.index.get(default_group) if default_group else None
+        self.unknown_groups = set()
+        self._fallback_rate = FALLBACK_GROUP['rate'] * FALLBACK_GROUP['gpus_per_node']
+
+    @property
+    def has_time_of_day(self) -> bool:
+        return bool(self.tariffs)
+
+    def lookup(self, group: str) -> Optional[int]:
+        """Grup indeksini bul (bilinmiyorsa default_group; o da yoksa None)"""
+        index = self.index.get(group)
+        if index is None:
+            if group not in self.unknown_groups:
+                self.unknown_groups.add(group)
+                fallback = (self.names[self.default_index] if self.default_index is not None
+                            else f"{FALLBACK_GROUP['gpus_per_node']}GPU x {FALLBACK_GROUP['rate']}")
+                print(f"UYARI: '{group}' kaynak grubu ücret tablosunda yok ({self.source}), "
+                      f"{fallback} ile hesaplanıyor", file=sys.stderr)
+            index = self.default_index
+        return index
+
+    def rate(self, group: str, nodes: int = 1) -> float:
+        """Tarife çarpanı olmadan saniye başına puan"""
+        index = self.lookup(group)
+        base = self.node_rate[index] if index is not None else self._fallback_rate
+        return float(base) * max(nodes, 1)
+
+    def segments(self, start: float, end: float, group: str, nodes: int = 1,
+                 now: Optional[float] = None) -> List[Tuple[float, float, float]]:
+        """İş aralığını sabit oranlı parçalara böl (tarife sınırlarında)
+
+        Args:
+            start, end: Epoch saniyesi; end=inf ise (çalışan iş) son parça açık kalır
+            now: Açık aralıkların hangi tarife sınırına kadar bölüneceği
+
+        Returns:
+            (başlangıç, bitiş, puan/saniye) listesi
+        """
+        index = self.lookup(group)
+        base = (self.node_rate[index] if index is not None else self._fallback_rate) * max(nodes, 1)
+        tariff = self.tariffs.get(index)
+        if tariff is None:
+            return [(start, end, float(base))]
+
+        breakpoints, multipliers = tariff
+        split_end = end if math.isfinite(end) else max(start, now if now is not None else start)
+
+        # Aralığı kapsayan günlerin tüm kırılma noktaları (yerel saat)
+        first_day = math.floor((start + self.utc_offset) / DAY_SEC)
+        last_day = math.floor((split_end + self.utc_offset) / DAY_SEC)
+        days = np.arange(first_day, last_day + 1) * DAY_SEC - self.utc_offset
+        cuts = (days[:, None] + breakpoints[None, :]).ravel()
+        cuts = cuts[(cuts > start) & (cuts < end) & (cuts <= split_end)]
+        bounds = np.concatenate([[start], cuts, [end]])
+
+        local = (bounds[:-1] + self.utc_offset) % DAY_SEC
+        factor = multipliers[np.searchsorted(breakpoints, local, side='right') - 1]
+        return [(float(a), float(b), float(base * f))
+                for a, b, f in zip(bounds[:-1], bounds[1:], factor) if b > a]
+
+    def period_key(self, now: float) -> float:
+        """Şu anki tarife döneminin başlangıcı (açık aralıkların önbellek anahtarı için)"""
+        if not self.tariffs:
+            return 0.0
+        local = (now + self.utc_offset) % DAY_SEC
+        day_start = now - local
+        starts = [day_start + bp[np.searchsorted(bp, local, side='right') - 1]
+                  for bp, _ in self.tariffs.values()]
+        return max(starts)
+
+
+def _parse_markdown_table(text: str) -> Dict[str, Dict]:
+    """Markdown tablosundan grup tanımlarını çıkar"""
+    groups = {}
+    header = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line.startswith('|'):
+            header = None
+            continue
+        cells = [c.strip().strip('`*') for c in line.strip('|').split('|')]
+        if all(re.fullmatch(r':?-+:?', c) for c in cells if c):
+            continue
+        if header is None:
+            header = [c.lower() for c in cells]
+            continue
+
+        def column(*keywords):
+            for i, name in enumerate(header):
+                if any(k in name for k in keywords) and i < len(cells):
+                    return cells[i]
+            return None
+
+        name = column('kaynak grubu', 'resource group', 'resource_group', 'rscgrp') or cells[0]
+        rate = column('oran', 'rate', 'puan/s', 'point')
+        if not name or rate is None:
+            continue
+        rate_match = re.search(r'[\d.]+', rate)
+        if not rate_match:
+            continue
+        group = {'rate': float(rate_match.group(0))}
+        gpus = column('gpu')
+        if gpus and re.search(r'\d+', gpus):
+            group['gpus_per_node'] = int(re.search(r'\d+', gpus).group(0))
+        charge = column('ücretlendirme', 'charge', 'birim')
+        if charge:
+            group['charge'] = 'node' if ('node' in charge.lower() or 'düğüm' in charge.lower()) else 'gpu'
+        groups[name] = group
+    return groups
+
+
+def load_rate_file(path: Path) -> Optional[Dict]:
+    """Tek bir tablo dosyasını sözlüğe yükle
+
+    Raises:
+        ValueError: JSON/YAML sözdizimi hatası (yaml.YAMLError da ValueError olarak iletilir)
+    """
+    try:
+        text = path.read_text(encoding='utf-8')
+    except OSError:
+        return None
+
+    if path.suffix == '.json':
+        return json.loads(text)
+    if path.suffix in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            print(f"UYARI: PyYAML kurulu değil, {path} atlanıyor (pip install pyyaml)", file=sys.stderr)
+            return None
+        try:
+            return yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"YAML sözdizimi hatası: {e}") from e
+    groups = _parse_markdown_table(text)
+    return {'groups': groups} if groups else None
+
+
+def find_rate_file(project_root: Path, cluster: Optional[str] = None) -> Optional[Path]:
+    """_remote_info altındaki ücret tablosu dosyasını bul
+
+    cluster belirtilmezse tablo dosyası olan ilk süper bilgisayar dizini (ada göre) kullanılır;
+    birden fazla varsa hangisinin seçildiği uyarı olarak yazılır (--cluster ile seçilmelidir).
+    JSON/YAML, Markdown'a tercih edilir.
+    """
+    remote_info = Path(project_root) / "_remote_info"
+    if not remote_info.is_dir():
+        return None
+    dirs = [remote_info / cluster] if cluster else sorted(d for d in remote_info.iterdir() if d.is_dir())
+    found = []
+    for directory in dirs:
+        for suffix in RATE_FILE_SUFFIXES:
+            path = directory / f"{RATE_FILE_STEM}{suffix}"
+            if path.exists():
+                found.append(path)
+                break
+    if len(found) > 1:
+        print(f"UYARI: Birden fazla süper bilgisayarın ücret tablosu var "
+              f"({', '.join(p.parent.name for p in found)}); {found[0].relative_to(project_root)} "
+              f"kullanılıyor. Başkası için --cluster <ad> verin", file=sys.stderr)
+    return found[0] if found else None
+
+
+def load_rate_table(project_root: Path, cluster: Optional[str] = None) -> RateTable:
+    """Ücret tablosunu yükle ve derle
+
+    Dosya bulunamazsa ya da okunamıyor/geçersizse (eksik 'rate', hatalı time_of_day saati,
+    JSON/YAML sözdizimi hatası) uyarı yazılır ve Furou TypeII varsayılanları kullanılır.
+    """
+    path = find_rate_file(project_root, cluster)
+    if path is not None:
+        try:
+            data = load_rate_file(path)
+            if data and data.get('groups'):
+                return RateTable(data['groups'], default_group=data.get('default_group'),
+                                 utc_offset=_parse_utc_offset(data.get('timezone')),
+                                 source=str(path.relative_to(project_root)))
+        except (KeyError, ValueError, TypeError, AttributeError) as e:
+            print(f"UYARI: Ücret tablosu okunamadı ({path}): {type(e).__name__}: {e}; "
+                  f"varsayılan gruplar kullanılıyor", file=sys.stderr)
+    return RateTable(DEFAULT_GROUPS)
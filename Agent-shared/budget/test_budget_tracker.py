@@ -7,8 +7,9 @@ Dummy ChangeLog.md oluşturarak bütçe toplama işlemini doğrulama
 
 import os
 import sys
+import json
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import tempfile
 import shutil
 
@@ -32,6 +33,7 @@ if not project_root:
 # budget_tracker'ı içe aktarın
 sys.path.insert(0, str(project_root / "Agent-shared" / "budget"))
 from budget_tracker import BudgetTracker
+from budget_forecast import BudgetForecaster, format_prometheus
 
 def create_test_changelog(temp_dir, pg_name, jobs):
     """Test için ChangeLog.md oluştur"""
@@ -216,6 +218,81 @@ def run_test():
             print(f"  - Grafik dosya boyutu: {graph_path.stat().st_size} bytes")
         else:
             print(f"  - Grafik oluşturma başarısız")
+        
+        # Test senaryosu 7: as_of sorgusu ve kaynak grubu dağılımı
+        print("\n[Test7] as_of sorgusu")
+        print("-" * 40)
+        
+        # job1 başladıktan 10 dakika sonra (job2 henüz başlamadı)
+        as_of = (job1_start + timedelta(minutes=10)).replace(tzinfo=timezone.utc)
+        timeline = tracker.calculate_timeline(jobs, as_of)
+        print(f"as_of tüketimi: {timeline[-1][1]:.2f}")
+        print(f"Beklenen değer: {0.028 * 600:.2f} (cx-small: 0.028/sec x 600sec)")
+        
+        budget_timeline = tracker.build_timeline(jobs)
+        by_group = budget_timeline.points_between(budget_timeline.origin, job2_end.replace(tzinfo=timezone.utc).timestamp())
+        print(f"Kaynak grubu başına (job2 bitişine kadar): {', '.join(f'{g}={p:.2f}' for g, p in by_group.items())}")
+        print(f"Beklenen değer: cx-middle=42.00, cx-small=50.40")
+        
+        # Test senaryosu 8: Kilometre taşı toplu modu
+        print("\n[Test8] Kilometre taşı toplu modu")
+        print("-" * 40)
+        
+        reports = tracker.generate_milestones([30, 60, 90], temp_path / "milestones")
+        for report in reports:
+            png = temp_path / "milestones" / f"budget_usage_{report['milestone_min']}min.png"
+            print(f"  - {report['milestone_min']}min: {report['total_points']:.2f} puan, "
+                  f"grafik: {'✅' if png.exists() else '❌'}")
+        print(f"Beklenen değer: 30min=42.00, 60min=92.40, 90min=92.40")
+        
+        # Test senaryosu 9: _remote_info ücret tablosu (düğüm başına ücretlendirme)
+        print("\n[Test9] Ücret tablosu")
+        print("-" * 40)
+        
+        rate_dir = temp_path / "_remote_info" / "testcluster"
+        rate_dir.mkdir(parents=True)
+        (rate_dir / "node_resource_groups.json").write_text(json.dumps({
+            'default_group': 'cx-small',
+            'groups': {
+                'cx-small': {'rate': 0.007, 'gpus_per_node': 4},
+                'cx-middle': {'rate': 0.01, 'charge': 'node'},
+            }
+        }))
+        
+        tracker = BudgetTracker(temp_path)
+        jobs = tracker.extract_jobs()
+        by_group = tracker.build_timeline(jobs).points_between(
+            tracker.build_timeline(jobs).origin, job2_end.replace(tzinfo=timezone.utc).timestamp())
+        print(f"Tablo: {tracker.rates.source}")
+        print(f"cx-middle (düğüm başına): {by_group['cx-middle']:.2f}")
+        print(f"Beklenen değer: {0.01 * 1500:.2f} (0.01/sec x 1 düğüm x 1500sec)")
+        print(f"cx-share (tabloda yok → default_group): {tracker.job_rate({'resource_group': 'cx-share'}):.3f}/sec")
+        
+        # Test senaryosu 10: Tükenme zamanı tahmini (çalışan + bekleyen işler)
+        print("\n[Test10] Tükenme zamanı tahmini")
+        print("-" * 40)
+        
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        fmt = lambda t: t.strftime('%Y-%m-%dT%H:%M:%SZ')
+        forecast_jobs = [
+            # Geçmiş iş: PG9.1 için beklenen süre 1800sec
+            {'job_id': 'f1', 'path': 'PG9.1/ChangeLog.md', 'resource_group': 'cx-small', 'status': 'completed',
+             'start_time': fmt(now - timedelta(hours=3)), 'end_time': fmt(now - timedelta(hours=3) + timedelta(seconds=1800))},
+            # 600sec önce başladı → kalan 1200sec
+            {'job_id': 'f2', 'path': 'PG9.1/ChangeLog.md', 'resource_group': 'cx-small', 'status': 'running',
+             'start_time': fmt(now - timedelta(seconds=600))},
+            # Kuyrukta: şimdi başlayıp 1800sec sürecek varsayılır
+            {'job_id': 'f3', 'path': 'PG9.1/ChangeLog.md', 'resource_group': 'cx-small', 'status': 'pending'},
+        ]
+        forecast = BudgetForecaster(tracker, target='minimum').forecast(forecast_jobs, now.timestamp())
+        print(f"Mevcut: {forecast['current_points']:.2f}, taahhüt edilen: {forecast['committed_points']:.2f}")
+        print(f"Beklenen değer: 67.20, 151.20 (0.028/sec x (1800+600) ve + 0.028 x (1200+1800))")
+        minimum = forecast['limits']['minimum']
+        print(f"minimum ETA (live): {minimum['hours_live']:.3f} saat, beklenen değer: {(100 - 67.2) / 100.8:.3f}")
+        print(f"Öneri (hedef minimum): {forecast['hints']['status']} (beklenen: stop, taahhüt edilen işler eşiği aşıyor)")
+        prom = format_prometheus(forecast)
+        eta_line = [l for l in prom.splitlines() if 'limit="minimum",scenario="live"' in l][0]
+        print(f"Prometheus satırı: {eta_line}")
 
 if __name__ == "__main__":
     try:
@@ -12,12 +12,17 @@ Not: Bu araç birincil rapor (ChangeLog.md) dosyasını analiz eder.
 
 import os
 import re
+import sys
 import json
 from datetime import datetime, timezone
 from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List, Tuple, Optional, Any
 
+# Agent-shared/change_log (şablon Agent-shared/tools altına kopyalansa da bulunur)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "change_log"))
+from changelog_index import ChangeLogIndex, parse_changelog_text
+
 class ChangeLogAnalysisTemplate:
     """
     Genel amaçlı ChangeLog.md analiz sınıfı
@@ -54,67 +59,69 @@ class ChangeLogAnalysisTemplate:
         Dosya içeriğini ayrıştır (özelleştirilebilir)
         ChangeLog.md’nin yeni biçimini ayrıştır
         """
-        entries = []
-        
-        # ### v1.2.3 desenine göre girdileri böl
-        version_pattern = r'###\s+v([\d.]+)'
-        
-        matches = list(re.finditer(version_pattern, content))
-        
-        for i, match in enumerate(matches):
-            version = f"v{match.group(1)}"
-            start = match.start()
-            end = matches[i+1].start() if i+1 < len(matches) else len(content)
-            entry_content = content[start:end]
-            
-            entry = {"version": version}
-            
-            change_match = re.search(r'\*\*Değişiklikler\*\*:\s*"([^"]+)"', entry_content)
-            if change_match:
-                entry["change_summary"] = change_match.group(1)
-            
-            result_match = re.search(r'\*\*Sonuç\*\*:\s*([^`]+)\s*`([^`]+)`', entry_content)
-            if result_match:
-                entry["result_type"] = result_match.group(1).strip()
-                entry["result_value"] = result_match.group(2).strip()
-            
-            comment_match = re.search(r'\*\*Yorum\*\*:\s*"([^"]+)"', entry_content)
-            if comment_match:
-                entry["technical_comment"] = comment_match.group(1)
-            
-            # <details> içindeki bilgileri ayrıştır
-            details_match = re.search(r'<details>([\s\S]*?)</details>', entry_content)
-            if details_match:
-                details_content = details_match.group(1)
-                
-                compile_match = re.search(r'-\s*\[([x\s])\]\s*\*\*compile\*\*[\s\S]*?status:\s*`([^`]+)`', details_content)
-                if compile_match:
-                    entry["compile_complete"] = compile_match.group(1) == 'x'
-                    entry["compile_status"] = compile_match.group(2)
-                
-                job_match = re.search(r'-\s*\[([x\s])\]\s*\*\*job\*\*[\s\S]*?status:\s*`([^`]+)`', details_content)
-                if job_match:
-                    entry["job_complete"] = job_match.group(1) == 'x'
-                    entry["job_status"] = job_match.group(2)
-                
-                test_match = re.search(r'-\s*\[([x\s])\]\s*\*\*test\*\*[\s\S]*?status:\s*`([^`]+)`', details_content)
-                if test_match:
-                    entry["test_complete"] = test_match.group(1) == 'x'
-                    entry["test_status"] = test_match.group(2)
-                
-                # performance
-                perf_match = re.search(r'performance:\s*`([^`]+)`', details_content)
-                if perf_match:
-                    entry["performance"] = perf_match.group(1)
+        return [self.entry_from_record(record) for record in parse_changelog_text(content)]
+    
+    def entry_from_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Ortak ayrıştırıcı kaydını analiz girdisine dönüştür
+        
+        Args:
+            record: changelog_index.parse_version_section() çıktısı
+        """
+        entry = {"version": f"v{record['version']}"}
+        
+        for key in ("change_summary", "result_type", "result_value", "technical_comment",
+                    "compile_complete", "compile_status", "job_complete", "job_status",
+                    "test_complete", "test_status", "sota_scope"):
+            if key in record:
+                entry[key] = record[key]
+        
+        if "performance_text" in record:
+            entry["performance"] = record["performance_text"]
+        
+        return entry
+    
+    def collect_entries(self, filename: str, exclude_dirs: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Tüm hedef dosyaların girdilerini topla
+        
+        parse_entry() özelleştirilmemişse ortak ChangeLog dizini kullanılır;
+        yalnızca değişen dosyalar yeniden ayrıştırılır.
+        """
+        all_data = {}
+        
+        uses_default_parser = type(self).parse_entry is ChangeLogAnalysisTemplate.parse_entry
+        if filename == "ChangeLog.md" and uses_default_parser:
+            index = ChangeLogIndex(self.project_root)
+            try:
+                stats = index.refresh()
+                print(f"Found {stats['files']} target files ({stats['updated']} re-parsed)")
+                for rel_path, records in index.entries(exclude=exclude_dirs).items():
+                    entries = [self.entry_from_record(record) for record in records]
+                    if entries:
+                        all_data[str(self.project_root / rel_path)] = entries
+            finally:
+                index.close()
+            return all_data
+        
+        target_files = self.find_target_files(filename=filename, exclude_dirs=exclude_dirs)
+        
+        print(f"Found {len(target_files)} target files")
+        
+        for file_path in target_files:
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
                 
-                # sota
-                sota_match = re.search(r'-\s*\[x\]\s*\*\*sota\*\*[\s\S]*?scope:\s*`([^`]+)`', details_content)
-                if sota_match:
-                    entry["sota_scope"] = sota_match.group(1)
-            
-            entries.append(entry)
-        
-        return entries
+                entries = self.parse_entry(content)
+                if entries:
+                    all_data[str(file_path)] = entries
+                    print(f"✓ Processed: {file_path} ({len(entries)} entries)")
+                    
+            except Exception as e:
+                print(f"✗ Error processing {file_path}: {e}")
+        
+        return all_data
     
     def extract_metadata(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -215,27 +222,11 @@ class ChangeLogAnalysisTemplate:
         """
         params = custom_params or {}
         
-        target_files = self.find_target_files(
+        all_data = self.collect_entries(
             filename=params.get("filename", "ChangeLog.md"),
             exclude_dirs=params.get("exclude_dirs", ["Agent-shared", "GitHub", "BaseCode"])
         )
         
-        print(f"Found {len(target_files)} target files")
-        
-        all_data = {}
-        for file_path in target_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                entries = self.parse_entry(content)
-                if entries:
-                    all_data[str(file_path)] = entries
-                    print(f"✓ Processed: {file_path} ({len(entries)} entries)")
-                    
-            except Exception as e:
-                print(f"✗ Error processing {file_path}: {e}")
-        
         stats = self.aggregate_data(all_data)
         
         report = self.generate_report(stats)
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ChangeLog.md artımlı dizini (index)
+budget_tracker.py, sota_visualizer.py ve changelog_analysis_template.py
+tarafından ortak kullanılan tek ayrıştırıcı ve disk üzerindeki önbellek
+
+Özellikler:
+- Tüm ChangeLog.md dosyaları tek bir ayrıştırıcıyla okunur
+- Sonuçlar .cache/changelog_index.sqlite içinde saklanır
+- Dosyalar yol + mtime + boyut ile anahtarlanır; yalnızca değişen dosyalar yeniden okunur
+- Her sürüm girdisinin bayt aralığı ve içerik özeti saklanır; değişen bir dosyada
+  yalnızca eklenen veya düzenlenen girdiler yeniden ayrıştırılır
+- Metrik tanımlarının özeti (metric_registry.py) saklanır; proje metriği ya da birimleri
+  değişirse tüm dosyalar yeniden ayrıştırılır
+"""
+
+import os
+import re
+import json
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable
+
+from metric_registry import MetricRegistry
+
+INDEX_SCHEMA_VERSION = 5
+INDEX_FILENAME = "changelog_index.sqlite"
+
+# Dizin taramasında hiç girilmeyen dizinler
+SKIP_DIRS = {'.git', '.cache', '__pycache__', 'node_modules'}
+
+VERSION_HEADER_PATTERN = re.compile(r'^###[ \t]*v(\d[\d.]*)[^\n]*$', re.MULTILINE)
+VERSION_HEADER_BYTES_PATTERN = re.compile(rb'^###[ \t]*v(\d[\d.]*)[^\n]*$', re.MULTILINE)
+JOB_BLOCK_PATTERN = re.compile(r'- \[.\] \*\*job\*\*(.*?)(?=- \[.\] \*\*|\Z)', re.DOTALL)
+GENERATION_TIME_PATTERN = re.compile(r'`(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z)`')
+ACCURACY_PATTERN = re.compile(r'([\d.]+)\s*%')
+ERROR_PATTERN = re.compile(r'([±]?\s*[\d.]+e?[+-]?\d*)')
+
+JOB_FIELDS = ('id', 'resource_group', 'start_time', 'end_time',
+              'cancelled_time', 'runtime_sec', 'status', 'nodes')
+
+# Proje yapılandırması verilmediğinde yerleşik metrikler (hedef: GFLOPS)
+DEFAULT_METRICS = MetricRegistry()
+
+
+def extract_field(text: str, field: str) -> Optional[str]:
+    """`- field: `değer`` biçimindeki alan değerini çıkar"""
+    match = re.search(rf'- {field}:\s*`([^`]*)`', text)
+    return match.group(1) if match else None
+
+
+def parse_version_section(version: str, title: str, section: str,
+                          metrics: Optional[MetricRegistry] = None) -> Dict[str, Any]:
+    """Tek bir sürüm girdisini ayrıştır
+
+    Args:
+        version: Sayısal sürüm (ör: 1.2.3)
+        title: Başlık satırı ('### ' hariç, ör: v1.2.3)
+        section: Başlık dahil girdi metni
+        metrics: Birim tanımları ve hedef metrik (None: yerleşik metrikler, hedef GFLOPS)
+
+    Returns:
+        Tüm araçların ihtiyaç duyduğu alanları içeren girdi sözlüğü. 'measurements' metrik
+        başına temel birimdeki değeri, 'performance' hedef metriğin değerini içerir.
+    """
+    metrics = metrics or DEFAULT_METRICS
+    record: Dict[str, Any] = {'version': version, 'title': title}
+    measurements: Dict[str, float] = {}
+
+    # Özet alanları (analiz şablonu)
+    change_match = re.search(r'\*\*Değişiklikler\*\*:\s*"([^"]+)"', section)
+    if change_match:
+        record['change_summary'] = change_match.group(1)
+
+    result_match = re.search(r'\*\*Sonuç\*\*:\s*([^`]+)\s*`([^`]+)`', section)
+    if result_match:
+        record['result_type'] = result_match.group(1).strip()
+        record['result_value'] = result_match.group(2).strip()
+
+    comment_match = re.search(r'\*\*Yorum\*\*:\s*"([^"]+)"', section)
+    if comment_match:
+        record['technical_comment'] = comment_match.group(1)
+
+    details_match = re.search(r'<details>([\s\S]*?)</details>', section)
+    if details_match:
+        details = details_match.group(1)
+        for step in ('compile', 'job', 'test'):
+            step_match = re.search(
+                rf'-\s*\[([x\s])\]\s*\*\*{step}\*\*[\s\S]*?status:\s*`([^`]+)`', details)
+            if step_match:
+                record[f'{step}_complete'] = step_match.group(1) == 'x'
+                record[f'{step}_status'] = step_match.group(2)
+
+        perf_match = re.search(r'performance:\s*`([^`]+)`', details)
+        if perf_match:
+            record['performance_text'] = perf_match.group(1)
+
+        sota_match = re.search(r'-\s*\[x\]\s*\*\*sota\*\*[\s\S]*?scope:\s*`([^`]+)`', details)
+        if sota_match:
+            record['sota_scope'] = sota_match.group(1)
+
+    # Satır bazlı değerler (ölçümler, oluşturma zamanı, doğruluk, hata)
+    for line in section.split('\n')[1:]:
+        found = metrics.find_measurements(line)
+        if found:
+            measurements.update(found)  # Birim dönüşümü (ör: TFLOPS→GFLOPS) metric_registry.py içinde
+        elif 'Oluşturma zamanı' in line or 'Oluşturulma zamanı' in line:
+            match = GENERATION_TIME_PATTERN.search(line)
+            if match:
+                record['generation_time'] = match.group(1)
+        elif 'Doğruluk' in line or 'accuracy' in line.lower():
+            match = ACCURACY_PATTERN.search(line)
+            if match:
+                try:
+                    record['accuracy'] = float(match.group(1))
+                except ValueError:
+                    pass
+        elif 'Hata' in line or 'error' in line.lower():
+            match = ERROR_PATTERN.search(line)
+            if match:
+                try:
+                    record['error'] = float(match.group(1).replace('±', '').strip())
+                except ValueError:
+                    pass
+
+    # Satırlarda birimli değer yoksa test bloğundaki performance + unit alanları kullanılır
+    unit_match = re.search(r'unit:\s*`([^`]+)`', section)
+    if 'performance_text' in record and unit_match:
+        metric = metrics.metric_for_unit(unit_match.group(1).strip())
+        if metric is not None and metric.name not in measurements:
+            try:
+                measurements[metric.name] = metric.to_base(float(record['performance_text']),
+                                                           unit_match.group(1).strip())
+            except ValueError:
+                pass
+
+    if measurements:
+        record['measurements'] = measurements
+        if metrics.target.name in measurements:
+            record['performance'] = measurements[metrics.target.name]
+
+    # İş bloğu (bütçe hesabı)
+    job_match = JOB_BLOCK_PATTERN.search(section)
+    if job_match:
+        job_section = job_match.group(1)
+        record['job'] = {field: extract_field(job_section, field) for field in JOB_FIELDS}
+        if not record['job']['nodes']:
+            # Düğüm sayısı genellikle params bölümünde yazılır
+            record['job']['nodes'] = extract_field(section, 'nodes')
+
+    return record
+
+
+def split_version_sections(content: str) -> List[tuple]:
+    """İçeriği sürüm başlıklarına göre böl
+
+    Returns:
+        (sürüm, başlık, başlangıç, bitiş) demetlerinin listesi (karakter konumları)
+    """
+    matches = list(VERSION_HEADER_PATTERN.finditer(content))
+    sections = []
+    for i, match in enumerate(matches):
+        start = match.start()
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        title = match.group(0)[3:].strip()
+        sections.append((match.group(1), title, start, end))
+    return sections
+
+
+def split_version_spans(data: bytes) -> List[tuple]:
+    """Ham dosya içeriğini sürüm başlıklarına göre böl
+
+    Returns:
+        (sürüm, başlık, başlangıç, bitiş) demetlerinin listesi (bayt konumları)
+    """
+    matches = list(VERSION_HEADER_BYTES_PATTERN.finditer(data))
+    spans = []
+    for i, match in enumerate(matches):
+        start = match.start()
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(data)
+        title = match.group(0)[3:].decode('utf-8', errors='replace').strip()
+        spans.append((match.group(1).decode('ascii'), title, start, end))
+    return spans
+
+
+def span_digest(span: bytes) -> str:
+    """Girdi içeriğinin özeti (değişiklik tespiti için)"""
+    return hashlib.blake2b(span, digest_size=16).hexdigest()
+
+
+def parse_changelog_text(content: str, metrics: Optional[MetricRegistry] = None) -> List[Dict[str, Any]]:
+    """ChangeLog.md içeriğinin tamamını ayrıştır (dosyadaki sırayla)"""
+    return [parse_version_section(version, title, content[start:end], metrics)
+            for version, title, start, end in split_version_sections(content)]
+
+
+def _is_excluded(rel_path: str, exclude: Iterable[str]) -> bool:
+    """Göreli yol hariç tutulacak bir dizin adını içeriyor mu"""
+    return any(skip in rel_path for skip in exclude)
+
+
+class ChangeLogIndex:
+    """ChangeLog.md dosyaları için disk üzerindeki artımlı dizin"""
+
+    def __init__(self, project_root: Path, cache_path: Optional[Path] = None,
+                 filename: str = "ChangeLog.md"):
+        self.project_root = Path(project_root)
+        self.filename = filename
+        self.cache_path = cache_path or self.project_root / ".cache" / INDEX_FILENAME
+        try:
+            self.metrics = MetricRegistry.for_project(self.project_root)
+        except ValueError as e:
+            print(f"Metrik yapılandırması geçersiz ({e}), yerleşik metrikler kullanılıyor", flush=True)
+            self.metrics = DEFAULT_METRICS
+        self.conn = self._connect()
+        self._check_metrics()
+        self.changed_paths: List[str] = []  # Son refresh() çağrısında değişen/silinen dosyalar
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite bağlantısını aç (yazılamıyorsa bellek içi veritabanına düş)"""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.cache_path), timeout=30)
+            self._ensure_schema(conn)
+        except (OSError, sqlite3.Error) as e:
+            print(f"ChangeLog dizini açılamadı ({e}), bellek içi dizin kullanılıyor", flush=True)
+            conn = sqlite3.connect(':memory:')
+            self._ensure_schema(conn)
+        return conn
+
+    @staticmethod
+    def _ensure_schema(conn: sqlite3.Connection):
+        """Şema sürümü farklıysa tabloları yeniden oluştur"""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == INDEX_SCHEMA_VERSION:
+            return
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS files")
+            conn.execute("DROP TABLE IF EXISTS entries")
+            conn.execute("DROP TABLE IF EXISTS jobs")
+            conn.execute("DROP TABLE IF EXISTS meta")
+            conn.execute("""CREATE TABLE meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL)""")
+            conn.execute("""CREATE TABLE files (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL)""")
+            conn.execute("""CREATE TABLE entries (
+                path TEXT NOT NULL,
+                ordinal INTEGER NOT NULL,
+                version TEXT NOT NULL,
+                byte_start INTEGER NOT NULL,
+                byte_end INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                generation_time TEXT,
+                performance REAL,
+                record TEXT NOT NULL,
+                PRIMARY KEY (path, ordinal))""")
+            conn.execute("""CREATE TABLE jobs (
+                path TEXT NOT NULL,
+                ordinal INTEGER NOT NULL,
+                version TEXT NOT NULL,
+                job_id TEXT,
+                resource_group TEXT,
+                start_time TEXT,
+                end_time TEXT,
+                cancelled_time TEXT,
+                runtime_sec TEXT,
+                status TEXT,
+                nodes TEXT,
+                PRIMARY KEY (path, ordinal))""")
+            conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+
+    def _check_metrics(self):
+        """Metrik tanımları dizindekinden farklıysa tüm kayıtları at (sonraki refresh() yeniden ayrıştırır)"""
+        current = self.metrics.fingerprint()
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'metrics'").fetchone()
+        if row and row[0] == current:
+            return
+        with self.conn:
+            if row:
+                self.conn.execute("DELETE FROM files")
+                self.conn.execute("DELETE FROM entries")
+                self.conn.execute("DELETE FROM jobs")
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('metrics', ?)", (current,))
+
+    def _scan(self) -> Dict[str, os.stat_result]:
+        """Proje ağacındaki hedef dosyaları bul (yalnızca stat, içerik okunmaz)"""
+        found = {}
+        for root, dirs, files in os.walk(self.project_root):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            if self.filename in files:
+                full_path = Path(root) / self.filename
+                try:
+                    stat = full_path.stat()
+                except OSError:
+                    continue
+                found[full_path.relative_to(self.project_root).as_posix()] = stat
+        return found
+
+    def refresh(self) -> Dict[str, int]:
+        """Değişen dosyaları yeniden oku, silinenleri kaldır
+
+        Değişen bir dosyada yalnızca içerik özeti değişen girdiler yeniden ayrıştırılır;
+        yenisi üste eklenen girdiler diğerlerinin bayt konumunu kaydırsa da önceki
+        ayrıştırma sonuçları yeniden kullanılır.
+
+        Returns:
+            {'files': toplam, 'updated': değişen dosya, 'removed': silinen,
+             'entries_parsed': yeniden ayrıştırılan girdi}
+        """
+        current = self._scan()
+        known = {path: (mtime_ns, size) for path, mtime_ns, size
+                 in self.conn.execute("SELECT path, mtime_ns, size FROM files")}
+
+        self.changed_paths = []
+        entries_parsed = 0
+        for rel_path, stat in current.items():
+            if known.get(rel_path) == (stat.st_mtime_ns, stat.st_size):
+                continue
+            try:
+                data = (self.project_root / rel_path).read_bytes()
+            except OSError:
+                continue
+            entries_parsed += self._update_file(rel_path, stat, data)
+            self.changed_paths.append(rel_path)
+
+        removed = [path for path in known if path not in current]
+        if removed:
+            with self.conn:
+                for rel_path in removed:
+                    self._delete(rel_path)
+
+        stats = {'files': len(current), 'updated': len(self.changed_paths),
+                 'removed': len(removed), 'entries_parsed': entries_parsed}
+        self.changed_paths.extend(removed)
+        return stats
+
+    def _update_file(self, rel_path: str, stat: os.stat_result, data: bytes) -> int:
+        """Dosyanın girdi aralıklarını güncelle, yalnızca yeni/değişen girdileri ayrıştır
+
+        Returns:
+            Yeniden ayrıştırılan girdi sayısı
+        """
+        previous = {digest: record for digest, record in self.conn.execute(
+            "SELECT digest, record FROM entries WHERE path = ?", (rel_path,))}
+
+        rows = []
+        parsed = 0
+        for version, title, start, end in split_version_spans(data):
+            span = data[start:end]
+            digest = span_digest(span)
+            record_json = previous.get(digest)
+            if record_json is None:
+                record = parse_version_section(version, title, span.decode('utf-8', errors='replace'),
+                                               self.metrics)
+                record_json = json.dumps(record, ensure_ascii=False)
+                parsed += 1
+            else:
+                record = json.loads(record_json)
+            rows.append((start, end, digest, record, record_json))
+
+        self._store(rel_path, stat, rows)
+        return parsed
+
+    def _delete(self, rel_path: str):
+        """Bir dosyaya ait tüm satırları sil (işlem içinde çağrılır)"""
+        self.conn.execute("DELETE FROM files WHERE path = ?", (rel_path,))
+        self.conn.execute("DELETE FROM entries WHERE path = ?", (rel_path,))
+        self.conn.execute("DELETE FROM jobs WHERE path = ?", (rel_path,))
+
+    def _store(self, rel_path: str, stat: os.stat_result, rows: List[tuple]):
+        """Bir dosyanın girdilerini tek işlemde kaydet
+
+        Args:
+            rows: (bayt başlangıcı, bayt bitişi, özet, kayıt, kayıt JSON) listesi
+        """
+        with self.conn:
+            self._delete(rel_path)
+            self.conn.execute("INSERT INTO files VALUES (?, ?, ?)",
+                              (rel_path, stat.st_mtime_ns, stat.st_size))
+            for ordinal, (start, end, digest, record, record_json) in enumerate(rows):
+                self.conn.execute(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (rel_path, ordinal, record['version'], start, end, digest,
+                     record.get('generation_time'), record.get('performance'), record_json))
+                job = record.get('job')
+                if job:
+                    self.conn.execute(
+                        "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (rel_path, ordinal, record['version'],
+                         *(job[field] for field in JOB_FIELDS)))
+
+    def entries(self, exclude: Iterable[str] = ()) -> Dict[str, List[Dict[str, Any]]]:
+        """Dosya bazında girdiler (anahtar: proje köküne göre dosya yolu)"""
+        exclude = tuple(exclude)
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        for rel_path, record in self.conn.execute(
+                "SELECT path, record FROM entries ORDER BY path, ordinal"):
+            if _is_excluded(rel_path, exclude):
+                continue
+            result.setdefault(rel_path, []).append(json.loads(record))
+        return result
+
+    def jobs(self, exclude: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        """İş bloğu olan tüm girdiler (budget_tracker.py biçiminde)"""
+        exclude = tuple(exclude)
+        jobs = []
+        for row in self.conn.execute(
+                "SELECT path, version, job_id, resource_group, start_time, end_time, "
+                "cancelled_time, runtime_sec, status, nodes FROM jobs ORDER BY path, ordinal"):
+            rel_path = row[0]
+            if _is_excluded(rel_path, exclude):
+                continue
+            jobs.append({
+                'version': row[1],
+                'path': str(self.project_root / rel_path),
+                'job_id': row[2],
+                'resource_group': row[3],
+                'start_time': row[4],
+                'end_time': row[5],
+                'cancelled_time': row[6],
+                'runtime_sec': row[7],
+                'status': row[8],
+                'nodes': row[9],
+            })
+        return jobs
+
+    def close(self):
+        """Bağlantıyı kapat"""
+        self.conn.close()
+
+
+def open_index(project_root: Path, refresh: bool = True) -> ChangeLogIndex:
+    """Dizini aç ve (varsayılan olarak) güncelle"""
+    index = ChangeLogIndex(project_root)
+    if refresh:
+        index.refresh()
+    return index
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='ChangeLog.md artımlı dizini')
+    parser.add_argument('--root', type=str, default='.', help='Proje kök dizini')
+    parser.add_argument('--rebuild', action='store_true', help='Dizini sıfırdan oluştur')
+    args = parser.parse_args()
+
+    project_root = Path(args.root)
+    if args.rebuild:
+        (project_root / ".cache" / INDEX_FILENAME).unlink(missing_ok=True)
+
+    index = ChangeLogIndex(project_root)
+    stats = index.refresh()
+    print(f"ChangeLog dizini: {stats['files']} dosya, "
+          f"{stats['updated']} güncellendi, {stats['removed']} silindi, "
+          f"{stats['entries_parsed']} girdi ayrıştırıldı")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metrik kayıt defteri: birimler, yön (büyük/küçük daha iyi), birim dönüşümü ve doğruluk eşiği
+
+changelog_index.py (ayrıştırma), sota_checker.py / sota_registry.py (SOTA değerlendirmesi)
+ve sota_visualizer.py (grafikler) aynı tanımları kullanır.
+
+Projenin hedef metriği Agent-shared/sota_pipeline_config.json içindeki "metric" bölümünde seçilir:
+    "metric": {
+        "name": "gflops",              # gflops / time / bandwidth / gflops_per_watt veya özel tanım
+        "accuracy_threshold": 95.0,    # Doğruluğu bu değerin altındaki sonuçlar SOTA sayılmaz (null: kapalı)
+        "definitions": {               # İsteğe bağlı özel metrikler
+            "cells_per_sec": {"unit": "Mcells/s", "direction": "max",
+                              "units": {"Mcells/s": 1, "Gcells/s": 1000}, "label": "Throughput"}
+        }
+    }
+Değerler her zaman metriğin temel biriminde saklanır ve karşılaştırılır (ör: 1.2 TFLOPS → 1200 GFLOPS).
+Önbellekler (ChangeLog dizini, SOTA kayıt defteri) tanımların özetini (fingerprint) saklar; metrik
+yapılandırması değişince kayıtlar yeniden ayrıştırılır / içe aktarılır.
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+CONFIG_RELATIVE_PATH = Path("Agent-shared") / "sota_pipeline_config.json"
+DEFAULT_METRIC = "gflops"
+
+
+class Metric:
+    """Tek bir metrik: temel birim, yön ve birim → temel birim çarpanları"""
+
+    def __init__(self, name: str, unit: str, direction: str, units: Dict[str, float], label: str):
+        if direction not in ('max', 'min'):
+            raise ValueError(f"Geçersiz metrik yönü: {direction} (max/min)")
+        self.name = name
+        self.unit = unit
+        self.direction = direction
+        self.units = dict(units)
+        self.units.setdefault(unit, 1.0)
+        self.label = label
+
+    @property
+    def higher_is_better(self) -> bool:
+        return self.direction == 'max'
+
+    @property
+    def sql_order(self) -> str:
+        """En iyiden kötüye sıralama (ORDER BY performance ...)"""
+        return 'DESC' if self.higher_is_better else 'ASC'
+
+    def to_base(self, value: float, unit: Optional[str] = None) -> float:
+        """Değeri temel birime çevir (birim yoksa temel birim varsayılır)"""
+        if unit is None or unit == self.unit:
+            return value
+        try:
+            return value * self.units[unit]
+        except KeyError:
+            raise ValueError(f"{self.name} metriği için bilinmeyen birim: {unit}")
+
+    def better(self, value: float, current: Optional[float]) -> bool:
+        """value, current'tan kesin olarak daha iyi mi (current None: kayıt yok, her değer daha iyi)"""
+        if current is None:
+            return True
+        return value > current if self.higher_is_better else value < current
+
+    def format(self, value: float) -> str:
+        return f"{value} {self.unit}"
+
+    @property
+    def axis_label(self) -> str:
+        return f"{self.label} ({self.unit})"
+
+    def fingerprint(self) -> str:
+        """Değerlerin anlamını belirleyen tanımın özeti (ad, temel birim, yön, birim çarpanları)"""
+        payload = [self.name, self.unit, self.direction, sorted(self.units.items())]
+        return hashlib.blake2b(json.dumps(payload).encode('utf-8'), digest_size=16).hexdigest()
+
+
+BUILTIN_METRICS = {
+    'gflops': Metric('gflops', 'GFLOPS', 'max',
+                     {'MFLOPS': 1e-3, 'GFLOPS': 1, 'TFLOPS': 1e3, 'PFLOPS': 1e6}, 'Performance'),
+    'time': Metric('time', 's', 'min',
+                   {'ns': 1e-9, 'us': 1e-6, 'µs': 1e-6, 'ms': 1e-3, 's': 1, 'sec': 1, 'sn': 1,
+                    'min': 60, 'dk': 60, 'h': 3600}, 'Time to solution'),
+    'bandwidth': Metric('bandwidth', 'GB/s', 'max',
+                        {'MB/s': 1e-3, 'GB/s': 1, 'TB/s': 1e3}, 'Bandwidth'),
+    'gflops_per_watt': Metric('gflops_per_watt', 'GFLOPS/W', 'max',
+                              {'MFLOPS/W': 1e-3, 'GFLOPS/W': 1, 'TFLOPS/W': 1e3}, 'Energy efficiency'),
+}
+
+
+class MetricRegistry:
+    """Metrik tanımları ve projenin hedef metriği"""
+
+    def __init__(self, definitions: Optional[Dict[str, Dict]] = None, target: str = DEFAULT_METRIC,
+                 accuracy_threshold: Optional[float] = None):
+        self.metrics: Dict[str, Metric] = dict(BUILTIN_METRICS)
+        for name, spec in (definitions or {}).items():
+            self.metrics[name] = Metric(name, spec['unit'], spec.get('direction', 'max'),
+                                        spec.get('units', {}), spec.get('label', name))
+        if target not in self.metrics:
+            raise ValueError(f"Bilinmeyen metrik: {target} (tanımlı: {', '.join(self.metrics)})")
+        self.target = self.metrics[target]
+        self.accuracy_threshold = accuracy_threshold
+
+        # Birim → metrik; uzun birimler önce denenir (GFLOPS/W, GFLOPS'tan önce)
+        self._unit_owner: Dict[str, Metric] = {}
+        for metric in self.metrics.values():
+            for unit in metric.units:
+                self._unit_owner.setdefault(unit, metric)
+        units = sorted(self._unit_owner, key=len, reverse=True)
+        self._pattern = re.compile(
+            r'(?<![±\d.])(\d[\d.]*(?:[eE][+-]?\d+)?)\s*(' + '|'.join(re.escape(u) for u in units) + r')(?![\w/])')
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict]) -> 'MetricRegistry':
+        """sota_pipeline_config.json içeriğinden ("metric" bölümü yoksa varsayılan: gflops)"""
+        section = (config or {}).get('metric') or {}
+        return cls(section.get('definitions'), section.get('name', DEFAULT_METRIC),
+                   section.get('accuracy_threshold'))
+
+    @classmethod
+    def for_project(cls, project_root: Optional[Path]) -> 'MetricRegistry':
+        """Projenin yapılandırma dosyasından (yoksa/okunamazsa varsayılan)"""
+        config = None
+        if project_root is not None:
+            try:
+                config = json.loads((Path(project_root) / CONFIG_RELATIVE_PATH).read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                config = None
+        return cls.from_config(config)
+
+    def fingerprint(self) -> str:
+        """Ayrıştırma sonucunu etkileyen tüm tanımların özeti (hedef metrik + tüm metrik/birimler)"""
+        payload = [self.target.name] + [self.metrics[name].fingerprint() for name in sorted(self.metrics)]
+        return hashlib.blake2b(json.dumps(payload).encode('utf-8'), digest_size=16).hexdigest()
+
+    def metric_for_unit(self, unit: str) -> Optional[Metric]:
+        return self._unit_owner.get(unit)
+
+    def find_measurements(self, text: str) -> Dict[str, float]:
+        """Metindeki '<sayı> <birim>' ölçümleri ({metrik: temel birimde değer}, aynı metrikte sonuncusu)"""
+        measurements = {}
+        for match in self._pattern.finditer(text):
+            try:
+                value = float(match.group(1))
+            except ValueError:
+                continue
+            metric = self._unit_owner[match.group(2)]
+            measurements[metric.name] = metric.to_base(value, match.group(2))
+        return measurements
+
+    def parse_value(self, text: str) -> float:
+        """'350.0 GFLOPS', '1.2 TFLOPS', '12.5 s' veya birimsiz '350' → hedef metriğin temel birimi
+
+        Raises:
+            ValueError: Sayı okunamazsa ya da birim başka bir metriğe aitse
+        """
+        parts = str(text).split()
+        if not parts:
+            raise ValueError("Boş performans değeri")
+        value = float(parts[0])
+        if len(parts) == 1:
+            return value
+        unit = parts[1]
+        metric = self.metric_for_unit(unit)
+        if metric is not None and metric is not self.target:
+            raise ValueError(f"{unit} birimi {metric.name} metriğine ait; proje metriği: "
+                             f"{self.target.name} ({self.target.unit})")
+        return self.target.to_base(value, unit)
+
+    def passes_accuracy(self, accuracy: Optional[float]) -> bool:
+        """Doğruluk eşiği kapısı (eşik yoksa ya da doğruluk bilinmiyorsa geçer)"""
+        if self.accuracy_threshold is None or accuracy is None:
+            return True
+        return accuracy >= self.accuracy_threshold
+
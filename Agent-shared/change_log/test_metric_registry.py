@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+metric_registry.py için test hata ayıklama kodu
+Sonuç satırlarından ölçüm çıkarma, birim dönüşümü ve küçük daha iyi (min) yönünü doğrulama
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from metric_registry import MetricRegistry
+
+failures = []
+
+def check(label, ok):
+    """Sonucu yazdır (başarısızlar sonunda toplanır)"""
+    print(f"  - {label}: {'✅' if ok else '❌'}")
+    if not ok:
+        failures.append(label)
+
+def run_test():
+    """Test çalıştırma"""
+    print("=" * 60)
+    print("metric_registry.py test başlangıcı")
+    print("=" * 60)
+
+    # Test senaryosu 1: Birim dönüşümü
+    print("\n[Test1] find_measurements birim dönüşümü")
+    print("-" * 40)
+
+    registry = MetricRegistry()
+    cases = [
+        ("1.2 TFLOPS", {'gflops': 1200.0}),
+        ("850 MFLOPS, 3.5 GB/s", {'gflops': 0.85, 'bandwidth': 3.5}),
+        ("250 ms", {'time': 0.25}),
+        ("1.5 min", {'time': 90.0}),
+        ("12.4 GFLOPS/W", {'gflops_per_watt': 12.4}),  # GFLOPS olarak okunmamalı
+        ("100 GFLOPS → 1.1 TFLOPS", {'gflops': 1100.0}),  # Aynı metrikte sonuncusu
+        ("hata ±0.5 GFLOPS, 2e3 MFLOPS", {'gflops': 2.0}),  # ± ile başlayan değer ölçüm değil
+        ("42 GFLOPSx", {}),
+    ]
+    for text, expected in cases:
+        found = registry.find_measurements(text)
+        ok = found.keys() == expected.keys() and all(abs(found[k] - v) < 1e-9 for k, v in expected.items())
+        print(f"'{text}' → {found}")
+        check(f"beklenen {expected}", ok)
+
+    # Test senaryosu 2: Küçük daha iyi (time) hedef metriği
+    print("\n[Test2] min yönü (time)")
+    print("-" * 40)
+
+    registry = MetricRegistry(target='time')
+    metric = registry.target
+    print(f"Hedef: {metric.name}, yön: {metric.direction}, sıralama: {metric.sql_order}")
+    check("9.5 s, 10 s'den daha iyi", metric.better(9.5, 10.0))
+    check("eşit değer daha iyi değil", not metric.better(10.0, 10.0))
+    check("kayıt yokken her değer daha iyi", metric.better(1e9, None))
+    check("sıralama ASC", metric.sql_order == 'ASC')
+    check("'2 min' → 120 s", registry.parse_value("2 min") == 120.0)
+    check("birimsiz değer temel birim", registry.parse_value("7.5") == 7.5)
+    try:
+        registry.parse_value("350 GFLOPS")
+        rejected = False
+    except ValueError as e:
+        print(f"Başka metriğin birimi: {e}")
+        rejected = True
+    check("başka metriğin birimi reddedildi", rejected)
+
+    # Test senaryosu 3: Özel metrik ve parmak izi
+    print("\n[Test3] Özel metrik")
+    print("-" * 40)
+
+    config = {'metric': {'name': 'cells', 'accuracy_threshold': 95.0, 'definitions': {
+        'cells': {'unit': 'Mcells/s', 'direction': 'max', 'units': {'Gcells/s': 1000}}}}}
+    custom = MetricRegistry.from_config(config)
+    found = custom.find_measurements("3.2 Gcells/s")
+    print(f"'3.2 Gcells/s' → {found}")
+    check("özel birim dönüşümü", abs(found.get('cells', 0) - 3200.0) < 1e-9)
+    check("doğruluk eşiği", custom.passes_accuracy(96.0) and not custom.passes_accuracy(90.0)
+          and custom.passes_accuracy(None))
+    check("hedef metrik parmak izini değiştirir", custom.fingerprint() != MetricRegistry().fingerprint()
+          and MetricRegistry().fingerprint() == MetricRegistry().fingerprint())
+
+if __name__ == "__main__":
+    try:
+        run_test()
+        print("\n" + "=" * 60)
+        if failures:
+            print(f"❌ Başarısız kontroller: {len(failures)}")
+            print("=" * 60)
+            sys.exit(1)
+        print("✅ Test tamamlandı")
+        print("=" * 60)
+    except Exception as e:
+        print(f"\n❌ Hata oluştu: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
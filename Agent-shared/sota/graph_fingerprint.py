@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+SOTA grafikleri için içerik parmak izi önbelleği
+
+Her çıktı grafiği için çizime giren her şeyin (SOTA girdi serisi, başlık, eksen, DPI, ölçek,
+ilgili parametreler) özeti saklanır. Özet değişmemişse ve PNG diskte duruyorsa grafik yeniden
+çizilmez; dosyanın mtime'ı güncellenir (cleanup_old_hours temizliği silmesin diye).
+
+Seviye düzeyinde de (local/family/hardware/project) girdilerin özeti tutulur: ChangeLog
+verisi ve ayarlar aynıysa seviye hiç yeniden hesaplanmaz, önceki çıktılar yeniden kullanılır.
+
+Önbellek: .cache/sota_graph_fingerprints.json
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+FINGERPRINT_VERSION = 1
+CACHE_FILENAME = "sota_graph_fingerprints.json"
+
+
+def fingerprint(*parts) -> str:
+    """JSON'a dönüştürülebilen parçaların kararlı özeti (datetime gibi değerler str ile)"""
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def touch(path: Path):
+    """Yeniden kullanılan grafiğin mtime'ını güncelle"""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+class GraphFingerprintCache:
+    """Grafik ve seviye parmak izlerinin kalıcı deposu"""
+
+    def __init__(self, project_root: Path, cache_path: Optional[Path] = None):
+        self.project_root = Path(project_root)
+        self.cache_path = cache_path or self.project_root / ".cache" / CACHE_FILENAME
+        self.graphs: Dict[str, str] = {}
+        self.levels: Dict[str, Dict] = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return
+        if data.get('version') == FINGERPRINT_VERSION:
+            self.graphs = data.get('graphs', {})
+            self.levels = data.get('levels', {})
+
+    def _key(self, output_path: Path) -> str:
+        try:
+            return Path(output_path).relative_to(self.project_root).as_posix()
+        except ValueError:
+            return str(output_path)
+
+    def is_fresh(self, output_path: Path, digest: str) -> bool:
+        """Grafik aynı girdilerle çizilmiş ve hâlâ diskte mi"""
+        return self.graphs.get(self._key(output_path)) == digest and Path(output_path).exists()
+
+    def record(self, output_path: Path, digest: str):
+        self.graphs[self._key(output_path)] = digest
+        self.dirty = True
+
+    def fresh_level(self, level: str, digest: str) -> Optional[List[Path]]:
+        """Seviyenin girdileri değişmemişse önceki çıktıları (hepsi diskteyse) döndür"""
+        entry = self.levels.get(level)
+        if not entry or entry.get('fingerprint') != digest:
+            return None
+        outputs = [self.project_root / rel for rel in entry.get('outputs', [])]
+        if not all(path.exists() for path in outputs):
+            return None
+        return outputs
+
+    def record_level(self, level: str, digest: str, outputs: List[Path]):
+        self.levels[level] = {'fingerprint': digest, 'outputs': [self._key(p) for p in outputs]}
+        self.dirty = True
+
+    def clear(self):
+        """Tüm parmak izlerini unut (sonraki çalıştırmada her şey yeniden çizilir)"""
+        self.graphs = {}
+        self.levels = {}
+        self.dirty = True
+
+    def save(self):
+        """Önbelleği atomik olarak yaz (değişiklik yoksa yazılmaz)"""
+        if not self.dirty:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps({'version': FINGERPRINT_VERSION,
+                                            'graphs': self.graphs, 'levels': self.levels}))
+            tmp_path.replace(self.cache_path)
+            self.dirty = False
+        except OSError:
+            pass  # Önbelleğe yazılamazsa sonraki çalıştırmada grafikler yeniden çizilir
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+SOTA boru hattı için süreçler arası kilit (flock + heartbeat lease + birleştirme)
+
+- Kilit, Agent-shared/.sota_pipeline.lock üzerinde fcntl.flock ile alınır; sahibi çökerse
+  çekirdek kilidi hemen bırakır (eski 30 dakikalık yaş sezgisi gerekmez)
+- Sahip, kilit dosyasına PID/host/başlangıç bilgisini yazar ve lease süresinin üçte birinde
+  bir heartbeat zamanını yeniler. flock desteklemeyen dosya sistemlerinde kilit, heartbeat'i
+  lease süresinden taze olan sahibe aittir
+- Birleştirme (coalesce): kilit meşgulken gelen çağıranlar atlanmak yerine tek bir takip
+  çalıştırması ister (.sota_pipeline.pending). Sahip, işi bitince istek varsa boru hattını bir
+  kez daha çalıştırır; aynı anda gelen istekler tek çalıştırmada birleşir
+
+Kilit dosyası silinmez (silinirse yeni dosyada ikinci bir kilit oluşabilir).
+"""
+
+import errno
+import fcntl
+import json
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+DEFAULT_LEASE_SEC = 60
+
+
+class PipelineLock:
+    """flock tabanlı, heartbeat lease'li ve takip çalıştırmalı boru hattı kilidi"""
+
+    def __init__(self, lock_path: Path, lease_sec: float = DEFAULT_LEASE_SEC):
+        """
+        Args:
+            lock_path: Kilit dosyası (ör: Agent-shared/.sota_pipeline.lock)
+            lease_sec: Heartbeat bu süreden eskiyse sahip ölü kabul edilir (flock yoksa)
+        """
+        self.lock_path = Path(lock_path)
+        self.pending_path = self.lock_path.with_suffix('.pending')
+        self.lease_sec = lease_sec
+        self._fd = None
+        self._started_at = None
+        self._stop = threading.Event()
+        self._heartbeat = None
+
+    # ---- Sahip bilgisi ----
+
+    def owner(self) -> Optional[Dict]:
+        """Kilit dosyasındaki sahip bilgisi (pid, host, started_at, heartbeat_at; okunamazsa None)"""
+        try:
+            return json.loads(self.lock_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _lease_alive(self, owner: Optional[Dict]) -> bool:
+        """Sahibin heartbeat'i lease süresi içinde mi"""
+        if not owner or 'heartbeat_at' not in owner:
+            return False
+        return time.time() - owner['heartbeat_at'] < self.lease_sec
+
+    def _write_owner(self):
+        now = time.time()
+        owner = {
+            'pid': os.getpid(),
+            'host': socket.gethostname(),
+            'started_at': self._started_at,
+            'heartbeat_at': now,
+            'heartbeat_iso': datetime.fromtimestamp(now, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        }
+        data = json.dumps(owner).encode('utf-8')
+        os.ftruncate(self._fd, 0)
+        os.pwrite(self._fd, data, 0)
+
+    def _beat(self):
+        while not self._stop.wait(self.lease_sec / 3):
+            try:
+                self._write_owner()
+            except OSError:
+                pass  # Geçici yazma hatası; bir sonraki heartbeat'te yeniden denenir
+
+    # ---- Kilit ----
+
+    def acquire(self) -> bool:
+        """Kilidi beklemeden almayı dene"""
+        if self._fd is not None:
+            return True
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError as e:
+            if e.errno in (errno.EWOULDBLOCK, errno.EAGAIN):
+                os.close(fd)
+                return False
+            # flock desteklenmiyor (ör: bazı ağ dosya sistemleri): yalnızca lease'e güvenilir
+            owner = self.owner()
+            if self._lease_alive(owner) and owner.get('pid') != os.getpid():
+                os.close(fd)
+                return False
+
+        self._fd = fd
+        self._started_at = time.time()
+        self._write_owner()
+        self._stop.clear()
+        self._heartbeat = threading.Thread(target=self._beat, daemon=True)
+        self._heartbeat.start()
+        return True
+
+    def release(self):
+        """Heartbeat'i durdur ve kilidi bırak (dosya silinmez)"""
+        if self._fd is None:
+            return
+        self._stop.set()
+        self._heartbeat.join()
+        try:
+            os.ftruncate(self._fd, 0)  # Sahip bilgisi temizlenir (lease hemen biter)
+        except OSError:
+            pass
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        except OSError:
+            pass  # flock desteklenmeyen dosya sisteminde kilit yalnızca lease'ti
+        os.close(self._fd)
+        self._fd = None
+
+    # ---- Birleştirme ----
+
+    def request_followup(self):
+        """Sahipten bir takip çalıştırması iste (birden çok istek tek çalıştırmada birleşir)"""
+        self.pending_path.touch()
+
+    def take_followup(self) -> bool:
+        """Bekleyen takip isteğini tüket (varsa True)"""
+        try:
+            self.pending_path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def followup_requested(self) -> bool:
+        return self.pending_path.exists()
+
+    def run_coalesced(self, job: Callable[[], bool]) -> Optional[bool]:
+        """Kilidi alıp job'u çalıştır; kilit meşgulse takip çalıştırması iste
+
+        Sahip, çalışırken gelen istekleri job'u bir kez daha çalıştırarak karşılar. Kilit
+        bırakıldıktan hemen sonra gelen istek kaybolmasın diye bırakmadan sonra tekrar bakılır.
+
+        Returns:
+            job'un son sonucu; kilit başka süreçteyse None (istek sahibe bırakıldı)
+        """
+        if not self.acquire():
+            self.request_followup()
+            # Sahip bu arada bıraktıysa isteği kendimiz karşılarız
+            if not self.acquire():
+                return None
+
+        result = None
+        while True:
+            try:
+                self.take_followup()  # Bu çalıştırma o ana kadarki istekleri karşılar
+                result = job()
+                while self.take_followup():
+                    result = job()
+            finally:
+                self.release()
+            if not self.followup_requested() or not self.acquire():
+                return result
@@ -3,6 +3,11 @@
 SOTA Management System - VibeCodeHPC
 
 4 katmanlı SOTA yönetim sistemi (Yerel/Ebeveyn/Küresel/Proje)
+
+Katmanların en iyileri proje başına kayıt defterinden (sota_registry.py) tek sorguyla okunur;
+sota_*.txt dosyaları karşılaştır-ve-yaz ile atomik güncellenir; her geçiş
+history/sota_history.jsonl günlüğüne eklenir (sota_history.py).
+Değerler projenin metriğine göre (metric_registry.py: birim, yön, doğruluk eşiği) karşılaştırılır.
 """
 
 import os
@@ -10,112 +15,168 @@ import json
 from pathlib import Path
 import glob
 
+from sota_history import SOTAHistory
+from sota_registry import SOTARegistry, cas_sota_file, read_sota_value
+from metric_registry import MetricRegistry
+from changelog_index import parse_changelog_text
+
+
+def parse_virtual_parent_paths(md_file):
+    """Markdown'daki Virtual parent bölümünden 📁 içeren yolları çıkar"""
+    with open(md_file, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    
+    virtual_parent_section = False
+    paths = []
+    
+    for line in lines:
+        line = line.strip()
+        if "### Virtual parent" in line:
+            virtual_parent_section = True
+            continue
+        elif line.startswith("###") and virtual_parent_section:
+            break  # Bir sonraki bölüme geçince dur
+        elif virtual_parent_section and line.startswith("../") and "📁" in line:
+            # ../MPI📁 ifadesinden ../MPI'yi çıkar
+            path = line.split("📁")[0]
+            paths.append(path)
+    
+    return paths
+
+
 class SOTAChecker:
     def __init__(self, current_dir):
         self.current_dir = Path(current_dir).resolve()  # Mutlak yola dönüştür
         self.performance = None
+        self.accuracy = None
+        self._registry = None
+        self._metrics = None
+        self._changelog_records = None
+        
+    @property
+    def metrics(self):
+        """Projenin metrik kayıt defteri (hedef metrik ve doğruluk eşiği)"""
+        if self._metrics is None:
+            self._metrics = MetricRegistry.for_project(self.find_project_root())
+        return self._metrics
         
-    def check_sota_levels(self, performance_metric):
-        """Tüm katmanlarda SOTA değerlendirmesi"""
-        self.performance = float(performance_metric.split()[0])
+    @property
+    def registry(self):
+        """Proje SOTA kayıt defteri (proje kökü bulunamazsa None: doğrudan dosyalar kullanılır)"""
+        if self._registry is None:
+            project_root = self.find_project_root()
+            if project_root:
+                self._registry = SOTARegistry(project_root, metric=self.metrics.target)
+        return self._registry
         
-        results = {
-            'local': self.check_local_sota(),
-            'parent': self.check_parent_sota(),
-            'hardware': self.check_hardware_sota(),
-            'project': self.check_project_sota()
-        }
+    def check_sota_levels(self, performance_metric, accuracy=None):
+        """Tüm katmanlarda SOTA değerlendirmesi (kayıt defterinde tek sorgu)
         
+        Args:
+            performance_metric: '350.0 GFLOPS', '1.2 TFLOPS', '12.5 s' gibi (birimsiz: metriğin temel birimi)
+            accuracy: Doğruluk (%); eşiğin altındaysa hiçbir katmanda SOTA sayılmaz
+        
+        Raises:
+            ValueError: Değer okunamazsa ya da birim projenin metriğine ait değilse
+        """
+        self.performance = self.metrics.parse_value(performance_metric)
+        self.accuracy = accuracy
+        return self._evaluate(self.current_best())
+    
+    def _evaluate(self, best):
+        """Mevcut en iyilerle karşılaştır (kapsam yoksa False, kayıt yoksa ilk çalıştırma: True)"""
+        metric = self.metrics.target
+        accepted = self.metrics.passes_accuracy(self.accuracy)
+        results = {}
+        for level in ('local', 'parent', 'hardware', 'project'):
+            if best[level] is False or not accepted:
+                results[level] = False
+            else:
+                results[level] = metric.better(self.performance, best[level]['performance'] if best[level] else None)
         return results
     
+    def _scope_dirs(self):
+        """Katman dizinleri: local, hardware, project (kapsam yoksa None) ve sanal ebeveynler"""
+        project_root = self.find_project_root()
+        hardware_dir = self.find_hardware_info_dir()
+        
+        visible_file = self.current_dir / "PG_visible_dir.md"
+        parents = None
+        if visible_file.exists():
+            parents = [Path(os.path.normpath(self.current_dir / path))
+                       for path in parse_virtual_parent_paths(visible_file)]
+        return {'local': self.current_dir, 'hardware': hardware_dir, 'project': project_root}, parents
+    
+    def current_best(self):
+        """Her katmanın mevcut en iyisi
+        
+        Returns:
+            {katman: kayıt sözlüğü ('performance' dahil), kayıt yoksa None, kapsam yoksa False}
+        """
+        scopes, parents = self._scope_dirs()
+        registry = self.registry
+        if registry is None:
+            return self._current_best_from_files(scopes, parents)
+        
+        # Elle düzenlenmiş dosyalar kayıt defterine yansıtılır (yalnızca stat)
+        registry.sync_files([scopes['local'] / "sota_local.txt"] +
+                            ([scopes['hardware'] / "sota_hardware.txt"] if scopes['hardware'] else []) +
+                            [scopes['project'] / "sota_project.txt"])
+        best = registry.lookup(scopes, parents or ())
+        for level, path in scopes.items():
+            if path is None:
+                best[level] = False
+        if parents is None:
+            best['parent'] = False
+        return best
+    
+    def _current_best_from_files(self, scopes, parents):
+        """Kayıt defteri olmadan (proje kökü dışında) dosyalardan oku"""
+        best = {}
+        for level, filename in (('local', 'sota_local.txt'), ('hardware', 'sota_hardware.txt'),
+                                ('project', 'sota_project.txt')):
+            if scopes[level] is None:
+                best[level] = False
+                continue
+            value = read_sota_value(scopes[level] / filename, self.metrics.target)
+            best[level] = None if value is None else {'performance': value}
+        
+        if parents is None:
+            best['parent'] = False
+        else:
+            best['parent'] = None
+            for path in parents:
+                for sota_file in path.glob("*/sota_local.txt"):
+                    value = read_sota_value(sota_file, self.metrics.target)
+                    if value is not None and (best['parent'] is None or
+                                              self.metrics.target.better(value, best['parent']['performance'])):
+                        best['parent'] = {'performance': value, 'source': str(sota_file)}
+        return best
+    
     def check_local_sota(self):
         """Yerel SOTA değerlendirmesi"""
-        sota_file = self.current_dir / "sota_local.txt"
-        if not sota_file.exists():
-            return True  # İlk çalıştırmada her zaman SOTA
-            
-        with open(sota_file, 'r') as f:
-            current_best = float(f.readline().split('"')[1].split()[0])
-            
-        return self.performance > current_best
+        return self._evaluate(self.current_best())['local']
     
     def check_parent_sota(self):
         """Ebeveyn SOTA değerlendirmesi (Sanal hesap)"""
-        # PG_visible_dir.md dosyasını bul
-        visible_file = self.current_dir / "PG_visible_dir.md"
-        if not visible_file.exists():
-            return False
-            
-        virtual_parent_paths = self._parse_virtual_parent_paths(visible_file)
-        
-        max_parent_perf = 0.0
-        for path in virtual_parent_paths:
-            full_path = self.current_dir / path
-            if full_path.exists():
-                for sota_file in full_path.glob("*/sota_local.txt"):
-                    with open(sota_file, 'r') as f:
-                        perf = float(f.readline().split('"')[1].split()[0])
-                        max_parent_perf = max(max_parent_perf, perf)
-        
-        return self.performance > max_parent_perf
+        return self._evaluate(self.current_best())['parent']
     
     def _parse_virtual_parent_paths(self, md_file):
         """Markdown'daki Virtual parent bölümünden 📁 içeren yolları çıkar"""
-        with open(md_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        virtual_parent_section = False
-        paths = []
-        
-        for line in lines:
-            line = line.strip()
-            if "### Virtual parent" in line:
-                virtual_parent_section = True
-                continue
-            elif line.startswith("###") and virtual_parent_section:
-                break  # Bir sonraki bölüme geçince dur
-            elif virtual_parent_section and line.startswith("../") and "📁" in line:
-                # ../MPI📁 ifadesinden ../MPI'yi çıkar
-                path = line.split("📁")[0]
-                paths.append(path)
-        
-        return paths
+        return parse_virtual_parent_paths(md_file)
     
     def check_hardware_sota(self):
         """Donanım SOTA değerlendirmesi"""
-        # hardware_info.txt hiyerarşisindeki sota_hardware.txt'yi kontrol et
-        hardware_dir = self.find_hardware_info_dir()
-        if not hardware_dir:
-            return False
-            
-        sota_file = hardware_dir / "sota_hardware.txt"
-        if not sota_file.exists():
-            return True  # İlk çalıştırmada her zaman SOTA
-            
-        with open(sota_file, 'r') as f:
-            current_best = float(f.readline().split('"')[1].split()[0])
-            
-        return self.performance > current_best
+        return self._evaluate(self.current_best())['hardware']
     
     def check_project_sota(self):
         """Proje SOTA değerlendirmesi"""
-        # VibeCodeHPC kökündeki sota_project.txt'yi kontrol et
-        project_root = self.find_project_root()
-        if not project_root:
-            return False
-            
-        sota_file = project_root / "sota_project.txt"
-        
-        if not sota_file.exists():
-            return True  # İlk çalıştırmada her zaman SOTA
-            
-        with open(sota_file, 'r') as f:
-            current_best = float(f.readline().split('"')[1].split()[0])
-            
-        return self.performance > current_best
+        return self._evaluate(self.current_best())['project']
     
     def find_hardware_info_dir(self):
-        """hardware_info.md dosyasının bulunduğu dizini bul"""
+        """hardware_info.md dosyasının bulunduğu dizini bul (kayıt defterinde önbelleğe alınır)"""
+        if self.registry is not None:
+            return self.registry.hardware_dir(self.current_dir)
         current = self.current_dir
         while current != current.parent:
             if (current / "hardware_info.md").exists():
@@ -124,7 +185,7 @@ class SOTAChecker:
         return None
     
     def find_project_root(self):
-        """VibeCodeHPC kökünü bul"""
+        """VibeCodeHPC kökünü bul (yalnızca yol adlarına bakılır)"""
         current = self.current_dir
         while current != current.parent:
             if current.name.startswith("VibeCodeHPC"):
@@ -133,62 +194,110 @@ class SOTAChecker:
         return None
     
     def update_sota_files(self, version, timestamp, agent_id):
-        """SOTA güncellemesinde her katman dosyasını güncelle"""
-        sota_info = {
-            'local': self.check_local_sota(),
-            'parent': self.check_parent_sota(),
-            'hardware': self.check_hardware_sota(),
-            'project': self.check_project_sota()
-        }
+        """SOTA güncellemesinde her katman dosyasını güncelle
+        
+        Kayıt defteri işlemi içinde (yazanlar sıraya girer) en iyiler yeniden okunur, karşılaştırılır
+        ve dosyalar karşılaştır-ve-yaz ile güncellenir. Aynı anda biten PG'lerden yalnızca gerçekten
+        daha iyi olanı SOTA olur.
+        
+        Returns:
+            {katman: bu çağrı SOTA'yı güncellediyse True} (parent yalnızca değerlendirmedir)
+        """
+        registry = self.registry
+        if registry is None:
+            return self._update_sota_files(version, timestamp, agent_id)
+        with registry.transaction():
+            return self._update_sota_files(version, timestamp, agent_id)
+    
+    def _update_sota_files(self, version, timestamp, agent_id):
+        sota_info = self._evaluate(self.current_best())
         
         if sota_info['local']:
-            self.update_local_sota(version, timestamp, agent_id)
+            sota_info['local'] = self.update_local_sota(version, timestamp, agent_id)
         
         if sota_info['hardware']:
-            self.update_hardware_sota(version, timestamp, agent_id)
+            sota_info['hardware'] = self.update_hardware_sota(version, timestamp, agent_id)
         
         if sota_info['project']:
-            self.update_project_sota(version, timestamp, agent_id)
+            sota_info['project'] = self.update_project_sota(version, timestamp, agent_id)
         
         return sota_info
     
+    def version_record(self, version):
+        """Sürümün bu dizindeki ChangeLog.md kaydı (oluşturma zamanı, doğruluk, hata; yoksa {})"""
+        if self._changelog_records is None:
+            try:
+                content = (self.current_dir / "ChangeLog.md").read_text(encoding='utf-8')
+                self._changelog_records = parse_changelog_text(content, self.metrics)
+            except (OSError, UnicodeDecodeError):
+                self._changelog_records = []
+        wanted = str(version).lstrip('v')
+        for record in self._changelog_records:
+            if record['version'] == wanted or record['title'] == version:
+                return record
+        return {}
+    
+    def _write_sota(self, scope, sota_file, fields, version, timestamp, agent_id):
+        """Karşılaştır-ve-yaz; yazıldıysa kayıt defterine işle ve geçişi günlüğe ekle
+        
+        Günlüğe sürümün ChangeLog.md'deki oluşturma zamanı (yoksa değerlendirme zamanı) ve
+        doğruluk/hata değerleri yazılır; görselleştirici sürümü ChangeLog'daki konumunda çizer.
+        """
+        written, previous = cas_sota_file(sota_file, self.performance, fields, self.metrics.target)
+        registry = self.registry
+        if registry is not None:
+            with registry.transaction():
+                registry.record(sota_file)
+            if written:
+                record = self.version_record(version)
+                accuracy = self.accuracy if self.accuracy is not None else record.get('accuracy')
+                SOTAHistory(registry.project_root).append(
+                    scope, registry.key(sota_file.parent), self.performance,
+                    version, agent_id, record.get('generation_time') or timestamp, previous=previous,
+                    unit=self.metrics.target.unit, accuracy=accuracy, error=record.get('error'))
+        return written
+    
     def update_local_sota(self, version, timestamp, agent_id):
         """Yerel SOTA dosyası güncellemesi"""
         sota_file = self.current_dir / "sota_local.txt"
-        with open(sota_file, 'w') as f:
-            f.write(f'current_best: "{self.performance} GFLOPS"\n')
-            f.write(f'achieved_by: "{version}"\n')
-            f.write(f'timestamp: "{timestamp}"\n')
-            f.write(f'agent_id: "{agent_id}"\n')
+        return self._write_sota('local', sota_file, {
+            'achieved_by': version,
+            'timestamp': timestamp,
+            'agent_id': agent_id,
+        }, version, timestamp, agent_id)
     
     def update_hardware_sota(self, version, timestamp, agent_id):
         """Donanım SOTA dosyası güncellemesi"""
         hardware_dir = self.find_hardware_info_dir()
-        if hardware_dir:
-            sota_file = hardware_dir / "sota_hardware.txt"
-            with open(sota_file, 'w') as f:
-                f.write(f'current_best: "{self.performance} GFLOPS"\n')
-                f.write(f'achieved_by: "{agent_id}"\n')
-                f.write(f'timestamp: "{timestamp}"\n')
-                f.write(f'hardware_path: "{self.get_hardware_path()}"\n')
-                f.write(f'strategy: "{self.get_strategy()}"\n')
+        if not hardware_dir:
+            return False
+        sota_file = hardware_dir / "sota_hardware.txt"
+        return self._write_sota('hardware', sota_file, {
+            'achieved_by': agent_id,
+            'timestamp': timestamp,
+            'hardware_path': self.get_hardware_path(),
+            'strategy': self.get_strategy(),
+        }, version, timestamp, agent_id)
     
     def update_project_sota(self, version, timestamp, agent_id):
         """Proje SOTA dosyası güncellemesi"""
         project_root = self.find_project_root()
-        if project_root:
-            sota_file = project_root / "sota_project.txt"
-            with open(sota_file, 'w') as f:
-                f.write(f'current_best: "{self.performance} GFLOPS"\n')
-                f.write(f'achieved_by: "{agent_id}"\n')
-                f.write(f'timestamp: "{timestamp}"\n')
-                f.write(f'hardware_path: "{self.get_hardware_path()}"\n')
-                f.write(f'strategy: "{self.get_strategy()}"\n')
-            
-            history_file = project_root / "history" / "sota_project_history.txt"
-            history_file.parent.mkdir(exist_ok=True)
-            with open(history_file, 'a') as f:
-                f.write(f'[{timestamp}] {self.performance} GFLOPS by {agent_id} ({self.get_strategy()})\n')
+        if not project_root:
+            return False
+        sota_file = project_root / "sota_project.txt"
+        if not self._write_sota('project', sota_file, {
+            'achieved_by': agent_id,
+            'timestamp': timestamp,
+            'hardware_path': self.get_hardware_path(),
+            'strategy': self.get_strategy(),
+        }, version, timestamp, agent_id):
+            return False
+        
+        history_file = project_root / "history" / "sota_project_history.txt"
+        history_file.parent.mkdir(exist_ok=True)
+        with open(history_file, 'a') as f:
+            f.write(f'[{timestamp}] {self.metrics.target.format(self.performance)} by {agent_id} ({self.get_strategy()})\n')
+        return True
 
     def get_hardware_path(self):
         """Donanım yolunu al"""
@@ -212,53 +321,10 @@ def get_virtual_parent_sota(current_dir):
     
     Örnek: OpenMP_MPI📁 durumunda, ../MPI📁 ve ../OpenMP📁 referans alınır
     """
-    current_path = Path(current_dir)
-    
-    # PG_visible_dir.md dosyasını bul
-    visible_file = current_path / "PG_visible_dir.md"
-    if not visible_file.exists():
+    best = SOTAChecker(current_dir).current_best()['parent']
+    if not best:
         return 0.0, None
-    
-    # Virtual parent yollarını çıkar
-    def parse_virtual_parent_paths(md_file):
-        with open(md_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        virtual_parent_section = False
-        paths = []
-        
-        for line in lines:
-            line = line.strip()
-            if "### Virtual parent" in line:
-                virtual_parent_section = True
-                continue
-            elif line.startswith("###") and virtual_parent_section:
-                break
-            elif virtual_parent_section and line.startswith("../") and "📁" in line:
-                path = line.split("📁")[0]
-                paths.append(path)
-        
-        return paths
-    
-    virtual_parent_paths = parse_virtual_parent_paths(visible_file)
-    
-    parent_sota = 0.0
-    best_info = None
-    
-    for path in virtual_parent_paths:
-        full_path = current_path / path
-        if full_path.exists():
-            for sota_file in full_path.glob("*/sota_local.txt"):
-                try:
-                    with open(sota_file, 'r') as f:
-                        perf = float(f.readline().split('"')[1].split()[0])
-                        if perf > parent_sota:
-                            parent_sota = perf
-                            best_info = str(sota_file)
-                except (ValueError, IndexError):
-                    continue
-    
-    return parent_sota, best_info
+    return best['performance'], best.get('source')
 
 # CLI yürütme desteği
 if __name__ == "__main__":
@@ -267,25 +333,58 @@ if __name__ == "__main__":
     
     if len(sys.argv) < 2:
         print("Kullanım:")
-        print("  python sota_checker.py <performans> [dizin] [sürüm] [agent_id]")
+        print("  python sota_checker.py <performans> [dizin] [sürüm] [agent_id] [--accuracy <yüzde>]")
         print("  Örnek: python sota_checker.py '350.0 GFLOPS'")
         print("  Örnek: python sota_checker.py '350.0 GFLOPS' . v1.2.3 PG1.1")
+        print("  Örnek: python sota_checker.py '12.5 s' . v1.2.4 PG1.1 --accuracy 99.2")
+        print("  Kayıt defterini sota_*.txt dosyalarından yeniden oluştur:")
+        print("  python sota_checker.py --rebuild-registry [dizin]")
         sys.exit(1)
     
-    performance = sys.argv[1]
-    directory = sys.argv[2] if len(sys.argv) > 2 else os.getcwd()
-    version = sys.argv[3] if len(sys.argv) > 3 else "unknown"
-    agent_id = sys.argv[4] if len(sys.argv) > 4 else "unknown"
+    if sys.argv[1] == '--rebuild-registry':
+        checker = SOTAChecker(sys.argv[2] if len(sys.argv) > 2 else os.getcwd())
+        if checker.registry is None:
+            print("Proje kökü bulunamadı (VibeCodeHPC*)")
+            sys.exit(1)
+        checker.registry.rebuild()
+        for scope in ('project', 'hardware', 'parent', 'local'):
+            print(f"  {scope:10s}: {len(checker.registry.scopes(scope))} kayıt")
+        sys.exit(0)
+    
+    args = sys.argv[1:]
+    accuracy = None
+    if '--accuracy' in args:
+        i = args.index('--accuracy')
+        accuracy = float(args[i + 1])
+        del args[i:i + 2]
+    
+    performance = args[0]
+    directory = args[1] if len(args) > 1 else os.getcwd()
+    version = args[2] if len(args) > 2 else "unknown"
+    agent_id = args[3] if len(args) > 3 else "unknown"
     
     checker = SOTAChecker(directory)
-    results = checker.check_sota_levels(performance)
+    try:
+        results = checker.check_sota_levels(performance, accuracy)
+    except ValueError as e:
+        print(f"Hata: {e}")
+        sys.exit(1)
     
-    print(f"SOTA değerlendirme sonucu ({performance}):")
+    metric = checker.metrics.target
+    print(f"SOTA değerlendirme sonucu ({performance} → {metric.format(checker.performance)}, "
+          f"{'büyük' if metric.higher_is_better else 'küçük'} daha iyi):")
+    if not checker.metrics.passes_accuracy(accuracy):
+        print(f"  Doğruluk %{accuracy} eşiğin (%{checker.metrics.accuracy_threshold}) altında, SOTA sayılmaz")
     for level, is_sota in results.items():
         status = "✓ NEW SOTA!" if is_sota else "- no update"
         print(f"  {level:10s}: {status}")
     
     if any(results.values()):
         timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-        checker.update_sota_files(version, timestamp, agent_id)
-        print(f"\nSOTA dosyası güncellendi (zaman damgası: {timestamp})")
+        updated = checker.update_sota_files(version, timestamp, agent_id)
+        # Aynı anda daha iyi bir sonuç yazılmışsa değerlendirme güncellemede değişebilir
+        lost = [level for level in ('local', 'hardware', 'project') if results[level] and not updated[level]]
+        if lost:
+            print(f"\nBu arada daha iyi bir sonuç kaydedildi, güncellenmedi: {', '.join(lost)}")
+        if any(updated[level] for level in ('local', 'hardware', 'project')):
+            print(f"\nSOTA dosyası güncellendi (zaman damgası: {timestamp})")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+SOTA geçişlerinin yalnızca eklenen yapılandırılmış günlüğü (history/sota_history.jsonl)
+
+sota_checker.py her katmanda (local/hardware/project) SOTA güncellendiğinde bir satır ekler:
+{"ts": "2025-08-20T01:05:00Z", "scope": "local", "key": "Flow/.../intel2024/OpenMP",
+ "value": 350.0, "unit": "GFLOPS", "previous": 300.0, "version": "v1.2.3",
+ "agent_id": "PG1.1", "timestamp": "2025-08-20T01:00:00Z", "accuracy": 99.9, "error": 1e-12}
+
+- ts: geçişin kaydedildiği UTC zamanı, key: kapsam dizini (proje köküne göre, '' = kök)
+- timestamp: sürümün ChangeLog.md'deki oluşturma zamanı (bilinmiyorsa değerlendirme zamanı);
+  grafikler bu zamanı kullanır, böylece sürüm her iki kaynaktan da aynı x konumunda çizilir
+- accuracy / error: biliniyorsa (doğruluk filtresi ve hata çubukları için)
+- Satırlar flock altında O_APPEND ile tek yazımda eklenir ve fsync edilir
+- replay() günlüğü sırayla okur (yazılmakta olan yarım son satır atlanır)
+- entries() kayıtları sota_visualizer.py girdi biçimine çevirir; _extract_sota_progression ve
+  _aggregate_sota_by_time bu girdileri ChangeLog'ları yeniden ayrıştırmadan doğrudan kullanır
+"""
+
+import fcntl
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+HISTORY_RELATIVE_PATH = Path("history") / "sota_history.jsonl"
+DEFAULT_UNIT = "GFLOPS"
+
+
+def parse_time(text: Any) -> Optional[datetime]:
+    """'2025-08-20T01:00:00Z' ya da '2025-08-20 01:00:00 UTC' → UTC datetime (okunamazsa None)"""
+    if not isinstance(text, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.strip().replace('Z', '+00:00').replace(' UTC', '+00:00'))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class SOTAHistory:
+    """SOTA geçiş günlüğü (ekleme ve yeniden oynatma)"""
+
+    def __init__(self, project_root: Path, path: Optional[Path] = None):
+        self.project_root = Path(project_root)
+        self.path = path or self.project_root / HISTORY_RELATIVE_PATH
+
+    def append(self, scope: str, key: str, value: float, version: str, agent_id: str,
+               timestamp: str, previous: Optional[float] = None, unit: str = DEFAULT_UNIT,
+               accuracy: Optional[float] = None, error: Optional[float] = None) -> Dict:
+        """Bir SOTA geçişini günlüğe ekle
+
+        Args:
+            timestamp: Sürümün oluşturma zamanı (ChangeLog.md; bilinmiyorsa değerlendirme zamanı)
+
+        Returns:
+            Eklenen kayıt
+        """
+        record = {
+            'ts': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'scope': scope,
+            'key': key,
+            'value': value,
+            'unit': unit,
+            'previous': previous,
+            'version': version,
+            'agent_id': agent_id,
+            'timestamp': timestamp,
+        }
+        if accuracy is not None:
+            record['accuracy'] = accuracy
+        if error is not None:
+            record['error'] = error
+        line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+        return record
+
+    def replay(self, scope: Optional[str] = None, keys: Optional[Iterable[str]] = None,
+               offset: int = 0) -> Iterator[Dict]:
+        """Kayıtları günlük sırasıyla döndür
+
+        Args:
+            scope: Yalnızca bu kapsam (None: hepsi)
+            keys: Yalnızca bu kapsam dizinleri (None: hepsi)
+            offset: Bu bayt konumundan itibaren oku (önceki okumanın 'offset' değeri)
+
+        Her kayda, kendisinden sonraki bayt konumu '_offset' olarak eklenir; artımlı okuyucular
+        son kaydın '_offset' değerini bir sonraki çağrıya verebilir.
+        """
+        key_set = set(keys) if keys is not None else None
+        try:
+            f = open(self.path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            f.seek(offset)
+            position = offset
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Yazılmakta olan son satır
+                position += len(line)
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if scope is not None and record.get('scope') != scope:
+                    continue
+                if key_set is not None and record.get('key') not in key_set:
+                    continue
+                record['_offset'] = position
+                yield record
+
+    def first_logged(self, scope: Optional[str] = None) -> Dict[str, datetime]:
+        """Kapsam dizini başına günlüğe yazılan ilk geçişin zamanı ('ts')
+
+        Bu andan önceki sürümler günlükte yoktur; okuyucular onları ChangeLog.md'den almalıdır.
+        """
+        first: Dict[str, datetime] = {}
+        for record in self.replay(scope):
+            if record.get('key') in first:
+                continue
+            logged = parse_time(record.get('ts'))
+            if logged is not None:
+                first[record['key']] = logged
+        return first
+
+    def entries(self, start_time: datetime, scope: str = 'local',
+                keys: Optional[Iterable[str]] = None, unit: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """Kapsam dizini başına görselleştirme girdileri (geçiş sırasıyla)
+
+        Args:
+            start_time: Proje başlangıç zamanı (elapsed_seconds için)
+            unit: Yalnızca bu birimdeki kayıtlar (None: hepsi; proje metriği değiştiyse eski kayıtlar atlanır)
+
+        Zaman, sürümün oluşturma zamanıdır ('timestamp'; okunamazsa kaydedildiği an 'ts').
+
+        Returns:
+            {kapsam dizini: [{'version', 'performance', 'timestamp', 'elapsed_seconds', 'agent_id',
+                              ['accuracy'], ['error']}]}
+        """
+        result: Dict[str, List[Dict]] = {}
+        for record in self.replay(scope, keys):
+            if unit is not None and record.get('unit', DEFAULT_UNIT) != unit:
+                continue
+            timestamp = parse_time(record.get('timestamp')) or parse_time(record.get('ts'))
+            try:
+                performance = float(record['value'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if timestamp is None or 'key' not in record:
+                continue
+            entry = {
+                'version': record.get('version'),
+                'performance': performance,
+                'timestamp': timestamp,
+                'elapsed_seconds': (timestamp - start_time).total_seconds(),
+                'agent_id': record.get('agent_id'),
+            }
+            for key in ('accuracy', 'error'):
+                if record.get(key) is not None:
+                    entry[key] = record[key]
+            result.setdefault(record['key'], []).append(entry)
+        return result
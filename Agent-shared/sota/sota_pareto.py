@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Sürüm başına performans × doğruluk/hata × bütçe maliyeti Pareto cephesi
+
+Tek bir monoton SOTA yerine, hiçbir amaçta daha kötü olmadan en az birinde daha iyi olan başka
+bir sürümün bulunmadığı sürümler (baskın olmayanlar) listelenir. PM böylece yalnızca en hızlı
+sürümü değil, harcadığı bütçeye değen sürümleri görür.
+
+Amaçlar:
+- performance: projenin metriği (metric_registry.py; yönü metrikten gelir)
+- cost: sürümün işlerinin tükettiği puan (budget_tracker.py, küçük daha iyi)
+- accuracy: kapsamda en az bir sürümde varsa (büyük daha iyi; eksikse 100 kabul edilir)
+- error: kapsamda en az bir sürümde varsa (küçük daha iyi; eksikse 0 kabul edilir)
+
+Maliyeti bilinmeyen (iş bloğu olmayan/başlamamış) ve doğruluk eşiğini geçemeyen sürümler
+cepheye girmez.
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "change_log"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "budget"))
+from changelog_index import ChangeLogIndex
+from metric_registry import MetricRegistry
+from budget_tracker import BudgetTracker
+
+# Eksik değerlerin varsayılanı (sota_visualizer.py doğruluk filtresiyle aynı)
+MISSING_DEFAULTS = {'accuracy': 100.0, 'error': 0.0}
+
+
+def objectives_for(points: List[Dict], higher_is_better: bool) -> List[Tuple[str, bool]]:
+    """Kapsamın amaçları: (anahtar, büyük daha iyi mi)"""
+    objectives = [('performance', higher_is_better), ('cost', False)]
+    if any('accuracy' in p for p in points):
+        objectives.append(('accuracy', True))
+    if any('error' in p for p in points):
+        objectives.append(('error', False))
+    return objectives
+
+
+def _score(point: Dict, objectives: List[Tuple[str, bool]]) -> Tuple[float, ...]:
+    """Tüm amaçları 'küçük daha iyi' olacak biçimde çevir"""
+    return tuple(-value if higher else value
+                 for value, higher in ((point.get(key, MISSING_DEFAULTS.get(key)), higher)
+                                       for key, higher in objectives))
+
+
+def dominates(a: Tuple[float, ...], b: Tuple[float, ...]) -> bool:
+    """a, b'ye baskın mı (hiçbir amaçta kötü değil, en az birinde daha iyi)"""
+    return all(x <= y for x, y in zip(a, b)) and a != b
+
+
+def pareto_front(points: List[Dict], objectives: List[Tuple[str, bool]]) -> Tuple[List[Dict], List[Dict]]:
+    """Noktaları baskın olmayan (cephe) ve baskın olunan olarak ayır
+
+    Puanlar sözlük sırasına göre dizilir; böylece bir nokta kendinden sonra gelen bir noktaya
+    baskın olunamaz ve yalnızca o ana kadarki cepheyle karşılaştırmak yeterlidir
+    (O(n · cephe boyutu)).
+
+    Returns:
+        (cephe: maliyete göre artan, baskın olunanlar)
+    """
+    scored = sorted(((_score(p, objectives), i, p) for i, p in enumerate(points)),
+                    key=lambda item: (item[0], item[1]))
+    front: List[Tuple[Tuple[float, ...], Dict]] = []
+    dominated = []
+    for score, _, point in scored:
+        if any(dominates(other, score) for other, _ in front):
+            dominated.append(point)
+        else:
+            front.append((score, point))
+    return sorted((point for _, point in front), key=lambda p: p['cost']), dominated
+
+
+def collect_points(project_root: Path, metrics: Optional[MetricRegistry] = None,
+                   costs: Optional[Dict[Tuple[str, str], float]] = None) -> Tuple[List[Dict], Dict[str, int]]:
+    """ChangeLog.md sürümlerinden Pareto noktaları
+
+    Args:
+        costs: {(ChangeLog yolu, sürüm): puan}; None ise BudgetTracker ile hesaplanır
+
+    Returns:
+        (noktalar, atlanan sürüm sayıları {'no_value', 'gated', 'no_cost'})
+        Nokta: {'path', 'version', 'performance', 'cost', ['accuracy'], ['error']}
+    """
+    project_root = Path(project_root)
+    metrics = metrics or MetricRegistry.for_project(project_root)
+    if costs is None:
+        costs = BudgetTracker(project_root).version_points()
+
+    index = ChangeLogIndex(project_root)
+    try:
+        index.refresh()
+        indexed = index.entries(exclude=('Agent-shared',))
+    finally:
+        index.close()
+
+    points = []
+    skipped = {'no_value': 0, 'gated': 0, 'no_cost': 0}
+    for changelog_path, records in indexed.items():
+        for record in records:
+            value = record.get('measurements', {}).get(metrics.target.name)
+            if value is None:
+                skipped['no_value'] += 1
+                continue
+            if not metrics.passes_accuracy(record.get('accuracy')):
+                skipped['gated'] += 1
+                continue
+            cost = costs.get((changelog_path, record['version']))
+            if cost is None:
+                skipped['no_cost'] += 1
+                continue
+            point = {'path': Path(changelog_path).parent.as_posix(), 'version': record['title'],
+                     'performance': value, 'cost': cost}
+            for key in ('accuracy', 'error'):
+                if key in record:
+                    point[key] = record[key]
+            points.append(point)
+    return points, skipped
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+SOTA ilerlemesinin (zaman sırasında en iyiyi güncelleyen girdiler) NumPy ile toplu hesaplanması
+
+sota_visualizer.py girdileri dizin başına sözlük listeleri olarak toplar; aynı girdiler hardware
+(derleyici ve donanım geneli), family ve project seviyelerinde tekrar tekrar sıralanıp taranır.
+EntryTable girdileri bir kez sütun dizilerine (geçen süre, performans, dizin no) çevirir;
+progressions() bir gruplamanın tüm gruplarını tek sıralama ve tek birikimli maksimum ile hesaplar.
+
+Gruplar içinde sıralama ve eşitlik kuralları Python sürümüyle aynıdır:
+- Grupta zamanı olan girdi varsa zamansız girdiler atlanır; hiç yoksa özgün sıra korunur
+- Aynı zamandaki girdiler özgün sırayı korur (kararlı sıralama)
+- Yalnızca o ana kadarki en iyiden kesin olarak daha iyi olan girdi SOTA'dır (eşitler sayılmaz)
+"""
+
+from typing import Dict, Hashable, List, Optional
+
+import numpy as np
+
+
+def segmented_progression(groups: np.ndarray, elapsed: np.ndarray, performance: np.ndarray,
+                          higher_is_better: bool = True) -> np.ndarray:
+    """Gruplara bölünmüş girdilerde SOTA'yı güncelleyen girdilerin indeksleri
+
+    Args:
+        groups: Girdi başına grup no (>= 0; < 0 olan girdiler hiçbir gruba girmez)
+        elapsed: Geçen süre (NaN: zaman bilgisi yok)
+        performance: Metriğin temel birimindeki değer (NaN girdiler atlanır)
+
+    Returns:
+        Grup no, sonra zaman sırasıyla SOTA girdilerinin indeksleri
+    """
+    groups = np.asarray(groups, dtype=np.int64)
+    elapsed = np.asarray(elapsed, dtype=float)
+    performance = np.asarray(performance, dtype=float)
+
+    candidates = np.flatnonzero((groups >= 0) & ~np.isnan(performance))
+    if candidates.size == 0:
+        return candidates
+
+    group = groups[candidates]
+    timed = ~np.isnan(elapsed[candidates])
+    # Zamanı olan girdisi bulunan gruplarda zamansız girdiler atlanır
+    group_has_time = np.bincount(group, weights=timed, minlength=group.max() + 1) > 0
+    keep = timed | ~group_has_time[group]
+    candidates, group = candidates[keep], group[keep]
+
+    # Grup, sonra zaman (zamansız gruplarda hepsi inf → özgün sıra); lexsort kararlıdır
+    times = np.where(np.isnan(elapsed[candidates]), np.inf, elapsed[candidates])
+    order = np.lexsort((times, group))
+    candidates, group = candidates[order], group[order]
+
+    # Değerleri yoğun sıralara çevir (eşit değer → eşit sıra) ve grup no ile kaydır: grup
+    # sırayla dizildiği için birikimli maksimum hiçbir zaman önceki grubun değerini taşımaz
+    values = performance[candidates]
+    _, ranks = np.unique(values if higher_is_better else -values, return_inverse=True)
+    keys = group * (int(ranks.max()) + 1) + ranks.reshape(-1)
+    running = np.maximum.accumulate(keys)
+
+    improved = np.empty(len(keys), dtype=bool)
+    improved[0] = True
+    improved[1:] = (keys[1:] > running[:-1]) | (group[1:] != group[:-1])
+    return candidates[improved]
+
+
+class EntryTable:
+    """Dizin başına girdilerin sütun dizileri (girdi sözlükleri değiştirilmeden tutulur)"""
+
+    def __init__(self, entries_by_path: Dict[str, List[Dict]]):
+        self.paths = list(entries_by_path)
+        self.entries: List[Dict] = [entry for entries in entries_by_path.values() for entry in entries]
+        self.path_ids = np.repeat(np.arange(len(self.paths)),
+                                  [len(entries) for entries in entries_by_path.values()])
+        self.elapsed = np.array([entry.get('elapsed_seconds', np.nan) for entry in self.entries], dtype=float)
+        self.performance = np.array([np.nan if entry.get('performance') is None else entry['performance']
+                                     for entry in self.entries], dtype=float)
+
+    def progressions(self, group_of_path: Dict[str, Hashable],
+                     higher_is_better: bool = True) -> Dict[Hashable, List[Dict]]:
+        """Bir gruplamanın tüm gruplarının SOTA ilerlemeleri (tek geçiş)
+
+        Args:
+            group_of_path: {dizin: grup anahtarı}; listede olmayan dizinler atlanır.
+                Bir grubun girdileri dizinlerin tablodaki sırasıyla birleştirilmiş kabul edilir.
+
+        Returns:
+            {grup anahtarı: SOTA girdileri (zaman sırasıyla)}; ilerlemesi boş gruplar yer almaz
+        """
+        keys: List[Hashable] = []
+        key_ids: Dict[Hashable, int] = {}
+        path_groups = np.full(len(self.paths), -1, dtype=np.int64)
+        for path_id, path in enumerate(self.paths):
+            key = group_of_path.get(path)
+            if key is None:
+                continue
+            if key not in key_ids:
+                key_ids[key] = len(keys)
+                keys.append(key)
+            path_groups[path_id] = key_ids[key]
+
+        result: Dict[Hashable, List[Dict]] = {}
+        if not keys or not self.entries:
+            return result
+        indices = segmented_progression(path_groups[self.path_ids], self.elapsed, self.performance,
+                                        higher_is_better)
+        for index in indices:
+            result.setdefault(keys[path_groups[self.path_ids[index]]], []).append(self.entries[index])
+        return result
+
+    def progression(self, paths: Optional[List[str]] = None, higher_is_better: bool = True) -> List[Dict]:
+        """Tek bir grubun (None: tüm dizinler) SOTA ilerlemesi"""
+        members = self.paths if paths is None else paths
+        return self.progressions({path: 0 for path in members}, higher_is_better).get(0, [])
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+SOTA dosyalarının atomik güncellenmesi ve proje başına SOTA kayıt defteri
+
+sota_*.txt dosyaları:
+- read_sota_file(): bozuk/yarım dosyada hata yerine None döner
+- cas_sota_file(): karşılaştır-ve-yaz; dizin kilidi (flock) altında dosya yeniden okunur,
+  yeni değer daha iyiyse geçici dosyaya yazılır, fsync edilir ve yeniden adlandırılır.
+  Aynı anda biten iki PG'den yalnızca gerçekten daha iyi olanı kazanır
+
+Kayıt defteri (.cache/sota_registry.sqlite):
+- local / parent / hardware / project kapsamlarının her biri için mevcut en iyi değer
+- parent kapsamı = local dizinin üst dizini (PG_visible_dir.md'deki ../MPI📁 gibi sanal
+  ebeveynin altındaki tüm local dizinlerin en iyisi); local güncellendikçe indeksli MAX ile yenilenir
+- Dört katman tek sorguyla yanıtlanır; PG dizini sayısı arttıkça dosya taraması gerekmez
+- Güncellemeler BEGIN IMMEDIATE işlemi içinde yapılır (yazanlar sıraya girer)
+- "En iyi" projenin metriğine göre belirlenir (metric_registry.py: büyük ya da küçük daha iyi);
+  değerler metriğin temel biriminde yazılır
+- Doğrudan düzenlenen sota_*.txt dosyaları mtime + boyut ile fark edilip yeniden okunur
+  (okunamayan dosyada son geçerli kayıt korunur); ilk açılışta proje ağacındaki mevcut
+  dosyalar bir kez içe aktarılır
+- Hedef metriğin özeti saklanır; metrik değişirse dosyalar yeniden içe aktarılır. Birimi başka
+  bir metriğe ait sota_*.txt değerleri (ör: metrik time iken "350.0 GFLOPS") kayıt yokmuş gibi sayılır
+"""
+
+import fcntl
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "change_log"))
+from changelog_index import SKIP_DIRS
+from metric_registry import BUILTIN_METRICS, DEFAULT_METRIC, Metric
+
+REGISTRY_SCHEMA_VERSION = 2
+REGISTRY_FILENAME = "sota_registry.sqlite"
+DIR_LOCK_FILENAME = ".sota.lock"
+
+# Dosya adı → kapsam
+SOTA_FILES = {
+    'sota_local.txt': 'local',
+    'sota_hardware.txt': 'hardware',
+    'sota_project.txt': 'project',
+}
+
+
+# ---- sota_*.txt dosyaları ----
+
+def read_sota_file(path: Path, metric: Optional[Metric] = None) -> Optional[Dict[str, str]]:
+    """sota_*.txt dosyasını oku ('key: "değer"' satırları)
+
+    Args:
+        metric: Verilirse 'performance' metriğin temel birimine çevrilir; birim metriğe ait
+            değilse (metrik değişmişse) dosya değer yokmuş gibi kabul edilir
+
+    Returns:
+        Alanlar ve 'performance' (float); dosya yoksa ya da current_best okunamıyorsa None
+    """
+    try:
+        text = Path(path).read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
+    fields = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(':')
+        if sep and value.strip().startswith('"'):
+            fields[key.strip()] = value.strip().strip('"')
+    try:
+        parts = fields['current_best'].split()
+        fields['performance'] = float(parts[0])
+        if metric is not None and len(parts) > 1:
+            fields['performance'] = metric.to_base(fields['performance'], parts[1])
+    except (KeyError, IndexError, ValueError):
+        return None
+    return fields
+
+
+def read_sota_value(path: Path, metric: Optional[Metric] = None) -> Optional[float]:
+    """sota_*.txt dosyasındaki en iyi performans (yok/bozuksa ya da birimi metriğe ait değilse None)"""
+    fields = read_sota_file(path, metric)
+    return fields['performance'] if fields else None
+
+
+def format_sota_file(performance: float, fields: Dict[str, str], unit: str = "GFLOPS") -> str:
+    """current_best + sıralı alanlardan dosya içeriği"""
+    lines = [f'current_best: "{performance} {unit}"']
+    lines += [f'{key}: "{value}"' for key, value in fields.items()]
+    return '\n'.join(lines) + '\n'
+
+
+@contextmanager
+def directory_lock(directory: Path):
+    """Dizindeki sota_*.txt yazımları için süreçler arası kilit (flock, bloklayan)"""
+    fd = os.open(Path(directory) / DIR_LOCK_FILENAME, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def write_atomic(path: Path, content: str):
+    """Geçici dosyaya yaz, fsync et ve yeniden adlandır (okuyucular yarım dosya görmez)"""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp_path.replace(path)
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except OSError:
+        pass  # Dizin fsync'i desteklenmiyorsa yeniden adlandırma yine atomiktir
+
+
+def cas_sota_file(path: Path, performance: float, fields: Dict[str, str],
+                  metric: Optional[Metric] = None) -> Tuple[bool, Optional[float]]:
+    """Karşılaştır-ve-yaz: dosyadaki değerden daha iyiyse yaz
+
+    Kilit → yeniden oku → karşılaştır → geçici dosya → fsync → yeniden adlandır.
+    Bozuk dosya değer yokmuş gibi kabul edilir (üzerine yazılır).
+
+    Args:
+        metric: Karşılaştırma yönü ve birimi (None: GFLOPS, büyük daha iyi)
+
+    Returns:
+        (yazıldıysa True, kilit altında okunan önceki değer); dosyada eşit ya da daha iyi değer
+        varsa (False, o değer). Önceki değer geçiş günlüğünün 'previous' alanıdır
+    """
+    metric = metric or BUILTIN_METRICS[DEFAULT_METRIC]
+    path = Path(path)
+    with directory_lock(path.parent):
+        previous = read_sota_value(path, metric)
+        if not metric.better(performance, previous):
+            return False, previous
+        write_atomic(path, format_sota_file(performance, fields, metric.unit))
+        return True, previous
+
+
+# ---- Kayıt defteri ----
+
+class SOTARegistry:
+    """Proje başına SOTA kayıt defteri (kapsam başına en iyi değer)"""
+
+    def __init__(self, project_root: Path, cache_path: Optional[Path] = None,
+                 metric: Optional[Metric] = None):
+        self.project_root = Path(project_root)
+        self.metric = metric or BUILTIN_METRICS[DEFAULT_METRIC]
+        self.cache_path = cache_path or self.project_root / ".cache" / REGISTRY_FILENAME
+        self._connect()
+        self._check_metric()
+
+    def _connect(self):
+        """SQLite bağlantısını aç (yazılamıyorsa bellek içi kayıt defterine düş)
+
+        Otomatik işlem kapalıdır; işlemler transaction() ile açıkça yönetilir.
+        """
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(self.cache_path), timeout=30, isolation_level=None)
+            self._ensure_schema()
+        except (OSError, sqlite3.Error) as e:
+            print(f"SOTA kayıt defteri açılamadı ({e}), bellek içi kayıt defteri kullanılıyor", flush=True)
+            self.conn = sqlite3.connect(':memory:', isolation_level=None)
+            self._ensure_schema()
+
+    def _ensure_schema(self):
+        """Şema sürümü farklıysa tabloları yeniden oluştur ve mevcut dosyaları içe aktar
+
+        İçe aktarma şemayla aynı işlemde yapılır; diğer süreçler yarım kayıt defteri görmez.
+        """
+        conn = self.conn
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == REGISTRY_SCHEMA_VERSION:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Başka bir süreç şemayı bu arada oluşturmuş olabilir
+            if conn.execute("PRAGMA user_version").fetchone()[0] == REGISTRY_SCHEMA_VERSION:
+                conn.execute("COMMIT")
+                return
+            conn.execute("DROP TABLE IF EXISTS best")
+            conn.execute("DROP TABLE IF EXISTS files")
+            conn.execute("DROP TABLE IF EXISTS locations")
+            conn.execute("DROP TABLE IF EXISTS meta")
+            conn.execute("""CREATE TABLE meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL)""")
+            conn.execute("""CREATE TABLE best (
+                scope TEXT NOT NULL,
+                key TEXT NOT NULL,
+                parent TEXT,
+                performance REAL NOT NULL,
+                achieved_by TEXT,
+                agent_id TEXT,
+                timestamp TEXT,
+                source TEXT NOT NULL,
+                PRIMARY KEY (scope, key))""")
+            # parent kapsamının en iyisi local satırlarından tek indeks aramasıyla bulunur
+            conn.execute("CREATE INDEX best_parent ON best (scope, parent, performance)")
+            conn.execute("""CREATE TABLE files (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL)""")
+            conn.execute("""CREATE TABLE locations (
+                dir TEXT PRIMARY KEY,
+                hardware_dir TEXT NOT NULL)""")
+            conn.execute(f"PRAGMA user_version = {REGISTRY_SCHEMA_VERSION}")
+            conn.execute("INSERT INTO meta VALUES ('metric', ?)", (self.metric.fingerprint(),))
+            self._import_tree()
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _check_metric(self):
+        """Kayıtlar başka bir metrikle içe aktarıldıysa dosyaları yeniden içe aktar"""
+        current = self.metric.fingerprint()
+        query = "SELECT value FROM meta WHERE key = 'metric'"
+        row = self.conn.execute(query).fetchone()
+        if row and row[0] == current:
+            return
+        with self.transaction():
+            row = self.conn.execute(query).fetchone()  # Başka bir süreç bu arada yapmış olabilir
+            if row and row[0] == current:
+                return
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('metric', ?)", (current,))
+            self._import_tree()
+
+    @contextmanager
+    def transaction(self):
+        """Yazma işlemi (BEGIN IMMEDIATE: aynı anda tek yazan; iç içe çağrılar dıştakine katılır)"""
+        if self.conn.in_transaction:
+            yield
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def key(self, path: Path) -> str:
+        """Proje köküne göre yol anahtarı ('' = kök)"""
+        rel = os.path.relpath(os.path.normpath(str(path)), str(self.project_root))
+        return '' if rel == '.' else Path(rel).as_posix()
+
+    # ---- Dosya eşitleme ----
+
+    def _ingest(self, sota_file: Path, stat: Optional[os.stat_result]):
+        """Tek bir sota_*.txt dosyasını kayıt defterine yansıt (işlem içinde çağrılır)"""
+        scope = SOTA_FILES[sota_file.name]
+        file_key = self.key(sota_file)
+        dir_key = self.key(sota_file.parent)
+        fields = read_sota_file(sota_file, self.metric) if stat else None
+        if stat and fields is None and read_sota_file(sota_file) is None:
+            return  # Okunamayan (yarım/bozuk) dosya: son geçerli kayıt korunur
+        # Birimi başka bir metriğe ait dosya (fields None) kayıt yokmuş gibi silinir
+
+        previous = self.conn.execute("SELECT parent FROM best WHERE scope = ? AND key = ?",
+                                     (scope, dir_key)).fetchone()
+        if fields is None:
+            self.conn.execute("DELETE FROM best WHERE scope = ? AND key = ?", (scope, dir_key))
+        else:
+            parent = self.key(sota_file.parent.parent) if scope == 'local' else None
+            self.conn.execute(
+                "INSERT OR REPLACE INTO best VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (scope, dir_key, parent, fields['performance'], fields.get('achieved_by'),
+                 fields.get('agent_id'), fields.get('timestamp'), file_key))
+        if stat:
+            self.conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                              (file_key, stat.st_mtime_ns, stat.st_size))
+        else:
+            self.conn.execute("DELETE FROM files WHERE path = ?", (file_key,))
+
+        if scope == 'local':
+            parents = {self.key(sota_file.parent.parent)}
+            if previous and previous[0] is not None:
+                parents.add(previous[0])
+            for parent in parents:
+                self._refresh_parent(parent)
+
+    def _refresh_parent(self, parent: str):
+        """parent kapsamının en iyisini local satırlarından yeniden hesapla (indeksli)"""
+        best = self.conn.execute(
+            "SELECT performance, achieved_by, agent_id, timestamp, source FROM best "
+            f"WHERE scope = 'local' AND parent = ? ORDER BY performance {self.metric.sql_order} LIMIT 1",
+            (parent,)).fetchone()
+        if best is None:
+            self.conn.execute("DELETE FROM best WHERE scope = 'parent' AND key = ?", (parent,))
+        else:
+            self.conn.execute("INSERT OR REPLACE INTO best VALUES ('parent', ?, NULL, ?, ?, ?, ?, ?)",
+                              (parent, *best))
+
+    def sync_files(self, sota_files: Iterable[Path]):
+        """Verilen sota_*.txt dosyaları kayıt defterindekinden farklıysa yeniden oku (yalnızca stat)"""
+        changed = []
+        for sota_file in sota_files:
+            try:
+                stat = sota_file.stat()
+                current = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                stat, current = None, None
+            known = self.conn.execute("SELECT mtime_ns, size FROM files WHERE path = ?",
+                                      (self.key(sota_file),)).fetchone()
+            if known != current:
+                changed.append((sota_file, stat))
+        if changed:
+            with self.transaction():
+                for sota_file, stat in changed:
+                    self._ingest(sota_file, stat)
+
+    def rebuild(self):
+        """Proje ağacındaki tüm sota_*.txt dosyalarından kayıt defterini yeniden oluştur"""
+        with self.transaction():
+            self._import_tree()
+
+    def _import_tree(self):
+        """Ağacı tara ve tüm kayıtları değiştir (işlem içinde çağrılır)"""
+        found = []
+        for root, dirs, files in os.walk(self.project_root):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for name in SOTA_FILES:
+                if name in files:
+                    path = Path(root) / name
+                    try:
+                        found.append((path, path.stat()))
+                    except OSError:
+                        continue
+        self.conn.execute("DELETE FROM best")
+        self.conn.execute("DELETE FROM files")
+        for path, stat in found:
+            self._ingest(path, stat)
+
+    # ---- Sorgular ----
+
+    def hardware_dir(self, directory: Path) -> Optional[Path]:
+        """hardware_info.md içeren en yakın üst dizin (sonuç kayıt defterinde önbelleğe alınır)"""
+        dir_key = self.key(directory)
+        row = self.conn.execute("SELECT hardware_dir FROM locations WHERE dir = ?", (dir_key,)).fetchone()
+        if row:
+            hardware_dir = self.project_root / row[0]
+            if (hardware_dir / "hardware_info.md").exists():
+                return hardware_dir
+
+        current = Path(directory)
+        while current != current.parent:
+            if (current / "hardware_info.md").exists():
+                with self.transaction():
+                    self.conn.execute("INSERT OR REPLACE INTO locations VALUES (?, ?)",
+                                      (dir_key, self.key(current)))
+                return current
+            current = current.parent
+        return None
+
+    def lookup(self, scopes: Dict[str, Optional[Path]], parents: Iterable[Path] = ()) -> Dict[str, Optional[Dict]]:
+        """Katmanların mevcut en iyilerini tek sorguyla getir
+
+        Args:
+            scopes: {'local'|'hardware'|'project': kapsam dizini (None: kapsam yok)}
+            parents: Sanal ebeveyn dizinleri (en iyileri 'parent' altında birleştirilir)
+
+        Returns:
+            {katman: {'performance', 'achieved_by', 'agent_id', 'timestamp', 'source'} ya da None}
+        """
+        wanted = [(scope, self.key(path)) for scope, path in scopes.items() if path is not None]
+        wanted += [('parent', self.key(path)) for path in parents]
+        result: Dict[str, Optional[Dict]] = {scope: None for scope in scopes}
+        result['parent'] = None
+        if not wanted:
+            return result
+
+        condition = ' OR '.join(['(scope = ? AND key = ?)'] * len(wanted))
+        rows = self.conn.execute(
+            f"SELECT scope, performance, achieved_by, agent_id, timestamp, source FROM best WHERE {condition}",
+            [value for pair in wanted for value in pair]).fetchall()
+        for scope, performance, achieved_by, agent_id, timestamp, source in rows:
+            current = result.get(scope)
+            if current is None or self.metric.better(performance, current['performance']):
+                result[scope] = {'performance': performance, 'achieved_by': achieved_by,
+                                 'agent_id': agent_id, 'timestamp': timestamp,
+                                 'source': str(self.project_root / source)}
+        return result
+
+    def record(self, sota_file: Path):
+        """Yeni yazılmış sota_*.txt dosyasını kayıt defterine işle (işlem içinde çağrılır)"""
+        try:
+            stat = sota_file.stat()
+        except OSError:
+            stat = None
+        self._ingest(sota_file, stat)
+
+    def scopes(self, scope: str) -> List[Dict]:
+        """Bir kapsamdaki tüm kayıtlar (en iyiden kötüye)"""
+        rows = self.conn.execute(
+            "SELECT key, performance, achieved_by, agent_id, timestamp FROM best "
+            f"WHERE scope = ? ORDER BY performance {self.metric.sql_order}", (scope,)).fetchall()
+        return [{'key': key, 'performance': performance, 'achieved_by': achieved_by,
+                 'agent_id': agent_id, 'timestamp': timestamp}
+                for key, performance, achieved_by, agent_id, timestamp in rows]
+
+    def close(self):
+        self.conn.close()
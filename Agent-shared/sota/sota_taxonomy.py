@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+ChangeLog dizinlerinin yol sınıflandırması (donanım, derleyici, family kuşağı, üst teknolojiler)
+
+sota_visualizer.py her çalıştırmada dizinleri bir kez sınıflandırır; hardware/family/local
+gruplamaları yolları yeniden bölmek ve alt dize aramak yerine sözlük aramalarıyla yapılır.
+
+Kurallar Agent-shared/sota/sota_grouping_config.yaml dosyasından okunur
+(şablon: sota_grouping_config_template.yaml; dosya yoksa aşağıdaki varsayılanlar):
+- hardware.detection:
+    hardware_info: hardware_info.md içeren en yakın üst dizin donanım katmanıdır (varsayılan).
+                   Henüz hardware_info.md yoksa manual_groups desenlerine düşülür
+    path_index:    yolun path_index. öğesi (0'dan) donanım katmanıdır
+    manual:        manual_groups desenlerinden birini içeren ilk öğe; grup adı donanım adıdır
+  Donanım katmanından sonraki öğe derleyicidir (ör: single-node/gcc11.3.0)
+- family.separator, generation_rules (ayırıcı sayısı → kuşak) ve explicit_relationships
+  (teknoloji → parents, generation); açık tanımlar kurallara göre önceliklidir
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+CONFIG_RELATIVE_PATH = Path("Agent-shared") / "sota" / "sota_grouping_config.yaml"
+
+DEFAULT_MANUAL_GROUPS = [
+    {'name': 'single-node', 'patterns': ['single-node']},
+    {'name': 'multi-node', 'patterns': ['multi-node']},
+    {'name': 'gpu-cluster', 'patterns': ['gpu-cluster']},
+]
+
+# Ayırıcı içeren bir dizin adı, bu teknolojilerden birini (ya da açık tanımlı bir adı) içeriyorsa family sayılır
+DEFAULT_TECHNOLOGIES = ('OpenMP', 'MPI', 'CUDA', 'AVX')
+
+AGENT_ID_PATTERN = re.compile(r'PG\d+(?:\.\d+)?')
+
+
+def load_grouping_config(project_root: Path) -> Dict:
+    """sota_grouping_config.yaml içeriği (yoksa ya da okunamazsa boş sözlük)"""
+    path = Path(project_root) / CONFIG_RELATIVE_PATH
+    try:
+        text = path.read_text(encoding='utf-8')
+    except OSError:
+        return {}
+    try:
+        import yaml
+    except ImportError:
+        print(f"UYARI: PyYAML kurulu değil, {path} atlanıyor (pip install pyyaml)", file=sys.stderr)
+        return {}
+    try:
+        return yaml.safe_load(text) or {}
+    except yaml.YAMLError as e:
+        print(f"UYARI: {path} okunamadı, varsayılan gruplama kullanılıyor: {e}", file=sys.stderr)
+        return {}
+
+
+class PathTaxonomy:
+    """Dizin yolu → {'label', 'hardware', 'compiler', 'hardware_key', 'family', 'generation', 'parents', 'agent_id'}
+
+    label: son iki dizin adı (ör: intel2024/OpenMP; local grafik ve family seri adı)
+
+    Yollar proje köküne göredir ('/' ayırıcılı). Sonuçlar önbelleğe alınır; index() ile
+    sınıflandırılan dizinler için dizin adı → dizinler ve family → dizinler tabloları da tutulur.
+    """
+
+    def __init__(self, project_root: Path, config: Optional[Dict] = None):
+        self.project_root = Path(project_root)
+        config = load_grouping_config(self.project_root) if config is None else config
+        hardware = config.get('hardware') or {}
+        family = config.get('family') or {}
+
+        self.detection = hardware.get('detection', 'hardware_info')
+        if self.detection not in ('hardware_info', 'path_index', 'manual'):
+            raise ValueError(f"Geçersiz hardware.detection: {self.detection} (hardware_info/path_index/manual)")
+        self.path_index = int(hardware.get('path_index', 2))
+        self.manual_groups = [(group['name'], [p.lower() for p in group.get('patterns', [group['name']])])
+                              for group in (hardware.get('manual_groups') or DEFAULT_MANUAL_GROUPS)]
+
+        self.separator = family.get('separator', '_')
+        self.generation_by_separators = {rule['separator_count']: rule['generation']
+                                         for rule in family.get('generation_rules') or []}
+        self.relationships = {name: dict(spec or {})
+                              for name, spec in (family.get('explicit_relationships') or {}).items()}
+        self.technologies = set(DEFAULT_TECHNOLOGIES)
+        for name, spec in self.relationships.items():
+            self.technologies.add(name)
+            self.technologies.update(spec.get('parents', []))
+
+        self._info: Dict[str, Dict] = {}
+        self._has_hardware_info: Dict[str, bool] = {}
+        self.paths_by_part: Dict[str, List[str]] = {}
+        self.paths_by_family: Dict[str, List[str]] = {}
+
+    # ---- Sınıflandırma ----
+
+    def classify(self, path: str) -> Dict:
+        """Tek bir dizinin sınıflandırması (önbellekli)"""
+        info = self._info.get(path)
+        if info is None:
+            parts = path.split('/')
+            hardware, index = self._hardware_layer(parts)
+            compiler = parts[index + 1] if index is not None and index + 1 < len(parts) else None
+            family = self._family_part(parts)
+            match = AGENT_ID_PATTERN.search(path)
+            info = {
+                'label': '/'.join(parts[-2:]),
+                'hardware': hardware,
+                'compiler': compiler,
+                'hardware_key': f"{hardware}/{compiler}" if compiler else None,
+                'family': family,
+                'generation': self.generation(family) if family else None,
+                'parents': self.parents(family) if family else [],
+                'agent_id': match.group() if match else None,
+            }
+            self._info[path] = info
+        return info
+
+    def index(self, paths: Iterable[str]) -> None:
+        """Dizinleri sınıflandır ve arama tablolarını yeniden kur (çalıştırma başına bir kez)
+
+        Önceki sınıflandırmalar atılır; arada eklenen hardware_info.md dosyaları dikkate alınır.
+        """
+        self._info = {}
+        self._has_hardware_info = {}
+        self.paths_by_part = {}
+        self.paths_by_family = {}
+        for path in paths:
+            for part in dict.fromkeys(path.split('/')):
+                self.paths_by_part.setdefault(part, []).append(path)
+            family = self.classify(path)['family']
+            if family:
+                self.paths_by_family.setdefault(family, []).append(path)
+
+    def generation(self, technology: str) -> int:
+        """Teknolojinin kuşağı (açık tanım > generation_rules > ayırıcı sayısı + 1)"""
+        explicit = self.relationships.get(technology, {}).get('generation')
+        if explicit is not None:
+            return explicit
+        separators = technology.count(self.separator)
+        return self.generation_by_separators.get(separators, separators + 1)
+
+    def parents(self, technology: str) -> List[str]:
+        """Üst teknolojiler (açık tanım yoksa ayırıcıyla bölünür)"""
+        explicit = self.relationships.get(technology, {}).get('parents')
+        if explicit is not None:
+            return list(explicit)
+        return technology.split(self.separator)
+
+    # ---- Yardımcılar ----
+
+    def _hardware_layer(self, parts: List[str]):
+        """(donanım adı, yoldaki konumu) ya da (None, None)"""
+        if self.detection == 'path_index':
+            if self.path_index < len(parts):
+                return parts[self.path_index], self.path_index
+            return None, None
+        if self.detection == 'hardware_info':
+            for i in range(len(parts) - 1, -1, -1):
+                if self._hardware_info_in('/'.join(parts[:i + 1])):
+                    return parts[i], i
+        return self._manual_layer(parts)
+
+    def _manual_layer(self, parts: List[str]):
+        for i, part in enumerate(parts):
+            lowered = part.lower()
+            for name, patterns in self.manual_groups:
+                if any(pattern in lowered for pattern in patterns):
+                    return name, i
+        return None, None
+
+    def _hardware_info_in(self, directory: str) -> bool:
+        found = self._has_hardware_info.get(directory)
+        if found is None:
+            found = (self.project_root / directory / "hardware_info.md").exists()
+            self._has_hardware_info[directory] = found
+        return found
+
+    def _family_part(self, parts: List[str]) -> Optional[str]:
+        """Yoldaki ilk family (füzyon teknolojisi) dizin adı"""
+        for part in parts:
+            if part in self.relationships:
+                return part
+            if self.separator in part and any(tech in part for tech in self.technologies):
+                return part
+        return None
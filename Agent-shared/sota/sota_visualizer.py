@@ -8,12 +8,22 @@ Verimli veri işleme ve SE için esnek kontrol
 - Depolama IO en aza indirme
 - SE için kolayca değiştirilebilir tasarım
 - Çoklu proje entegrasyonuna uygun
+- Girdileri değişmeyen grafik/seviye yeniden çizilmez (graph_fingerprint.py)
+- Süreçler arası flock kilidi; kilit meşgulken gelen çağrılar tek takip çalıştırmasında birleşir
+- Tüm seviyelerin grafikleri süreç havuzunda paralel çizilir; dosyalar ana süreçte
+  IO bütçesiyle (bayt/s, eşzamanlı yazıcı) yazılır
+- Projenin metriği (birim, büyük/küçük daha iyi, doğruluk eşiği) metric_registry.py'den alınır
+- Pareto modu: performans × doğruluk/hata × bütçe maliyeti cepheleri (sota_pareto.py)
+- SOTA ilerlemeleri sütun dizilerinde, seviyenin tüm grupları için tek geçişte hesaplanır (sota_progression.py)
+- Donanım/derleyici/family gruplaması dizin başına bir kez sınıflandırılır ve
+  sota_grouping_config.yaml kurallarına uyar (sota_taxonomy.py)
 """
 
 import json
 import argparse
 import sys
 import time
+from concurrent.futures import as_completed
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Tuple, Any
@@ -22,22 +32,47 @@ import matplotlib.ticker as ticker
 import matplotlib.dates as mdates
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "change_log"))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "telemetry"))
+from changelog_index import ChangeLogIndex, parse_changelog_text
+from metric_registry import MetricRegistry
+from render_service import RenderService, WriteBudget, default_workers, figure_png, reusable_axes
+from graph_fingerprint import GraphFingerprintCache, fingerprint, touch
+from pipeline_lock import DEFAULT_LEASE_SEC, PipelineLock
+from sota_history import SOTAHistory
+from sota_pareto import collect_points, objectives_for, pareto_front
+from sota_progression import EntryTable
+from sota_taxonomy import PathTaxonomy
+
 
 class SOTAVisualizer:
     """Verimli SOTA görselleştirme boru hattı"""
     
-    def __init__(self, project_root: Path, config: Optional[Dict] = None):
+    def __init__(self, project_root: Path, config: Optional[Dict] = None,
+                 renderer: Optional[RenderService] = None):
         """
         Args:
             project_root: Proje kök yolu
             config: Yapılandırma sözlüğü (None ise varsayılan/değerler dosyadan yüklenir)
+            renderer: Çizim servisi (None ise grafikler aynı süreçte çizilir; paralel çizim için
+                RenderService(workers) verilir)
         """
         self.project_root = Path(project_root)
         self.config = config or self._load_config()
+        self.renderer = renderer or RenderService()
+        self.metrics = MetricRegistry.from_config(self.config)
         
 # Veri önbelleği (bellek verimliliği için)
         self.data_cache = {}
         self.changelog_cache = {}
+        self.entry_table = EntryTable({})
+        
+        # Yol sınıflandırması (Agent-shared/sota/sota_grouping_config.yaml)
+        try:
+            self.taxonomy = PathTaxonomy(self.project_root)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"  ⚠️ Gruplama yapılandırması geçersiz, varsayılanlar kullanılıyor: {e}")
+            self.taxonomy = PathTaxonomy(self.project_root, {})
         
 # Çıktı dizini
         self.output_base = self.project_root / "User-shared/visualizations/sota"
@@ -45,7 +80,8 @@ class SOTAVisualizer:
             'project': self.output_base / 'project',
             'hardware': self.output_base / 'hardware', 
             'family': self.output_base / 'family',
-            'local': self.output_base / 'local'
+            'local': self.output_base / 'local',
+            'pareto': self.output_base / 'pareto'
         }
         
 # Proje başlangıç zamanı
@@ -54,6 +90,14 @@ class SOTAVisualizer:
 # Teorik performans (hardware_info.md'den okunur)
         self.theoretical_performance = None
         
+        # Grafik/seviye parmak izleri (değişmeyen grafikler yeniden çizilmez)
+        self.fingerprints = GraphFingerprintCache(self.project_root)
+        self.skipped_graphs = 0
+        
+        # Çizimi süren grafikler: (çıktı yolu, parmak izi, Future)
+        self.pending_graphs = []
+        self.render_started = None
+        
     def _load_config(self) -> Dict:
         """TODO: Add docstring"""
         config_path = self.project_root / "Agent-shared/sota_pipeline_config.json"
@@ -70,8 +114,10 @@ class SOTAVisualizer:
             "pipeline": {
                 "levels": ["local", "family", "hardware", "project"],  # Yürütme sırası
                 "critical_section": True,  # Kilit kontrolü
+                "lock_lease_sec": DEFAULT_LEASE_SEC,  # Kilit sahibinin heartbeat lease süresi
+                "sota_source": "auto",  # Girdi kaynağı: auto / history (SOTA geçiş günlüğü) / changelog
                 "max_local_agents": 10,  # local için maksimum işlem sayısı
-                "io_delay_ms": 500  # IO yükünü azaltmak için bekleme süresi
+                "render_workers": None  # Çizim süreç sayısı (None: çekirdek sayısına göre, 0: tek süreç)
             },
             "dpi": {
                 "local": {"linear": 60, "log": 40},
@@ -89,7 +135,9 @@ class SOTAVisualizer:
             "io_optimization": {
                 "compress_level": 1,  # PNG sıkıştırma seviyesi (1=en az)
                 "buffer_writes": True,
-                "cleanup_old_hours": 2  # Eski dosyaları sil
+                "cleanup_old_hours": 2,  # Eski dosyaları sil
+                "write_bytes_per_sec": 8 * 1024 * 1024,  # Grafik yazım bütçesi (0: sınırsız)
+                "max_writers": 2  # Aynı anda yazılan en fazla dosya
             }
         }
     
@@ -114,12 +162,15 @@ class SOTAVisualizer:
         """Ana giriş noktası
         
         Args:
-            mode: Çalıştırma modu ('pipeline', 'single', 'debug', 'summary', 'export')
+            mode: Çalıştırma modu ('pipeline', 'single', 'debug', 'summary', 'export', 'pareto')
             **params: Ek parametreler
         
         Returns:
             Başarılıysa True
         """
+        if params.get('rebuild'):
+            self.fingerprints.clear()
+        
         if mode == 'summary':
             return self._run_summary_mode(**params)
         elif mode == 'export':
@@ -129,31 +180,37 @@ class SOTAVisualizer:
             return self._run_pipeline_mode(**params)
         elif mode == 'single':
             return self._run_single_mode(**params)
+        elif mode == 'pareto':
+            return self._run_pareto_mode(**params)
         else:
             return self._run_pipeline_mode(**params)
     
     def _run_pipeline_mode(self, **params) -> bool:
-        """TODO: Add docstring"""
-        
-# Kritik bölüm kontrolü
-        lock_file = self.project_root / "Agent-shared/.sota_pipeline.lock"
-        
-        if self.config['pipeline']['critical_section'] and not params.get('force'):
-            if lock_file.exists():
-                age = (datetime.now() - datetime.fromtimestamp(lock_file.stat().st_mtime)).seconds
-                if age < 1800:  # 30 dakika içinde ise çalışıyor kabul et
-                    print(f"Pipeline kilitli ({age}s önce), atlanıyor")
-                    return False
-                lock_file.unlink()  # Eski kilit kaldırılır
-        
-        lock_file.touch()
+        """Kritik bölüm kontrolüyle boru hattı (kilit meşgulse takip çalıştırması istenir)"""
+        if not self.config['pipeline']['critical_section'] or params.get('force'):
+            return self._run_pipeline_once(**params)
+        
+        lock = PipelineLock(self.project_root / "Agent-shared/.sota_pipeline.lock",
+                            self.config['pipeline'].get('lock_lease_sec', DEFAULT_LEASE_SEC))
+        result = lock.run_coalesced(lambda: self._run_pipeline_once(**params))
+        if result is None:
+            owner = lock.owner() or {}
+            heartbeat = owner.get('heartbeat_at')
+            age = f", heartbeat {time.time() - heartbeat:.0f}s önce" if heartbeat else ""
+            print(f"Pipeline kilitli (PID {owner.get('pid', '?')}@{owner.get('host', '?')}{age}), "
+                  f"takip çalıştırması sıraya alındı")
+            return False
+        return result
+    
+    def _run_pipeline_once(self, **params) -> bool:
+        """Boru hattını bir kez çalıştır (kilit çağıran tarafından tutulur)"""
         start_time = datetime.now()
         
         try:
             print(f"[{start_time.strftime('%H:%M:%S')}] Pipeline started")
             
-# 1. Veri toplama aşaması (tüm ChangeLog.md dosyalarını sadece bir kez okur)
-            self._collect_all_data()
+# 1. Veri toplama aşaması (SOTA geçiş günlüğü + ChangeLog.md ortak dizini, bir kez)
+            self._collect_all_data(params.get('source'))
             
 # 2. DPI ayarları
             dpi_config = self._get_dpi_config(params)
@@ -162,10 +219,22 @@ class SOTAVisualizer:
             levels = params.get('levels', self.config['pipeline']['levels'])
             
             generated_files = []
+            level_outputs = {}  # Yeniden çizilen seviye → (parmak izi, grafikler, değişmeyen sayısı)
+            data_fingerprint = fingerprint(self.changelog_cache, self.project_start_time)
             
+            # Seviyeler sırayla hazırlanır; grafik işleri beklenmeden çizim havuzuna gönderilir
             for level in levels:
-                level_start = datetime.now()
+                # Seviyenin girdileri (veri + ayarlar) değişmediyse önceki çıktılar kullanılır
+                level_fingerprint = self._level_fingerprint(level, data_fingerprint, dpi_config, params)
+                reused = self.fingerprints.fresh_level(level, level_fingerprint)
+                if reused is not None:
+                    for path in reused:
+                        touch(path)
+                    generated_files.extend(reused)
+                    print(f"  {level}: unchanged, {len(reused)} graphs reused")
+                    continue
                 
+                self.skipped_graphs = 0
                 if level == 'local':
 # local bireysel işlem (bellek verimliliği)
                     files = self._process_local_level(dpi_config['local'], params)
@@ -181,14 +250,22 @@ class SOTAVisualizer:
                 else:
                     continue
                 
-                generated_files.extend(files)
-                elapsed = (datetime.now() - level_start).seconds
-                print(f"  {level}: {len(files)} graphs in {elapsed}s")
-                
-# IO yükünü azaltma
-                if not params.get('no_delay'):
-                    time.sleep(self.config['io_optimization'].get('io_delay_ms', 500) / 1000)
+                level_outputs[level] = (level_fingerprint, files, self.skipped_graphs)
+            
+            # Çizilen grafiklerin IO bütçesiyle yazılması
+            failed = self._write_pending_graphs(params)
             
+            for level, (level_fingerprint, files, skipped) in level_outputs.items():
+                written = [path for path in files if path not in failed]
+                generated_files.extend(written)
+                # Yazılamayan grafik varsa seviye bir sonraki çalıştırmada yeniden denenir
+                if len(written) == len(files):
+                    self.fingerprints.record_level(level, level_fingerprint, files)
+                print(f"  {level}: {len(written)} graphs"
+                      f"{f' ({skipped} unchanged)' if skipped else ''}"
+                      f"{f', {len(files) - len(written)} failed' if len(written) < len(files) else ''}")
+            
+            self.fingerprints.save()
             total_elapsed = (datetime.now() - start_time).seconds
             print(f"[{datetime.now().strftime('%H:%M:%S')}] Completed: {len(generated_files)} files in {total_elapsed}s")
             
@@ -203,92 +280,185 @@ class SOTAVisualizer:
             import traceback
             traceback.print_exc()
             return False
-            
-        finally:
-            lock_file.unlink(missing_ok=True)
     
-    def _collect_all_data(self):
-        """TODO: Add docstring"""
+    def _render_options(self, params: Dict) -> Dict:
+        """Grafik içeriğini etkileyen ayarlar (parmak izine girer)"""
+        return {
+            'accuracy_threshold': params.get('accuracy_threshold'),
+            'no_theoretical': bool(params.get('no_theoretical')),
+            'theoretical_performance': self.theoretical_performance,
+            'show_error_bars': self.config['axes']['show_error_bars'],
+            'metric': (self.metrics.target.name, self.metrics.target.unit, self.metrics.accuracy_threshold),
+            'compress_level': self.config['io_optimization'].get('compress_level'),
+        }
+    
+    def _level_fingerprint(self, level: str, data_fingerprint: str, dpi_config: Dict, params: Dict) -> str:
+        """Seviyenin tüm girdilerinin özeti"""
+        grouping = {path: self.taxonomy.classify(path) for path in self.changelog_cache}
+        return fingerprint(level, data_fingerprint, dpi_config.get(level), self._render_options(params),
+                           grouping, params.get('x_axes'), params.get('specific'),
+                           params.get('max_local', self.config['pipeline']['max_local_agents']))
+    
+    def _output_path(self, name: str) -> Path:
+        """Grafik adından PNG yolu (ör: 'local/intel2024_OpenMP')"""
+        return self.output_base / name.rsplit('/', 1)[0] / f"{name.rsplit('/', 1)[-1]}.png"
+    
+    def _reuse_graph(self, output_path: Path, digest: str) -> bool:
+        """Aynı girdilerle çizilmiş grafik varsa yeniden kullan"""
+        if not self.fingerprints.is_fresh(output_path, digest):
+            return False
+        touch(output_path)
+        self.skipped_graphs += 1
+        return True
+    
+    def _submit_graph(self, function, spec: Dict, output_path: Path, digest: str) -> Path:
+        """Grafik işini çizim servisine gönder (dosya _write_pending_graphs ile yazılır)"""
+        if not self.pending_graphs:
+            self.render_started = time.monotonic()
+        self.pending_graphs.append((output_path, digest, self.renderer.submit(function, spec)))
+        return output_path
+    
+    def _write_budget(self, params: Dict) -> WriteBudget:
+        """Ayarlardan yazım bütçesi (--no-delay: bayt/s sınırı yok)"""
+        io_config = self.config['io_optimization']
+        bytes_per_sec = None if params.get('no_delay') else io_config.get('write_bytes_per_sec', 8 * 1024 * 1024)
+        return WriteBudget(bytes_per_sec, io_config.get('max_writers', 2))
+    
+    def _write_pending_graphs(self, params: Dict) -> set:
+        """Çizimi biten grafikleri bitiş sırasıyla yaz ve parmak izlerini kaydet
+        
+        Returns:
+            Çizilemeyen ya da yazılamayan grafiklerin yolları
+        """
+        pending, self.pending_graphs = self.pending_graphs, []
+        if not pending:
+            return set()
+        
+        budget = self._write_budget(params)
+        by_future = {future: (output_path, digest) for output_path, digest, future in pending}
+        writes = []
+        failed = set()
+        for future in as_completed(by_future):
+            output_path, digest = by_future[future]
+            png = future.result()
+            if png is None:
+                failed.add(output_path)
+                continue
+            writes.append((output_path, digest, budget.submit(output_path, png)))
+        
+        for output_path, digest, write in writes:
+            try:
+                write.result()
+                self.fingerprints.record(output_path, digest)
+            except OSError as e:
+                print(f"  Write error {output_path}: {e}")
+                failed.add(output_path)
+        budget.close()
+        
+        workers = self.renderer.workers or 'in-process'
+        print(f"  rendered {len(pending) - len(failed)} graphs "
+              f"({budget.bytes_written / 1024:.0f} KB, workers: {workers}) "
+              f"in {time.monotonic() - self.render_started:.1f}s")
+        return failed
+    
+    def _collect_all_data(self, source: Optional[str] = None):
+        """Tüm dizinlerin girdilerini topla
+        
+        Args:
+            source: 'history' (yalnızca SOTA geçiş günlüğü, ChangeLog taranmaz),
+                'changelog' (yalnızca ChangeLog.md ortak dizini) veya
+                'auto' (birleşik: dizinin günlükteki ilk geçişinden önceki sürümler ChangeLog'dan,
+                sonrası günlükten; günlükte kaydı olmayan dizinler tamamen ChangeLog'dan)
+        """
+        source = source or self.config['pipeline'].get('sota_source', 'auto')
         self.changelog_cache = {}
         
-        for changelog in self.project_root.rglob("ChangeLog.md"):
-            rel_path = changelog.parent.relative_to(self.project_root)
-            entries = self._parse_changelog(changelog)
-            if entries:
-                self.changelog_cache[str(rel_path)] = entries
+        history = {}
+        first_logged = {}
+        if source != 'changelog':
+            log = SOTAHistory(self.project_root)
+            history = log.entries(self.project_start_time, scope='local', unit=self.metrics.target.unit)
+            first_logged = log.first_logged('local')
+        logged_dirs = len(history)
         
-        print(f"  Collected: {len(self.changelog_cache)} ChangeLogs, "
+        if source != 'history':
+            index = ChangeLogIndex(self.project_root)
+            try:
+                index.refresh()
+                indexed = index.entries()
+            finally:
+                index.close()
+            
+            for changelog_path, records in indexed.items():
+                rel_path = Path(changelog_path).parent.as_posix()
+                entries = self._entries_from_records(records)
+                if rel_path in history:
+                    entries = self._merge_history(entries, history.pop(rel_path), first_logged.get(rel_path))
+                if entries:
+                    self.changelog_cache[rel_path] = entries
+        
+        # Yalnızca günlükte olan dizinler (ya da source='history')
+        self.changelog_cache.update(history)
+        self.entry_table = EntryTable(self.changelog_cache)
+        self.taxonomy.index(self.changelog_cache)
+        
+        print(f"  Collected: {len(self.changelog_cache)} ChangeLogs "
+              f"({logged_dirs} with SOTA history), "
               f"{sum(len(e) for e in self.changelog_cache.values())} entries")
     
-    def _parse_changelog(self, path: Path) -> List[Dict]:
-        """TODO: Add docstring"""
-        entries = []
+    def _merge_history(self, changelog_entries: List[Dict], history_entries: List[Dict],
+                       cutoff: Optional[datetime]) -> List[Dict]:
+        """Bir dizinin ChangeLog ve geçiş günlüğü girdilerini birleştir
         
+        Günlük yalnızca kaydı başladıktan sonraki geçişleri içerir; daha önceki sürümler (ve zamanı
+        olmayanlar) ChangeLog'dan alınır. Her iki kaynakta olan sürüm bir kez (ChangeLog'dan) sayılır.
+        """
+        if cutoff is None:
+            return changelog_entries + history_entries
+        earlier = [e for e in changelog_entries if 'timestamp' not in e or e['timestamp'] < cutoff]
+        versions = {e['version'] for e in earlier}
+        return earlier + [e for e in history_entries if e['version'] not in versions]
+    
+    def _parse_changelog(self, path: Path) -> List[Dict]:
+        """Tek bir ChangeLog.md dosyasını ayrıştır (dizini kullanmadan)"""
         try:
             content = path.read_text(encoding='utf-8')
-            lines = content.split('\n')
+        except Exception as e:
+            print(f"  Parse error {path}: {e}")
+            return []
+        
+        return self._entries_from_records(parse_changelog_text(content, self.metrics))
+    
+    def _entries_from_records(self, records: List[Dict]) -> List[Dict]:
+        """Ortak ayrıştırıcı kayıtlarını görselleştirme girdilerine dönüştür
+        
+        Yalnızca projenin metriğinde değeri olan ve doğruluk eşiğini geçen girdiler döndürülür;
+        'performance' metriğin temel birimindeki değerdir.
+        """
+        entries = []
+        metric = self.metrics.target
+        
+        for record in records:
+            value = record.get('measurements', {}).get(metric.name)
+            if value is None or not self.metrics.passes_accuracy(record.get('accuracy')):
+                continue
             
-            current_entry = {}
+            entry = {'version': record['title'], 'performance': value}
             
-            for line in lines:
-# Versiyon satırı
-                if line.startswith('### v'):
-                    if current_entry and 'performance' in current_entry:
-                        entries.append(current_entry.copy())
-                    current_entry = {'version': line.replace('### ', '').strip()}
-                
-# Performans değerlerinin çıkarılması (çoklu format desteği)
-                elif 'GFLOPS' in line or 'TFLOPS' in line:
-                    import re
-                    # "312.4 GFLOPS" veya "`0.312 TFLOPS`" gibi
-                    match = re.search(r'([\d.]+)\s*(GFLOPS|TFLOPS)', line)
-                    if match:
-                        value = float(match.group(1))
-                        if match.group(2) == 'TFLOPS':
-                            value *= 1000  # TFLOPS→GFLOPS dönüşümü
-                        current_entry['performance'] = value
-                
-# Oluşturulma zamanı (details içinde, backtick zorunlu)
-                elif 'Oluşturma zamanı' in line:
-                    # `2025-08-19T23:45:00Z` biçimini çıkar
-                    import re
-                    match = re.search(r'`(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z)`', line)
-                    if match:
-                        time_str = match.group(1)
-                        try:
-                            timestamp = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                            current_entry['timestamp'] = timestamp
+            if record.get('generation_time'):
+                try:
+                    timestamp = datetime.fromisoformat(record['generation_time'].replace('Z', '+00:00'))
+                    entry['timestamp'] = timestamp
 # Geçen zaman hesaplama
-                            elapsed = (timestamp - self.project_start_time).total_seconds()
-                            current_entry['elapsed_seconds'] = elapsed
-                        except:
-                            pass
-                
-# Hassasiyet bilgisi (isteğe bağlı)
-                elif 'Doğruluk' in line or 'accuracy' in line.lower():
-                    import re
-                    match = re.search(r'([\d.]+)\s*%', line)
-                    if match:
-                        current_entry['accuracy'] = float(match.group(1))
-                
-# Hata bilgisi (bilimsel gösterim desteği)
-                elif 'Hata' in line or 'error' in line.lower():
-                    import re
-                    # "2.7e-4" veya "±0.003" biçimi
-                    match = re.search(r'([±]?\s*[\d.]+e?[+-]?\d*)', line)
-                    if match:
-                        error_str = match.group(1).replace('±', '').strip()
-                        try:
-                            current_entry['error'] = float(error_str)
-                        except:
-                            pass
+                    entry['elapsed_seconds'] = (timestamp - self.project_start_time).total_seconds()
+                except ValueError:
+                    pass
             
-# Son giriş
-            if current_entry and 'performance' in current_entry:
-                entries.append(current_entry)
-                
-        except Exception as e:
-            print(f"  Parse error {path}: {e}")
+            for key in ('accuracy', 'error'):
+                if key in record:
+                    entry[key] = record[key]
+            
+            entries.append(entry)
         
         return entries
     
@@ -300,28 +470,25 @@ class SOTAVisualizer:
         specific_dpis = self._parse_specific_dpis(params.get('specific', ''))
         
         # ChangeLog olan dizinleri işle (local düzeyi = teknoloji dizini bazında)
-        local_dirs = {}
+        local_dirs = {}  # dir_id → dizin (aynı dir_id'de sonuncusu)
         for path, entries in self.changelog_cache.items():
             if entries:
-# Yoldan okunabilir bir tanımlayıcı oluştur (örnek: "intel2024/OpenMP")
-                path_parts = path.split('/')
-                if len(path_parts) >= 2:
-# Son 2 katmanı kullan (örnek: intel2024/OpenMP)
-                    dir_id = '/'.join(path_parts[-2:])
-                else:
-                    dir_id = path_parts[-1] if path_parts else path
-                
-                local_dirs[dir_id] = entries
+# Yoldan okunabilir tanımlayıcı: son 2 katman (örnek: "intel2024/OpenMP")
+                local_dirs[self.taxonomy.classify(path)['label']] = path
         
 # Maksimum işlem sayısı sınırı
         max_agents = params.get('max_local', self.config['pipeline']['max_local_agents'])
+        selected = list(local_dirs.items())[:max_agents]
+        
+# SOTA çıkarımı (metriğin yönüne göre monoton; tüm dizinler tek geçişte)
+        progressions = self.entry_table.progressions({path: dir_id for dir_id, path in selected},
+                                                     self.metrics.target.higher_is_better)
         
-        for i, (dir_id, entries) in enumerate(list(local_dirs.items())[:max_agents]):
+        for dir_id, _ in selected:
 # DPI belirleme (bireysel belirleme veya varsayılan)
             dpi = specific_dpis.get(dir_id, dpi_config['linear'])
             
-# SOTA çıkarımı (monoton artış)
-            sota_entries = self._extract_sota_progression(entries)
+            sota_entries = progressions.get(dir_id)
             
             if sota_entries:
 # Grafik oluşturma
@@ -344,28 +511,27 @@ class SOTAVisualizer:
         generated = []
         
         # hardware katmanını tanımla
-        hardware_groups = {}  # Derleyici başına (ör: single-node/gcc11.3.0)
-        hardware_merged = {}  # Donanım genel görünümü (ör: single-node)
+        hardware_groups = {}  # Dizin → derleyici başına grup (ör: single-node/gcc11.3.0)
+        hardware_merged = {}  # Dizin → donanım genel görünümü (ör: single-node)
         
-        for path, entries in self.changelog_cache.items():
-            # donanım katmanını belirle
-            hw_key = self._extract_hardware_key(path)
-            if hw_key:
+        for path in self.changelog_cache:
+            # donanım katmanını belirle (sota_grouping_config.yaml hardware.detection)
+            info = self.taxonomy.classify(path)
+            if info['hardware_key']:
 # Derleyici bazında grup oluşturma
-                if hw_key not in hardware_groups:
-                    hardware_groups[hw_key] = []
-                hardware_groups[hw_key].extend(entries)
+                hardware_groups[path] = info['hardware_key']
                 
                 # Donanım genelindeki grup (derleyici entegrasyonu)
-                hw_base = hw_key.split('/')[0]  # yalnızca single-node kısmı
-                if hw_base not in hardware_merged:
-                    hardware_merged[hw_base] = []
-                hardware_merged[hw_base].extend(entries)
+                hardware_merged[path] = info['hardware']  # yalnızca single-node kısmı
+        
+# Zaman serisine göre SOTA güncelleme (her gruplama tek geçişte)
+        higher_is_better = self.metrics.target.higher_is_better
+        group_progressions = self.entry_table.progressions(hardware_groups, higher_is_better)
+        merged_progressions = self.entry_table.progressions(hardware_merged, higher_is_better)
         
 # Derleyici bazında grafik oluşturma
-        for hw_key, all_entries in hardware_groups.items():
-# Zaman serisine göre SOTA güncelleme
-            sota_entries = self._aggregate_sota_by_time(all_entries)
+        for hw_key, progression in group_progressions.items():
+            sota_entries = self._with_generation_count(progression)
             
             if sota_entries:
                 for x_axis in params.get('x_axes', ['time']):
@@ -381,9 +547,8 @@ class SOTAVisualizer:
                         generated.append(output_path)
         
         # Donanım genelinde (derleyici entegrasyonu) grafik oluşturma
-        for hw_base, all_entries in hardware_merged.items():
-# Zaman serisine göre SOTA güncelleme
-            sota_entries = self._aggregate_sota_by_time(all_entries)
+        for hw_base, progression in merged_progressions.items():
+            sota_entries = self._with_generation_count(progression)
             
             if sota_entries:
                 for x_axis in params.get('x_axes', ['time']):
@@ -404,13 +569,9 @@ class SOTAVisualizer:
         """TODO: Add docstring"""
         generated = []
         
-# Tüm girişleri zaman serisine göre toplama
-        all_entries = []
-        for entries in self.changelog_cache.values():
-            all_entries.extend(entries)
-        
-# SOTA güncelleme geçmişi
-        sota_entries = self._aggregate_sota_by_time(all_entries)
+# SOTA güncelleme geçmişi (tüm girişler zaman serisine göre)
+        sota_entries = self._with_generation_count(
+            self.entry_table.progression(higher_is_better=self.metrics.target.higher_is_better))
         
         if sota_entries:
             for x_axis in params.get('x_axes', ['time', 'count']):
@@ -435,63 +596,41 @@ class SOTAVisualizer:
         """TODO: Add docstring"""
         generated = []
         
-# family belirleme (OpenMP_MPI, OpenMP_AVX2 gibi)
-        family_found = set()
-        
-        for path in self.changelog_cache.keys():
-            # Alt çizgi içeren teknik terimleri tespit et
-            if '_' in path:
-                parts = path.split('/')
-                for part in parts:
-                    if '_' in part and any(tech in part for tech in ['OpenMP', 'MPI', 'CUDA', 'AVX']):
-                        family_found.add(part)
-                        break
-        
-# Her family için işlem yapma (ebeveyn teknoloji dahil)
-        for family_key in family_found:
-# Ebeveyn teknolojiyi belirleme (örnek: OpenMP_MPI → ['OpenMP', 'MPI'])
-            parent_techs = family_key.split('_')
-            
+# family belirleme (OpenMP_MPI, OpenMP_AVX2 gibi; dizinler _collect_all_data'da sınıflandırılır)
+        for family_key, family_paths in self.taxonomy.paths_by_family.items():
 # İlgili tüm verileri toplama
             multi_series_data = {}
+            series_paths = {}  # Seri → dizin
             
-# 1. family'nin kendi verisi
-            for path, entries in self.changelog_cache.items():
-                if family_key in path:
-# Yoldan tanımlayıcı isim oluşturma (örnek: intel2024/OpenMP_MPI)
-                    path_parts = path.split('/')
-                    if len(path_parts) >= 2:
-                        series_key = '/'.join(path_parts[-2:])
-                    else:
-                        series_key = path_parts[-1] if path_parts else path
-                    
-                    multi_series_data[series_key] = entries
+# 1. family'nin kendi verisi (seri adı örnek: intel2024/OpenMP_MPI)
+            for path in family_paths:
+                series_key = self.taxonomy.classify(path)['label']
+                multi_series_data[series_key] = self.changelog_cache[path]
+                series_paths[series_key] = path
             
-            # 2. Üst teknoloji verileri de toplanır
-            for parent_tech in parent_techs:
-                for path, entries in self.changelog_cache.items():
-                    # Alt çizgi (_) içermeyen ana teknolojinin tek başına dizinini arar
-                    path_parts = path.split('/')
-                    for part in path_parts:
-                        if part == parent_tech:  # Tam eşleşme ile üst teknoloji
-                            if len(path_parts) >= 2:
-                                series_key = '/'.join(path_parts[-2:])
-                            else:
-                                series_key = path_parts[-1] if path_parts else path
-                            
-                            if series_key not in multi_series_data:
-                                multi_series_data[series_key] = entries
-                            break
+            # 2. Üst teknoloji verileri de toplanır (explicit_relationships ya da OpenMP_MPI → ['OpenMP', 'MPI'])
+            for parent_tech in self.taxonomy.parents(family_key):
+                # Dizin adı üst teknolojiyle tam eşleşen dizinler
+                for path in self.taxonomy.paths_by_part.get(parent_tech, []):
+                    series_key = self.taxonomy.classify(path)['label']
+                    if series_key not in multi_series_data:
+                        multi_series_data[series_key] = self.changelog_cache[path]
+                        series_paths[series_key] = path
             
             # Birden çok serinin grafiğini oluşturur
             if multi_series_data:
+                # Tüm serilerin SOTA ilerlemeleri tek geçişte
+                sota_series = self.entry_table.progressions(
+                    {path: series_key for series_key, path in series_paths.items()},
+                    self.metrics.target.higher_is_better)
                 output_path = self._generate_multi_series_graph(
                     f'family/{family_key}',
                     multi_series_data,
                     f"Family: {family_key}",
                     'time',
                     dpi_config['linear'],
-                    params
+                    params,
+                    sota_series
                 )
                 if output_path:
                     generated.append(output_path)
@@ -500,260 +639,159 @@ class SOTAVisualizer:
     
     def _generate_graph(self, name: str, entries: List[Dict], title: str, 
                        x_axis: str, dpi: int, params: Dict, log_scale: bool = False) -> Optional[Path]:
-        """Grafik oluşturma (IO optimizasyonlu sürüm)"""
+        """Grafik oluşturma (IO optimizasyonlu sürüm)
+        
+        Veriler burada hazırlanır; çizim render_sota_graph ile çizim servisinde yapılır.
+        """
         if not entries:
             return None
         
-        try:
-            fig, ax = plt.subplots(figsize=(10, 6))
+        output_path = self._output_path(name)
+        digest = fingerprint('graph', entries, title, x_axis, dpi, log_scale, self._render_options(params))
+        if self._reuse_graph(output_path, digest):
+            return output_path
+        
+        spec = {'output': str(output_path), 'title': title, 'dpi': dpi, 'log_scale': log_scale,
+                'x_format': None, 'x_ticklabels': None,
+                'compress_level': self.config['io_optimization']['compress_level']}
+        
+        # Veri hazırlığı
+        if x_axis == 'time':
+            # elapsed_seconds olmayan girdileri tespit et
+            missing_time = [e.get('version', f'unknown_{i}') for i, e in enumerate(entries) if 'elapsed_seconds' not in e]
+            if missing_time:
+                print(f"  ⚠️ Uyarı: ChangeLog'da oluşturma zamanı eksik: {', '.join(missing_time)}")
+                print(f"     Grafik oluştururken {len(missing_time)} girdi dışarıda bırakıldı")
+                # Geçerli girişler yalnızca kullanılır
+                entries = [e for e in entries if 'elapsed_seconds' in e]
+            
+            if not entries:
+                print(f"  ❌ Hata: Zaman bilgisi bulunmuyor. Bu grafik atlanacak")
+                return None
             
-            # Veri hazırlığı
-            if x_axis == 'time':
-                # elapsed_seconds olmayan girdileri tespit et
-                missing_time = [e.get('version', f'unknown_{i}') for i, e in enumerate(entries) if 'elapsed_seconds' not in e]
-                if missing_time:
-                    print(f"  ⚠️ Uyarı: ChangeLog'da oluşturma zamanı eksik: {', '.join(missing_time)}")
-                    print(f"     Grafik oluştururken {len(missing_time)} girdi dışarıda bırakıldı")
-                    # Geçerli girişler yalnızca kullanılır
-                    entries = [e for e in entries if 'elapsed_seconds' in e]
-                
-                if not entries:
-                    print(f"  ❌ Hata: Zaman bilgisi bulunmuyor. Bu grafik atlanacak")
-                    return None
-                
 # Zaman sırasına göre sıralama (Önemli!)
-                entries = sorted(entries, key=lambda e: e['elapsed_seconds'])
-                
+            entries = sorted(entries, key=lambda e: e['elapsed_seconds'])
+            
+            # Zaman ölçeği ayarı (tick sayısı problemi çözümü)
+            max_time = max(e['elapsed_seconds'] for e in entries)
+            if max_time < 7200:  # 2 saatten az
                 x_data = [e['elapsed_seconds'] / 60 for e in entries]  # Dakika bazında
                 x_label = 'Time (minutes from start)'
-                
-                # Zaman ölçeği ayarı (tick sayısı problemi çözümü)
-                max_time = max(e['elapsed_seconds'] for e in entries)
-                if max_time < 7200:  # 2 saatten az
-                    x_label = 'Time (minutes from start)'
-                    x_formatter = lambda x, pos: f'{x:.0f}m'
-                elif max_time < 86400:  # 24 saatten az
-                    x_data = [e['elapsed_seconds'] / 3600 for e in entries]
-                    x_label = 'Time (hours from start)'
-                    x_formatter = lambda x, pos: f'{x:.1f}h'
-                else:  # 1 günden fazla
-                    x_data = [e['elapsed_seconds'] / 86400 for e in entries]
-                    x_label = 'Time (days from start)'
-                    x_formatter = lambda x, pos: f'{x:.1f}d'
-                
-                ax.xaxis.set_major_formatter(plt.FuncFormatter(x_formatter))
-                
-            elif x_axis == 'count':
-                x_data = list(range(1, len(entries) + 1))
-                x_label = 'Generation Count'
-                
-            elif x_axis == 'version':
-                x_data = list(range(len(entries)))
-                x_label = 'Version'
-                # Sürüm etiketi ayarı
-                ax.set_xticks(x_data)
-                ax.set_xticklabels([e.get('version', f'v{i}') for i, e in enumerate(entries)], 
-                                   rotation=45)
-            else:
-                x_data = list(range(len(entries)))
-                x_label = x_axis.capitalize()
+                spec['x_format'] = 'm'
+            elif max_time < 86400:  # 24 saatten az
+                x_data = [e['elapsed_seconds'] / 3600 for e in entries]
+                x_label = 'Time (hours from start)'
+                spec['x_format'] = 'h'
+            else:  # 1 günden fazla
+                x_data = [e['elapsed_seconds'] / 86400 for e in entries]
+                x_label = 'Time (days from start)'
+                spec['x_format'] = 'd'
             
-            y_data = [e['performance'] for e in entries]
+        elif x_axis == 'count':
+            x_data = list(range(1, len(entries) + 1))
+            x_label = 'Generation Count'
             
+        elif x_axis == 'version':
+            x_data = list(range(len(entries)))
+            x_label = 'Version'
+            # Sürüm etiketi ayarı
+            spec['x_ticklabels'] = [e.get('version', f'v{i}') for i, e in enumerate(entries)]
+        else:
+            x_data = list(range(len(entries)))
+            x_label = x_axis.capitalize()
+        
+        y_data = [e['performance'] for e in entries]
+        
 # Doğruluk filtresi
-            if params.get('accuracy_threshold'):
-                filtered = [(x, y, e) for x, y, e in zip(x_data, y_data, entries)
-                           if e.get('accuracy', 100) >= params['accuracy_threshold']]
-                if filtered:
-                    x_data, y_data, entries = zip(*filtered)
-            
-            # Grafik (Basamaklı, mavi tonlarında)
-            ax.step(x_data, y_data, 'b-', where='post', linewidth=2, label='SOTA', alpha=0.8)
-            ax.plot(x_data, y_data, 'bo', markersize=6, alpha=0.8)
-            
-            # Hata çubuğu (varsa)
-            if self.config['axes']['show_error_bars'] and any('error' in e for e in entries):
-                yerr = [e.get('error', 0) for e in entries]
-                ax.errorbar(x_data, y_data, yerr=yerr, fmt='none', ecolor='gray', alpha=0.5)
-            
-            # Teorik performans çizgisi (varsa)
-            if self.theoretical_performance and not params.get('no_theoretical'):
-                ax.axhline(y=self.theoretical_performance, color='gray', 
-                          linestyle='--', alpha=0.5, label='Theoretical')
-            
-            # tick sayısı sınırı (MAXTICKS önlemi)
-            ax.xaxis.set_major_locator(ticker.MaxNLocator(nbins=15))
-            
-            # Ölçek ayarı
-            if log_scale:
-                ax.set_yscale('log')
-            
-            ax.set_xlabel(x_label)
-            ax.set_ylabel('Performance (GFLOPS)')
-            ax.set_title(title)
-            ax.grid(True, alpha=0.3)
-            ax.legend()
-            
-            # Çıktı yolu
-            output_dir = self.output_base / name.rsplit('/', 1)[0]
-            output_dir.mkdir(parents=True, exist_ok=True)
-            output_path = output_dir / f"{name.rsplit('/', 1)[-1]}.png"
-            
-            # Kaydetme (sıkıştırma ve minimizasyon)
-            # compress_level sadece matplotlib 3.8+ ile uyumludur
-            try:
-                plt.savefig(output_path, dpi=dpi, bbox_inches='tight',
-                           compress_level=self.config['io_optimization']['compress_level'])
-            except TypeError:
-                # Eski matplotlib sürümleri compress_level özelliğini desteklemiyor
-                plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
-            plt.close()
-            
-            return output_path
-            
-        except Exception as e:
-            print(f"  Graph error {name}: {e}")
-            plt.close()
-            return None
+        if params.get('accuracy_threshold'):
+            filtered = [(x, y, e) for x, y, e in zip(x_data, y_data, entries)
+                       if e.get('accuracy', 100) >= params['accuracy_threshold']]
+            if filtered:
+                x_data, y_data, entries = zip(*filtered)
+        
+        # Hata çubuğu (varsa)
+        yerr = None
+        if self.config['axes']['show_error_bars'] and any('error' in e for e in entries):
+            yerr = [e.get('error', 0) for e in entries]
+        
+        # Teorik performans çizgisi (varsa)
+        theoretical = None
+        if self.theoretical_performance and not params.get('no_theoretical'):
+            theoretical = self.theoretical_performance
+        
+        spec.update({'x_label': x_label, 'y_label': self.metrics.target.axis_label,
+                     'x_data': list(x_data), 'y_data': list(y_data),
+                     'yerr': yerr, 'theoretical': theoretical})
+        
+        return self._submit_graph(render_sota_graph, spec, output_path, digest)
     
     def _generate_multi_series_graph(self, name: str, multi_series_data: Dict[str, List[Dict]], 
-                                    title: str, x_axis: str, dpi: int, params: Dict) -> Optional[Path]:
-        """Birden çok serinin grafik oluşturulması (family için)"""
+                                    title: str, x_axis: str, dpi: int, params: Dict,
+                                    sota_series: Optional[Dict[str, List[Dict]]] = None) -> Optional[Path]:
+        """Birden çok serinin grafik oluşturulması (family için)
+        
+        Args:
+            sota_series: Serilerin önceden hesaplanmış SOTA ilerlemeleri (None ise burada hesaplanır)
+        """
         if not multi_series_data:
             return None
         
-        try:
-            fig, ax = plt.subplots(figsize=(12, 8))
-            
-            # matplotlib varsayılan renk döngüsünü kullan
-            colors = plt.cm.tab10(np.linspace(0, 1, 10))
-            
-            # Her seriyi çizdirir
-            for idx, (series_key, entries) in enumerate(multi_series_data.items()):
-                # SOTA ilerlemesini çıkarır
+        output_path = self._output_path(name)
+        digest = fingerprint('multi', multi_series_data, title, x_axis, dpi, self.metrics.target.axis_label)
+        if self._reuse_graph(output_path, digest):
+            return output_path
+        
+        series = []
+        for idx, (series_key, entries) in enumerate(multi_series_data.items()):
+            # SOTA ilerlemesini çıkarır
+            if sota_series is not None:
+                sota_entries = sota_series.get(series_key, [])
+            else:
                 sota_entries = self._extract_sota_progression(entries)
-                
-                if not sota_entries:
-                    continue
-                
-                # elapsed_seconds olan girişler için yalnızca
-                valid_entries = [e for e in sota_entries if 'elapsed_seconds' in e]
-                if not valid_entries:
-                    continue
-                
-# Zaman sırasına göre sıralama
-                valid_entries = sorted(valid_entries, key=lambda e: e['elapsed_seconds'])
-                
-                # Veri hazırlığı
-                x_data = [e['elapsed_seconds'] / 60 for e in valid_entries]  # Dakika bazında
-                y_data = [e['performance'] for e in valid_entries]
-                
-                # Grafik (basamaklı, renk otomatik atanır)
-                color = colors[idx % len(colors)]
-                ax.step(x_data, y_data, where='post', linewidth=2, 
-                       label=series_key, color=color, alpha=0.8)
-                ax.plot(x_data, y_data, 'o', markersize=4, color=color, alpha=0.8)
-            
-            # Eksen ayarları
-            ax.set_xlabel('Time (minutes from start)')
-            ax.set_ylabel('Performance (GFLOPS)')
-            ax.set_title(title)
-            ax.grid(True, alpha=0.3)
-            ax.legend(loc='best')
-            
-            # tick sayısı sınırı
-            ax.xaxis.set_major_locator(ticker.MaxNLocator(nbins=15))
             
-            # Çıktı yolu
-            output_dir = self.output_base / name.rsplit('/', 1)[0]
-            output_dir.mkdir(parents=True, exist_ok=True)
-            output_path = output_dir / f"{name.rsplit('/', 1)[-1]}.png"
-            
-            # Kaydet
-            plt.savefig(output_path, dpi=dpi, bbox_inches='tight')
-            plt.close()
+            # elapsed_seconds olan girişler için yalnızca
+            valid_entries = [e for e in sota_entries if 'elapsed_seconds' in e]
+            if not valid_entries:
+                continue
             
-            return output_path
+# Zaman sırasına göre sıralama
+            valid_entries = sorted(valid_entries, key=lambda e: e['elapsed_seconds'])
             
-        except Exception as e:
-            print(f"  Multi-series graph error {name}: {e}")
-            plt.close()
-            return None
+            # Veri hazırlığı (dakika bazında)
+            series.append({'label': series_key, 'color_index': idx,
+                           'x': [e['elapsed_seconds'] / 60 for e in valid_entries],
+                           'y': [e['performance'] for e in valid_entries]})
+        
+        spec = {'output': str(output_path), 'title': title, 'dpi': dpi, 'series': series,
+                'y_label': self.metrics.target.axis_label}
+        
+        return self._submit_graph(render_multi_series_graph, spec, output_path, digest)
     
     def _extract_sota_progression(self, entries: List[Dict]) -> List[Dict]:
-        """TODO: Add docstring"""
+        """Zaman sırasında SOTA'yı (metriğin yönüne göre en iyiyi) güncelleyen girdiler
+        
+        Yalnızca zamanı olan girdiler sıralanır (hiçbirinde yoksa özgün sıra korunur). Seviyeler
+        girdi listeleri yerine self.entry_table üzerinden tüm grupları tek geçişte hesaplar.
+        """
         if not entries:
             return []
-        
-        # elapsed_seconds olan girişlerle sınırlı sıralama (önemli!)
-        valid_entries = [e for e in entries if 'elapsed_seconds' in e]
-        if not valid_entries:
-            # Zaman damgası yoksa orijinal sıralamayı koru
-            valid_entries = entries
-        
-# Zaman damgasına göre sıralama
-        sorted_entries = sorted(valid_entries, key=lambda e: e.get('elapsed_seconds', float('inf')))
-        
-        sota = []
-        max_perf = 0
-        
-        for entry in sorted_entries:
-            perf = entry.get('performance', 0)
-            if perf > max_perf:
-                max_perf = perf
-                sota.append(entry)
-        
-        return sota
+        return EntryTable({'': entries}).progression(higher_is_better=self.metrics.target.higher_is_better)
     
     def _aggregate_sota_by_time(self, entries: List[Dict]) -> List[Dict]:
         """Zaman serisinde SOTA toplama"""
-        if not entries:
-            return []
-        
-        # elapsed_seconds olan girdilerle sıralama
-        valid_entries = [e for e in entries if 'elapsed_seconds' in e]
-        if not valid_entries:
-            # Zaman damgası yoksa orijinal sıralamayı koru
-            valid_entries = entries
-        
-# Zaman damgasına göre sıralama
-        sorted_entries = sorted(valid_entries, key=lambda e: e.get('elapsed_seconds', float('inf')))
-        
-        sota = []
-        max_perf = 0
-        
-        for entry in sorted_entries:
-            perf = entry.get('performance', 0)
-            if perf > max_perf:
-                max_perf = perf
-                # Toplu giriş oluşturma
-                sota_entry = entry.copy()
-                sota_entry['generation_count'] = len(sota) + 1
-                sota.append(sota_entry)
-        
-        return sota
+        return self._with_generation_count(self._extract_sota_progression(entries))
+    
+    def _with_generation_count(self, progression: List[Dict]) -> List[Dict]:
+        """SOTA girdilerine sıra numarası (generation_count) ekle"""
+        return [dict(entry, generation_count=i + 1) for i, entry in enumerate(progression)]
     
     def _extract_agent_id(self, path: str) -> Optional[str]:
-        """Yoldan ajan IDsi çıkarma (PG1.2 formatı desteği)"""
-        import re
-        # PG1, PG1.2, PG10.3 gibi sürümleri destekler
-        match = re.search(r'PG\d+(?:\.\d+)?', path)
-        return match.group() if match else None
+        """Yoldan ajan IDsi çıkarma (PG1, PG1.2, PG10.3 gibi; sınıflandırmadan)"""
+        return self.taxonomy.classify(path)['agent_id']
     
     def _extract_hardware_key(self, path: str) -> Optional[str]:
-        """Yoldan hardware anahtarını çıkarır"""
-        # single-node/gcc11.3.0 formatını algılar
-        parts = path.split('/')
-        
-        # donanım katmanı desenleri
-        hw_patterns = ['single-node', 'multi-node', 'gpu-cluster']
-        
-        for i, part in enumerate(parts):
-            if part in hw_patterns and i + 1 < len(parts):
-                # Sonraki öğe derleyici/modüldür
-                return f"{part}/{parts[i+1]}"
-        
-        return None
+        """Yoldan hardware anahtarını çıkarır (ör: single-node/gcc11.3.0; sınıflandırmadan)"""
+        return self.taxonomy.classify(path)['hardware_key']
     
     def _parse_specific_dpis(self, specific_str: str) -> Dict[str, int]:
         """Belirli ajan DPI belirtimini çözümler
@@ -818,8 +856,8 @@ class SOTAVisualizer:
         print("SOTA Data Summary")
         print("=" * 60)
         
-        # Veri toplama
-        self._collect_all_data()
+        # Veri toplama (sayımlar tüm sürümleri kapsar: varsayılan kaynak ChangeLog.md)
+        self._collect_all_data(params.get('source') or 'changelog')
         
         # İstatistik gösterimi
         total_entries = sum(len(e) for e in self.changelog_cache.values())
@@ -830,16 +868,18 @@ class SOTAVisualizer:
         pg_count = sum(1 for p in self.changelog_cache.keys() if 'PG' in p)
         print(f"  PG agents: {pg_count}")
         
-        # En son performans TOP5
-        print("\n[TOP PERFORMANCE]")
+        # En iyi performans TOP5 (metriğin yönüne göre)
+        metric = self.metrics.target
+        print(f"\n[TOP PERFORMANCE] ({metric.label}, {'higher' if metric.higher_is_better else 'lower'} is better)")
         all_perfs = []
         for path, entries in self.changelog_cache.items():
             if entries:
-                latest = max(entries, key=lambda e: e.get('performance', 0))
-                all_perfs.append((path, latest.get('performance', 0)))
+                pick = max if metric.higher_is_better else min
+                best = pick(entries, key=lambda e: e['performance'])
+                all_perfs.append((path, best['performance']))
         
-        for path, perf in sorted(all_perfs, key=lambda x: x[1], reverse=True)[:5]:
-            print(f"  {path}: {perf:.1f} GFLOPS")
+        for path, perf in sorted(all_perfs, key=lambda x: x[1], reverse=metric.higher_is_better)[:5]:
+            print(f"  {path}: {perf:.1f} {metric.unit}")
         
         # tick sayısı kontrolü
         print("\n[TICK CHECK]")
@@ -860,8 +900,8 @@ class SOTAVisualizer:
     def _run_export_mode(self, **params) -> bool:
         """Dışa aktarma modu (çoklu proje entegrasyonu için)"""
         
-        # Veri toplama
-        self._collect_all_data()
+        # Veri toplama (dışa aktarım SOTA olmayan sürümleri de içerir: varsayılan kaynak ChangeLog.md)
+        self._collect_all_data(params.get('source') or 'changelog')
         
         # Dışa Aktarma Dizini
         export_dir = self.project_root / "Agent-shared/exports"
@@ -908,7 +948,7 @@ class SOTAVisualizer:
         specific = params.get('specific')
         
         # Veri toplama
-        self._collect_all_data()
+        self._collect_all_data(params.get('source'))
         
         # DPI ayarları
         dpi = params.get('dpi', 100)
@@ -927,13 +967,199 @@ class SOTAVisualizer:
                             dpi,
                             params
                         )
-                        if output:
+                        if output and output not in self._write_pending_graphs(params):
+                            self.fingerprints.save()
                             print(f"✅ Generated: {output}")
                             return True
         
         print("No data found for specified criteria")
         return False
 
+    
+    def _pareto_scopes(self, points: List[Dict], max_local: int) -> Dict[str, List[Dict]]:
+        """Pareto kapsamları: project, hardware/<donanım/derleyici>, local/<derleyici/teknoloji>"""
+        scopes = {'project': list(points)}
+        local_scopes = {}
+        for point in points:
+            hw_key = self._extract_hardware_key(point['path'])
+            if hw_key:
+                scopes.setdefault(f'hardware/{hw_key}', []).append(point)
+            dir_id = self.taxonomy.classify(point['path'])['label']
+            local_scopes.setdefault(f'local/{dir_id}', []).append(point)
+        scopes.update(list(local_scopes.items())[:max_local])
+        return scopes
+    
+    def _run_pareto_mode(self, **params) -> bool:
+        """Pareto modu: kapsam başına performans × doğruluk/hata × bütçe maliyeti cepheleri
+        
+        Grafikler User-shared/visualizations/sota/pareto/ altına, cepheler pareto_fronts.json'a yazılır.
+        """
+        points, skipped = collect_points(self.project_root, self.metrics)
+        print(f"  Pareto: {len(points)} versions with cost "
+              f"(skipped: {skipped['no_cost']} without cost, {skipped['gated']} below accuracy threshold)")
+        if not points:
+            print("No versions with both performance and budget cost")
+            return False
+        
+        metric = self.metrics.target
+        dpi = params.get('dpi', self.config['dpi']['project']['linear'])
+        max_local = params.get('max_local', self.config['pipeline']['max_local_agents'])
+        fronts = {}
+        outputs = []
+        for scope, scope_points in self._pareto_scopes(points, max_local).items():
+            objectives = objectives_for(scope_points, metric.higher_is_better)
+            front, dominated = pareto_front(scope_points, objectives)
+            fronts[scope] = {'objectives': [key for key, _ in objectives],
+                             'versions': len(scope_points), 'front': front}
+            outputs.append(self._generate_pareto_graph(
+                f'pareto/{scope.replace("/", "_")}', front, dominated, f"Pareto: {scope}", dpi))
+        
+        failed = self._write_pending_graphs(params)
+        self.fingerprints.save()
+        
+        summary_path = self.output_dirs['pareto'] / 'pareto_fronts.json'
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(summary_path, 'w') as f:
+            json.dump({'timestamp': datetime.now(timezone.utc).isoformat(),
+                       'metric': {'name': metric.name, 'unit': metric.unit, 'direction': metric.direction},
+                       'cost_unit': 'points', 'skipped': skipped, 'fronts': fronts}, f, indent=2)
+        
+        project = fronts['project']
+        print(f"\n[PARETO FRONT] project: {len(project['front'])}/{project['versions']} versions "
+              f"({', '.join(project['objectives'])})")
+        for point in project['front'][:20]:
+            accuracy = f", {point['accuracy']}%" if 'accuracy' in point else ''
+            print(f"  {point['path']} {point['version']}: {metric.format(point['performance'])}, "
+                  f"{point['cost']:.1f} pt{accuracy}")
+        if len(project['front']) > 20:
+            print(f"  ... {len(project['front']) - 20} more (see {summary_path.name})")
+        print(f"✅ {len(outputs) - len(failed)} graphs, fronts: {summary_path}")
+        return not failed
+    
+    def _generate_pareto_graph(self, name: str, front: List[Dict], dominated: List[Dict],
+                               title: str, dpi: int) -> Path:
+        """Pareto grafiği: maliyet (x) × performans (y)
+        
+        Yalnızca maliyet ve performansta baskın olmayanlar basamaklı çizgiyle ve sürüm etiketiyle,
+        doğruluk/hata sayesinde cephede kalanlar turuncu, baskın olunanlar gri çizilir.
+        """
+        output_path = self._output_path(name)
+        metric = self.metrics.target
+        digest = fingerprint('pareto', front, dominated, title, dpi, metric.axis_label)
+        if self._reuse_graph(output_path, digest):
+            return output_path
+        
+        cost_front, others = pareto_front(front, [('performance', metric.higher_is_better), ('cost', False)])
+        spec = {'output': str(output_path), 'title': title, 'dpi': dpi, 'y_label': metric.axis_label,
+                'cost_front_x': [p['cost'] for p in cost_front],
+                'cost_front_y': [p['performance'] for p in cost_front],
+                'cost_front_labels': [p['version'] + (f" ({p['accuracy']}%)" if 'accuracy' in p else '')
+                                      for p in cost_front],
+                'front_x': [p['cost'] for p in others], 'front_y': [p['performance'] for p in others],
+                'other_x': [p['cost'] for p in dominated], 'other_y': [p['performance'] for p in dominated]}
+        return self._submit_graph(render_pareto_graph, spec, output_path, digest)
+
+X_FORMATTERS = {
+    'm': lambda x, pos: f'{x:.0f}m',
+    'h': lambda x, pos: f'{x:.1f}h',
+    'd': lambda x, pos: f'{x:.1f}d',
+}
+
+
+def render_sota_graph(spec: Dict) -> bytes:
+    """Tek seri SOTA grafiği (basamaklı, mavi tonlarında); çizim servisi işi, PNG baytları döner"""
+    fig, ax = reusable_axes('sota', (10, 6))
+    x_data, y_data = spec['x_data'], spec['y_data']
+    
+    if spec['x_format']:
+        ax.xaxis.set_major_formatter(ticker.FuncFormatter(X_FORMATTERS[spec['x_format']]))
+    if spec['x_ticklabels']:
+        ax.set_xticks(x_data)
+        ax.set_xticklabels(spec['x_ticklabels'], rotation=45)
+    
+    # Grafik (Basamaklı, mavi tonlarında)
+    ax.step(x_data, y_data, 'b-', where='post', linewidth=2, label='SOTA', alpha=0.8)
+    ax.plot(x_data, y_data, 'bo', markersize=6, alpha=0.8)
+    
+    if spec['yerr'] is not None:
+        ax.errorbar(x_data, y_data, yerr=spec['yerr'], fmt='none', ecolor='gray', alpha=0.5)
+    
+    if spec['theoretical']:
+        ax.axhline(y=spec['theoretical'], color='gray', linestyle='--', alpha=0.5, label='Theoretical')
+    
+    # tick sayısı sınırı (MAXTICKS önlemi)
+    ax.xaxis.set_major_locator(ticker.MaxNLocator(nbins=15))
+    
+    # Ölçek ayarı
+    if spec['log_scale']:
+        ax.set_yscale('log')
+    
+    ax.set_xlabel(spec['x_label'])
+    ax.set_ylabel(spec['y_label'])
+    ax.set_title(spec['title'])
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    
+    # Kaydetme (sıkıştırma ve minimizasyon)
+    # compress_level sadece matplotlib 3.8+ ile uyumludur
+    try:
+        return figure_png(fig, dpi=spec['dpi'], bbox_inches='tight',
+                          compress_level=spec['compress_level'])
+    except TypeError:
+        # Eski matplotlib sürümleri compress_level özelliğini desteklemiyor
+        return figure_png(fig, dpi=spec['dpi'], bbox_inches='tight')
+
+
+def render_multi_series_graph(spec: Dict) -> bytes:
+    """Birden çok serinin basamaklı grafiği (family için); çizim servisi işi, PNG baytları döner"""
+    fig, ax = reusable_axes('sota_multi', (12, 8))
+    
+    # matplotlib varsayılan renk döngüsünü kullan
+    colors = plt.cm.tab10(np.linspace(0, 1, 10))
+    
+    # Her seriyi çizdirir (basamaklı, renk otomatik atanır)
+    for series in spec['series']:
+        color = colors[series['color_index'] % len(colors)]
+        ax.step(series['x'], series['y'], where='post', linewidth=2,
+               label=series['label'], color=color, alpha=0.8)
+        ax.plot(series['x'], series['y'], 'o', markersize=4, color=color, alpha=0.8)
+    
+    # Eksen ayarları
+    ax.set_xlabel('Time (minutes from start)')
+    ax.set_ylabel(spec['y_label'])
+    ax.set_title(spec['title'])
+    ax.grid(True, alpha=0.3)
+    ax.legend(loc='best')
+    
+    # tick sayısı sınırı
+    ax.xaxis.set_major_locator(ticker.MaxNLocator(nbins=15))
+    
+    return figure_png(fig, dpi=spec['dpi'], bbox_inches='tight')
+
+
+def render_pareto_graph(spec: Dict) -> bytes:
+    """Pareto cephesi grafiği (maliyet × performans); çizim servisi işi, PNG baytları döner"""
+    fig, ax = reusable_axes('pareto', (10, 6))
+    
+    if spec['other_x']:
+        ax.plot(spec['other_x'], spec['other_y'], 'o', color='gray', markersize=4, alpha=0.4,
+                label='Dominated')
+    if spec['front_x']:
+        ax.plot(spec['front_x'], spec['front_y'], 'o', color='orange', markersize=6, alpha=0.8,
+                label='Pareto front (accuracy/error)')
+    ax.step(spec['cost_front_x'], spec['cost_front_y'], 'r-', where='post', linewidth=1.5, alpha=0.6)
+    ax.plot(spec['cost_front_x'], spec['cost_front_y'], 'ro', markersize=7, alpha=0.9,
+            label='Pareto front (cost × performance)')
+    for x, y, label in zip(spec['cost_front_x'], spec['cost_front_y'], spec['cost_front_labels']):
+        ax.annotate(label, (x, y), textcoords='offset points', xytext=(5, 5), fontsize=8)
+    
+    ax.set_xlabel('Budget cost (points)')
+    ax.set_ylabel(spec['y_label'])
+    ax.set_title(spec['title'])
+    ax.grid(True, alpha=0.3)
+    ax.legend(loc='best')
+    
+    return figure_png(fig, dpi=spec['dpi'], bbox_inches='tight')
 
 def main():
     """TODO: Add docstring"""
@@ -957,6 +1183,9 @@ Examples:
 # Veri dışa aktarma
   python sota_visualizer.py --export
   
+# Performans × doğruluk × bütçe Pareto cepheleri
+  python sota_visualizer.py --pareto
+  
 # SE özel çalıştırma
   python sota_visualizer.py --levels local,project --dpi 80
         """
@@ -971,6 +1200,8 @@ Examples:
                        help='Show summary without generating graphs')
     parser.add_argument('--export', action='store_true',
                        help='Export data for multi-project analysis')
+    parser.add_argument('--pareto', action='store_true',
+                       help='Pareto fronts of performance, accuracy/error and budget cost')
     parser.add_argument('--single', action='store_true',
                        help='Single graph generation mode')
     
@@ -980,7 +1211,15 @@ Examples:
     parser.add_argument('--force', action='store_true',
                        help='Force execution even if locked')
     parser.add_argument('--no-delay', action='store_true',
-                       help='No IO delay between levels')
+                       help='No write bandwidth limit (bytes/sec)')
+    parser.add_argument('--source', choices=['auto', 'history', 'changelog'],
+                       help='Data source: SOTA history log, ChangeLog.md files, or both (default: config; --summary/--export: changelog)')
+    parser.add_argument('--workers', type=int,
+                       help='Render processes (0: render in this process; default: config or CPU count)')
+    parser.add_argument('--rebuild', action='store_true',
+                       help='Ignore graph fingerprints and redraw every graph')
+    parser.add_argument('--max-local', type=int,
+                       help='Maximum local directories (graphs / Pareto scopes; default: pipeline.max_local_agents)')
     
     # Grafik kontrolü
     parser.add_argument('--specific', type=str,
@@ -1019,14 +1258,23 @@ Examples:
     # Visualizer oluşturma
     visualizer = SOTAVisualizer(project_root)
     
+    # Grafik üreten modlarda çizim süreç havuzu (özet/dışa aktarma süreç açmaz)
+    if not (args.summary or args.export):
+        workers = args.workers
+        if workers is None:
+            workers = visualizer.config['pipeline'].get('render_workers')
+        visualizer.renderer = RenderService(default_workers() if workers is None else workers)
+    
     # Parametre oluşturma
     params = {
         'force': args.force,
         'no_delay': args.no_delay,
+        'rebuild': args.rebuild,
         'specific': args.specific,
         'x_axis': args.x_axis,
         'accuracy_threshold': args.accuracy_threshold,
-        'no_theoretical': args.no_theoretical
+        'no_theoretical': args.no_theoretical,
+        'source': args.source
     }
     
     if args.levels:
@@ -1035,6 +1283,9 @@ Examples:
     if args.dpi:
         params['dpi'] = args.dpi
     
+    if args.max_local is not None:
+        params['max_local'] = args.max_local
+    
     # Mod belirleme ve yürütme
     if args.summary:
         success = visualizer.run('summary', **params)
@@ -1042,12 +1293,15 @@ Examples:
         success = visualizer.run('export', **params)
     elif args.debug:
         success = visualizer.run('debug', **params)
+    elif args.pareto:
+        success = visualizer.run('pareto', **params)
     elif args.single:
         params['level'] = args.level
         success = visualizer.run('single', **params)
     else:
         success = visualizer.run('pipeline', **params)
     
+    visualizer.renderer.close()
     sys.exit(0 if success else 1)
 
 
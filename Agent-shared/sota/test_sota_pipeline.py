@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+sota_registry.py / pipeline_lock.py / sota_progression.py için test hata ayıklama kodu
+- cas_sota_file: aynı anda yazan süreçlerden yalnızca daha iyi değer kazanır
+- PipelineLock.run_coalesced: kilit meşgulken gelen istekler tek takip çalıştırmasında birleşir
+- segmented_progression: basit Python döngüsüyle aynı SOTA girdileri
+"""
+
+import sys
+import tempfile
+import multiprocessing
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from sota_registry import cas_sota_file, read_sota_value
+from pipeline_lock import PipelineLock
+from sota_progression import EntryTable, segmented_progression
+from metric_registry import BUILTIN_METRICS
+
+failures = []
+
+def check(label, ok):
+    """Sonucu yazdır (başarısızlar sonunda toplanır)"""
+    print(f"  - {label}: {'✅' if ok else '❌'}")
+    if not ok:
+        failures.append(label)
+
+def cas_writer(args):
+    """Süreç havuzu işçisi: engelde bekleyip cas_sota_file çağır"""
+    path, value, metric_name = args
+    cas_writer.barrier.wait()
+    written, previous = cas_sota_file(Path(path), value, {'version': f'v{value}'},
+                                      BUILTIN_METRICS[metric_name])
+    return value, written, previous
+
+def init_writer(barrier):
+    cas_writer.barrier = barrier
+
+def run_cas(path, values, metric_name):
+    """Tüm değerleri aynı anda yaz; (değer, yazıldı mı, önceki değer) listesi"""
+    barrier = multiprocessing.Barrier(len(values))
+    with multiprocessing.Pool(len(values), initializer=init_writer, initargs=(barrier,)) as pool:
+        return pool.map(cas_writer, [(str(path), value, metric_name) for value in values])
+
+def naive_progression(groups, elapsed, performance, higher_is_better):
+    """segmented_progression'ın başvuru uygulaması (grup başına sıralama + tarama)"""
+    result = []
+    for group in sorted(set(int(g) for g in groups if g >= 0)):
+        members = [i for i in range(len(groups)) if groups[i] == group and not np.isnan(performance[i])]
+        timed = [i for i in members if not np.isnan(elapsed[i])]
+        if timed:
+            members = sorted(timed, key=lambda i: elapsed[i])  # sorted kararlıdır
+        best = None
+        for i in members:
+            value = performance[i]
+            if best is None or (value > best if higher_is_better else value < best):
+                result.append(i)
+                best = value
+    return result
+
+def run_test():
+    """Test çalıştırma"""
+    print("=" * 60)
+    print("SOTA boru hattı test başlangıcı")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        # Test senaryosu 1: Aynı anda iki yazan
+        print("\n[Test1] cas_sota_file iki yazan")
+        print("-" * 40)
+
+        # Sıralama zamanlamaya bağlı olduğundan birkaç kez denenir
+        sota_file = temp_path / "sota_local.txt"
+        for attempt in range(5):
+            sota_file.write_text('current_best: "100.0 GFLOPS"\n')
+            results = run_cas(sota_file, [150.0, 200.0], 'gflops')
+            final = read_sota_value(sota_file)
+            won = {value for value, written, _ in results if written}
+            print(f"Deneme {attempt + 1}: {results} → dosya: {final}")
+            if final != 200.0 or 200.0 not in won:
+                break
+        check("daha iyi değer (200) kazandı", final == 200.0 and 200.0 in won)
+        check("yazılanlar önceki değeri geçti",
+              all(previous is None or value > previous for value, written, previous in results if written))
+        check("reddedilenler daha iyi ya da eşit değeri gördü",
+              all(previous is not None and previous >= value for value, written, previous in results if not written))
+
+        # Test senaryosu 2: Çok yazan, küçük daha iyi (time metriği)
+        print("\n[Test2] cas_sota_file çok yazan (time, küçük daha iyi)")
+        print("-" * 40)
+
+        time_file = temp_path / "sota_time.txt"
+        values = [12.0, 9.5, 30.0, 9.5, 11.0, 8.25, 20.0, 10.0]
+        results = run_cas(time_file, values, 'time')
+        final = read_sota_value(time_file, BUILTIN_METRICS['time'])
+        writes = sorted((value for value, written, _ in results if written), reverse=True)
+        chain = {previous: value for value, written, previous in results if written}
+        print(f"Yazılanlar: {writes} → dosya: {final}")
+        check("en küçük değer (8.25) kazandı", final == 8.25)
+        check("yazımlar kesin azalan bir zincir", len(set(writes)) == len(writes)
+              and all(chain.get(previous) == value for previous, value in zip([None] + writes, writes)))
+
+        # Test senaryosu 3: Birleştirilmiş takip çalıştırması
+        print("\n[Test3] PipelineLock.run_coalesced")
+        print("-" * 40)
+
+        lock_path = temp_path / ".sota_pipeline.lock"
+        owner, caller = PipelineLock(lock_path), PipelineLock(lock_path)
+        runs = []
+        caller_results = []
+
+        def job():
+            runs.append(len(runs))
+            if len(runs) == 1:
+                # Sahip çalışırken iki istek gelir: ikisi de atlanır ve tek takip çalıştırması ister
+                caller_results.append(caller.run_coalesced(lambda: True))
+                caller_results.append(caller.run_coalesced(lambda: True))
+            return True
+
+        result = owner.run_coalesced(job)
+        print(f"Sahip çalıştırma sayısı: {len(runs)}, çağıran sonuçları: {caller_results}, sonuç: {result}")
+        check("meşgul kilitte çağıranlar None döndü", caller_results == [None, None])
+        check("iki istek tek takip çalıştırmasında birleşti", len(runs) == 2 and result is True)
+        check("bekleyen istek kalmadı", not owner.followup_requested())
+        check("kilit bırakıldı", caller.acquire())
+        caller.release()
+
+        caller.request_followup()  # Sahip bıraktıktan sonra kalmış istek
+        late_runs = []
+        owner.run_coalesced(lambda: late_runs.append(1) or True)
+        check("kalmış istek ilk çalıştırmada karşılandı (ek çalıştırma yok)",
+              len(late_runs) == 1 and not owner.followup_requested())
+
+    # Test senaryosu 4: NumPy ilerlemesi ve basit döngü
+    print("\n[Test4] segmented_progression ve basit döngü")
+    print("-" * 40)
+
+    rng = np.random.default_rng(42)
+    mismatches = 0
+    for trial in range(300):
+        n = int(rng.integers(1, 40))
+        groups = rng.integers(-1, 5, n)
+        elapsed = rng.integers(0, 10, n).astype(float)  # Eşit zamanlar
+        elapsed[rng.random(n) < 0.2] = np.nan
+        if trial % 10 == 0:
+            elapsed[groups == 0] = np.nan  # Hiç zamanı olmayan grup: özgün sıra
+        performance = rng.integers(0, 8, n).astype(float)  # Eşit değerler
+        performance[rng.random(n) < 0.1] = np.nan
+        for higher_is_better in (True, False):
+            fast = segmented_progression(groups, elapsed, performance, higher_is_better).tolist()
+            slow = naive_progression(groups, elapsed, performance, higher_is_better)
+            mismatches += fast != slow
+    print(f"300 rastgele durum x 2 yön, uyuşmazlık: {mismatches}")
+    check("NumPy sürümü basit döngüyle aynı", mismatches == 0)
+
+    table = EntryTable({
+        'a/PG1.1': [{'elapsed_seconds': 10, 'performance': 5.0}, {'elapsed_seconds': 20, 'performance': 4.0}],
+        'b/PG1.2': [{'elapsed_seconds': 5, 'performance': 3.0}, {'elapsed_seconds': 30, 'performance': None}],
+    })
+    progression = [entry['performance'] for entry in table.progression()]
+    lower = [entry['performance'] for entry in table.progression(higher_is_better=False)]
+    print(f"EntryTable ilerlemesi: {progression}, küçük daha iyi: {lower}")
+    check("EntryTable zaman sırası ve yön", progression == [3.0, 5.0] and lower == [3.0])
+
+if __name__ == "__main__":
+    try:
+        run_test()
+        print("\n" + "=" * 60)
+        if failures:
+            print(f"❌ Başarısız kontroller: {len(failures)}")
+            print("=" * 60)
+            sys.exit(1)
+        print("✅ Test tamamlandı")
+        print("=" * 60)
+    except Exception as e:
+        print(f"\n❌ Hata oluştu: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
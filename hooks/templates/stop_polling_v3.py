@@ -420,7 +420,61 @@ def get_agent_tasks(agent_id, config):
     return task_list
 
 
-def generate_block_reason(stop_count, agent_info):
+def refresh_context_usage(agent_id, project_root, transcript_path):
+    """Oturum dosyasının eklenen kısmından son usage kaydını oku ve durum dosyasına yaz (hata: None)"""
+    try:
+        sys.path.insert(0, str(project_root / "telemetry"))
+        from latest_usage_state import LatestUsageState
+        state = LatestUsageState(project_root)
+        with state.transaction():
+            return state.update_file(Path(transcript_path), agent_id)
+    except Exception:
+        return None
+
+
+def get_context_usage(agent_id, project_root, transcript_path=None):
+    """Ajanın son bağlam kullanımı (izleme daemon'unun durum dosyasından; yoksa boş dize)
+
+    Oturum dosyası durum dosyasındaki kayıttan sonra değişmişse (daemon henüz işlemediyse)
+    eklenen kısım okunur.
+    """
+    state_file = project_root / ".cache" / "context_monitor" / "latest_usage.json"
+    try:
+        with open(state_file, 'r') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = {}
+    usage = state.get("agents", {}).get(agent_id)
+    if transcript_path and agent_id != 'unknown':
+        try:
+            st = os.stat(transcript_path)
+            seen = state.get("files", {}).get(str(transcript_path)) or {}
+            if seen.get("inode") != st.st_ino or seen.get("size") != st.st_size:
+                usage = refresh_context_usage(agent_id, project_root, transcript_path) or usage
+        except OSError:
+            pass
+    if not usage:
+        return ""
+    line = f"[Bağlam kullanımı: {usage['total']:,} token ({usage['percentage']}%), son kayıt: {usage['timestamp']}]\n"
+    # auto-compact tahmini (%90 aralık); yakınsa devir uyarısı
+    prediction = usage.get("prediction") or {}
+    turns = prediction.get("turns")
+    if turns is not None:
+        low = prediction.get("turns_low")
+        high = prediction.get("turns_high")
+        band = f"{int(low + 0.999) if low is not None else '?'}-{int(high + 0.999) if high is not None else '?'}"
+        line += f"[auto-compact'a tahmini ~{int(turns + 0.999)} tur kaldı (aralık: {band})"
+        seconds = prediction.get("seconds")
+        if seconds is not None:
+            line += f", ~{int(seconds / 60)} dk" if seconds < 3600 else f", ~{seconds / 3600:.1f} sa"
+        line += "]\n"
+        if low is not None and low <= 3:
+            line += ("⚠️ Bağlam yakında sıkıştırılacak: devam eden işin durumunu ChangeLog.md'ye yazın "
+                     "ve gerekiyorsa PM'e devir için bildirin.\n")
+    return line
+
+
+def generate_block_reason(stop_count, agent_info, transcript_path=None):
     """Blok nedenini oluşturur"""
     agent_id = agent_info.get('agent_id', 'unknown')
     threshold = get_stop_threshold(agent_id)
@@ -465,7 +519,7 @@ sleep 20 vb. çalıştırın → durmadan ek iş olup olmadığını kontrol edi
     # Normal blok
     reason = f"""Siz bir polling tipi ajanısınız ({agent_id}). Bekleme moduna geçmeniz izinli değildir.
 [STOP denemesi: {stop_count}/{threshold}]
-
+{get_context_usage(agent_id, project_root, transcript_path)}
 ## Durdurma Yöntemi Rehberi (her seferinde gösterilir)
 Kendi kendinize tamamen duramazsınız. Gerekirse aşağıdaki adımları izleyin:
 
@@ -542,7 +596,7 @@ def main():
         stop_count = increment_stop_count()
         
         # Blok nedenini oluşturur
-        reason = generate_block_reason(stop_count, agent_info)
+        reason = generate_block_reason(stop_count, agent_info, input_data.get('transcript_path'))
         
         # Çıkış kodu 2 ile stderr'ye çıktı (Stop olayını engelle)
         print(reason, file=sys.stderr)
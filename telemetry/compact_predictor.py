@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Ajan başına auto-compact tahmini
+
+Her usage kaydının toplamı o turdaki bağlam boyutudur. Son auto-compact'tan (bağlamın ani
+düşüşü) sonraki turlara doğrusal eğilim uydurularak eşiğe kaç tur ve ne kadar süre kaldığı,
+güven aralığıyla birlikte tahmin edilir.
+
+İki aşama:
+- fit(): seriden model (tur başına artış ve aralığı, tur başına süre ve aralığı)
+- project(): modeli en son bağlam boyutuna uygula (yeni kayıt geldikçe seri yeniden okunmadan)
+
+Model ve tahmin düz sözlüklerdir; latest_usage.json içinde saklanır ve stop hook'ları
+tarafından içe aktarma gerekmeden okunur.
+"""
+
+import math
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+import numpy as np
+
+from usage_series import UsageSeries
+
+AUTO_COMPACT_THRESHOLD = 160000  # Gerçek auto-compact tetik noktası (tahmini)
+FIT_TURNS = 20  # Eğilim için kullanılan son tur sayısı
+MIN_FIT_TURNS = 3
+COMPACT_DROP_RATIO = 0.5  # Bağlam bir turda bu oranın altına düşerse compact olmuş sayılır
+BAND_Z = 1.645  # %90 güven aralığı
+
+
+def compaction_start(totals: np.ndarray) -> int:
+    """Son auto-compact'tan sonraki ilk turun indeksi (compact yoksa 0)"""
+    drops = np.nonzero(totals[1:] < totals[:-1] * COMPACT_DROP_RATIO)[0]
+    return int(drops[-1]) + 1 if drops.size else 0
+
+
+def fit(series: UsageSeries) -> Optional[Dict]:
+    """Bağlam boyutu serisinden tahmin modeli çıkar (yeterli tur yoksa None)
+
+    Returns:
+        growth_per_turn ve %90 aralığı (growth_low/growth_high), tur başına dalgalanma
+        (residual_std), tur başına süre (sec_per_turn medyan, sec_per_turn_low/high çeyrekler)
+        ve kullanılan tur sayısı
+    """
+    if len(series) < MIN_FIT_TURNS:
+        return None
+    totals = series.total
+    start = max(compaction_start(totals), len(totals) - FIT_TURNS)
+    y = totals[start:].astype(np.float64)
+    n = len(y)
+    if n < MIN_FIT_TURNS:
+        return None
+
+    x = np.arange(n, dtype=np.float64)
+    slope, intercept = np.polyfit(x, y, 1)
+    residuals = y - (slope * x + intercept)
+    sxx = float(np.sum((x - x.mean()) ** 2))
+    residual_std = math.sqrt(float(np.sum(residuals ** 2)) / (n - 2)) if n > 2 else 0.0
+    slope_se = residual_std / math.sqrt(sxx)
+
+    intervals = np.diff(series.ts[start:]) / 1000
+    intervals = intervals[intervals > 0]
+    if intervals.size:
+        sec_low, sec_median, sec_high = (float(v) for v in np.percentile(intervals, [25, 50, 75]))
+    else:
+        sec_low = sec_median = sec_high = None
+
+    return {
+        'growth_per_turn': float(slope),
+        'growth_low': float(slope - BAND_Z * slope_se),
+        'growth_high': float(slope + BAND_Z * slope_se),
+        'residual_std': residual_std,
+        'sec_per_turn': sec_median,
+        'sec_per_turn_low': sec_low,
+        'sec_per_turn_high': sec_high,
+        'samples': n,
+    }
+
+
+def _turns(remaining: float, growth: float) -> Optional[float]:
+    """Kalan token'ın tüketileceği tur sayısı (bağlam büyümüyorsa None)"""
+    if remaining <= 0:
+        return 0.0
+    return remaining / growth if growth > 0 else None
+
+
+def project(model: Dict, total: int, timestamp_ms: Optional[int] = None,
+            threshold: int = AUTO_COMPACT_THRESHOLD) -> Dict:
+    """Modeli en son bağlam boyutuna uygula
+
+    Aralığın alt ucu hızlı büyüme, turlar arası dalgalanmanın üst sınırı ve kısa turlarla;
+    üst ucu yavaş büyüme, dalgalanmanın alt sınırı ve uzun turlarla hesaplanır.
+    Üst uçta büyüme sıfır olabiliyorsa sınır None (belirsiz) olur.
+    """
+    remaining = threshold - total
+    noise = BAND_Z * model.get('residual_std', 0.0)
+    turns = _turns(remaining, model['growth_per_turn'])
+    turns_low = _turns(remaining - noise, model['growth_high'])
+    turns_high = _turns(remaining + noise, model['growth_low'])
+
+    def seconds(n, sec_per_turn):
+        return n * sec_per_turn if n is not None and sec_per_turn is not None else None
+
+    prediction = {
+        'remaining_tokens': max(remaining, 0),
+        'turns': turns,
+        'turns_low': turns_low,
+        'turns_high': turns_high,
+        'seconds': seconds(turns, model['sec_per_turn']),
+        'seconds_low': seconds(turns_low, model['sec_per_turn_low']),
+        'seconds_high': seconds(turns_high, model['sec_per_turn_high']),
+        'eta': None,
+    }
+    if prediction['seconds'] is not None and timestamp_ms is not None:
+        eta = datetime.fromtimestamp(timestamp_ms / 1000 + prediction['seconds'], timezone.utc)
+        prediction['eta'] = eta.strftime('%Y-%m-%dT%H:%M:%SZ')
+    return prediction
+
+
+def predict(series: UsageSeries, threshold: int = AUTO_COMPACT_THRESHOLD) -> Optional[Dict]:
+    """Serinin son kaydı için tahmin (model alanları 'model' altında)"""
+    model = fit(series)
+    if model is None:
+        return None
+    prediction = project(model, int(series.total[-1]), int(series.ts[-1]), threshold)
+    prediction['model'] = model
+    return prediction
+
+
+def format_prediction(prediction: Optional[Dict]) -> str:
+    """Kısa metin: '~3 tur (2-5), ~12m'"""
+    if not prediction or prediction.get('turns') is None:
+        return "N/A"
+    if prediction['turns'] == 0:
+        return "şimdi"
+
+    def turns(value):
+        return '?' if value is None else str(math.ceil(value))
+
+    def duration(value):
+        if value is None:
+            return '?'
+        return f"{int(value / 60)}m" if value < 3600 else f"{value / 3600:.1f}h"
+
+    text = (f"~{turns(prediction['turns'])} tur "
+            f"({turns(prediction['turns_low'])}-{turns(prediction['turns_high'])})")
+    if prediction.get('seconds') is not None:
+        text += f", ~{duration(prediction['seconds'])}"
+    return text
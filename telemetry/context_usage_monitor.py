@@ -9,7 +9,7 @@ Claude Code JSONL günlüklerinden token kullanımını analiz eder ve çeşitli
 2. ~/.claude/projects/ altındaki JSONL günlüklerini izler
 3. usage bilgilerini çıkarır ve toplam/akümülasyon token sayılarını hesaplar
 4. Çeşitli grafik türleriyle görselleştirir (yığılmış çubuk, çizgi, genel görünüm)
-5. auto-compact (~160K) için öngörü
+5. auto-compact (~160K) için öngörü (kalan tur/süre ve güven aralığı)
 6. Hafif önbellek sistemi (opsiyonel)
 7. Hızlı durum (quick status) kontrolü
 8. Zaman sınırı seçeneği (--max-minutes) ile grafik kapsamını kısıtlama
@@ -30,8 +30,14 @@ import matplotlib.dates as mdates
 from collections import defaultdict, OrderedDict
 from typing import Dict, List, Tuple, Optional
 import numpy as np
-import pickle
-import gzip
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from usage_log_reader import UsageLogReader, ingest_files
+from usage_series import UsageSeries, TOKEN_TYPES
+from compact_predictor import predict, format_prediction
+from render_service import RenderService, reusable_axes
+from latest_usage_state import LatestUsageState
 
 # Grafik stil ayarları
 try:
@@ -41,6 +47,45 @@ except:
 plt.rcParams['figure.figsize'] = (14, 10)
 plt.rcParams['font.size'] = 10
 
+# Paralel işleme sınırları
+MAX_IO_WORKERS = 8  # Aynı anda okunan oturum dosyası (disk G/Ç sınırı)
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024  # Bu kadar birikmiş günlüğü olan ajanlar havuza gönderilir
+
+
+def _render_agent_graphs(project_root: Path, max_minutes: Optional[int], is_cumulative: bool,
+                         agent_id: str, series: 'UsageSeries') -> str:
+    """Süreç havuzu işçisi: tek ajanın ayrıntı grafiklerini üret"""
+    monitor = ContextUsageMonitor(project_root, use_cache=False, max_minutes=max_minutes, workers=1)
+    monitor.is_cumulative = is_cumulative
+    monitor.generate_agent_detail_graphs(agent_id, series)
+    return agent_id
+
+def render_overview_graph(spec: Dict) -> Path:
+    """Genel görünüm çizgi grafiği (basamak stili); çizim servisi işi"""
+    fig, ax = reusable_axes('context_overview', (12, 8))
+    
+    for series in spec['series']:
+        ax.step(series['x'], series['y'], where='post', marker='o', markersize=3,
+                label=series['label'], alpha=0.8)
+    
+    # Eşik çizgileri
+    for y, color, linewidth, label in spec['thresholds']:
+        ax.axhline(y=y, color=color, linestyle='--', linewidth=linewidth, label=label)
+    
+    ax.set_xlabel(spec['xlabel'])
+    ax.set_ylabel(spec['ylabel'])
+    ax.set_title(spec['title'])
+    ax.legend(loc='upper left', bbox_to_anchor=(1.02, 1))
+    ax.grid(True, alpha=0.3)
+    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x/1000)}K'))
+    
+    if spec['xlim']:
+        ax.set_xlim(*spec['xlim'])
+    
+    fig.tight_layout()
+    fig.savefig(spec['output'], dpi=120, bbox_inches='tight')
+    return Path(spec['output'])
+
 class ContextUsageMonitor:
     """Bağlam kullanım oranı izleme sınıfı"""
 
@@ -51,8 +96,15 @@ class ContextUsageMonitor:
     AUTO_COMPACT_THRESHOLD = 160000  # Gerçek auto-compact tetik noktası (tahmini)
     WARNING_THRESHOLD = 140000  # Uyarı eşiği
     
-    def __init__(self, project_root: Path, use_cache: bool = True, max_minutes: Optional[int] = None):
-        """Bağlam kullanım monitörünü başlat"""
+    def __init__(self, project_root: Path, use_cache: bool = True, max_minutes: Optional[int] = None,
+                 workers: Optional[int] = None, renderer: Optional[RenderService] = None):
+        """Bağlam kullanım monitörünü başlat
+
+        Args:
+            workers: Ajan başına ayrıştırma/grafik için süreç sayısı (None: çekirdek sayısı, en fazla MAX_IO_WORKERS)
+            renderer: Genel görünüm grafikleri için çizim servisi (None ise aynı süreçte çizilir)
+        """
+        self.project_root = Path(project_root)
         self.claude_projects_dir = self._get_claude_projects_dir()
         self.output_dir = project_root / "User-shared" / "visualizations"
 # Önbellek ayarları
@@ -61,48 +113,15 @@ class ContextUsageMonitor:
         
         self.use_cache = use_cache
         self.cache_dir = project_root / ".cache" / "context_monitor"
-        if self.use_cache:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Oturum başına bayt konumu kontrol noktası: yalnızca yeni eklenen satırlar ayrıştırılır
+        self.usage_reader = UsageLogReader(self.cache_dir if use_cache else None)
+        self.workers = workers if workers else min(os.cpu_count() or 1, MAX_IO_WORKERS)
+        self.renderer = renderer or RenderService()
     
     def _get_claude_projects_dir(self) -> Path:
         """TODO: Add docstring"""
         return Path.home() / ".claude" / "projects"
     
-    def get_cache_path(self, agent_id: str, jsonl_file: Path) -> Path:
-        """TODO: Add docstring"""
-        cache_name = f"{agent_id}_{jsonl_file.stem}.pkl.gz"
-        return self.cache_dir / cache_name
-    
-# Dosyanın güncelleme zamanını karşılaştır
-    def load_from_cache(self, cache_path: Path, jsonl_file: Path) -> Optional[List[Dict]]:
-        """TODO: Add docstring"""
-        if not self.use_cache or not cache_path.exists():
-            return None  # JSONL daha yeni
-            
-        cache_mtime = cache_path.stat().st_mtime
-        jsonl_mtime = jsonl_file.stat().st_mtime
-        
-        if jsonl_mtime > cache_mtime:
-            return None  # JSONL daha yeni
-            
-        try:
-            with gzip.open(cache_path, 'rb') as f:
-                return pickle.load(f)
-        except:
-            return None
-    
-    def save_to_cache(self, cache_path: Path, data: List[Dict]):
-        """TODO: Add docstring"""
-        if not self.use_cache:
-            return
-            
-        try:
-            with gzip.open(cache_path, 'wb') as f:
-                pickle.dump(data, f)
-        except:
-# Ajan bilgilerini yükle
-            pass  # Önbelleğe alma başarısızsa yoksay
-    
     def find_project_jsonl_files(self) -> Dict[str, List[Path]]:
         """TODO: Add docstring"""
         agent_table_path = self.project_root / "Agent-shared" / "agent_and_pane_id_table.jsonl"
@@ -199,130 +218,92 @@ class ContextUsageMonitor:
         
         return agent_files
     
-    def parse_usage_data(self, jsonl_file: Path, agent_id: str, last_n: Optional[int] = None,
-                        max_minutes: Optional[int] = None) -> List[Dict]:
-        """JSONL dosyasından usage bilgilerini çıkar (önbellek ve zaman sınırı destekli)"""
-        
-        cache_path = self.get_cache_path(agent_id, jsonl_file)
-# Önbelleğe kaydet
-        cached_data = self.load_from_cache(cache_path, jsonl_file)
-# Zaman sınırı ve last_n uygulanıyor
-        if cached_data is not None:
-            filtered_data = self._apply_time_filter(cached_data, max_minutes)
-            if last_n and len(filtered_data) > last_n:
-                return filtered_data[-last_n:]
-            return filtered_data
-        
-        all_entries = []
-        with open(jsonl_file, 'r') as f:
-# İlk zaman damgasını al
-            for line in f:
-                if line.strip():
-                    try:
-                        entry = json.loads(line)
-                        if 'message' in entry and isinstance(entry['message'], dict):
-                            msg = entry['message']
-                            if 'usage' in msg and isinstance(msg['usage'], dict) and 'timestamp' in entry:
-                                all_entries.append({
-                                    'timestamp': entry['timestamp'],
-                                    'usage': msg['usage']
-# Zaman sınırı ile filtreleme
-                                })
-                    except (json.JSONDecodeError, KeyError, TypeError):
-                        continue
+    def collect_agent_data(self, last_n: Optional[int] = None, cumulative: bool = False,
+                           verbose: bool = True) -> Dict[str, UsageSeries]:
+        """Tüm ajanların usage verilerini topla (main ve izleme daemon'u ortak kullanır)"""
+        all_agent_data = {}
+        agent_files = self.find_project_jsonl_files()
+        self._ingest_parallel(agent_files, verbose)
         
-        self.save_to_cache(cache_path, all_entries)
+        for agent_id, files in agent_files.items():
+            if verbose:
+                print(f"  - Processing {agent_id}...")
+            
+            # Birden fazla dosya varsa birleştirilip zamana göre sıralanır;
+            # zaman sınırı ve last_n ajanın tüm serisine bir kez uygulanır
+            series = UsageSeries.concat(self.parse_usage_data(jsonl_file, agent_id)
+                                        for jsonl_file in sorted(files))
+            series = self._apply_time_filter(series, self.max_minutes)
+            if last_n and len(series) > last_n:
+                series = series[-last_n:]
+            
+            if len(series):
+                all_agent_data[agent_id] = self.calculate_cumulative_tokens(series, cumulative)
         
-        filtered_entries = self._apply_time_filter(all_entries, max_minutes)
-        if last_n and len(filtered_entries) > last_n:
-            return filtered_entries[-last_n:]
-        return filtered_entries
+        return all_agent_data
     
-    def _apply_time_filter(self, entries: List[Dict], max_minutes: Optional[int]) -> List[Dict]:
-        """TODO: Add docstring"""
-        if not max_minutes or not entries:
-            return entries
-        
-        first_timestamp = None
-        for entry in entries:
-            try:
-# Zaman damgası dönüşümü
-                ts = datetime.fromisoformat(entry['timestamp'].replace('Z', '+00:00'))
-                if first_timestamp is None or ts < first_timestamp:
-                    first_timestamp = ts
-# Kümülatif mod (geleneksel davranış)
-            except:
-                continue
+    def _ingest_parallel(self, agent_files: Dict[str, List[Path]], verbose: bool = True):
+        """Çok sayıda yeni satırı olan ajanların günlüklerini süreç havuzunda ayrıştır
+
+        İşçiler seriyi ve kontrol noktasını önbelleğe yazar; ardından ana süreç bunları
+        parse_usage_data içinde yalnızca eşler. Az değişen ajanlar (izleme modunun olağan
+        durumu) havuz açılmadan doğrudan okunur.
+        """
+        if not self.use_cache or self.workers <= 1:
+            return
         
-        if not first_timestamp:
-            return entries
+        jobs = {}
+        for agent_id, files in agent_files.items():
+            items = [(jsonl_file, self._cache_key(agent_id, jsonl_file)) for jsonl_file in sorted(files)]
+            if sum(self.usage_reader.pending_bytes(f, key) for f, key in items) >= PARALLEL_MIN_BYTES:
+                jobs[agent_id] = items
+        if len(jobs) < 2:
+            return
         
-        filtered = []
-        for entry in entries:
-            try:
-                ts = datetime.fromisoformat(entry['timestamp'].replace('Z', '+00:00'))
-                elapsed_minutes = (ts - first_timestamp).total_seconds() / 60
-                if elapsed_minutes <= max_minutes:
-# Anlık görüntü modu (her anın context kullanımı)
-                    filtered.append(entry)
-            except:
-                continue
+        if verbose:
+            print(f"  ⚙️  {len(jobs)} ajan {min(self.workers, len(jobs))} süreçle ayrıştırılıyor")
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs))) as pool:
+            futures = {pool.submit(ingest_files, self.cache_dir, items): agent_id
+                       for agent_id, items in jobs.items()}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    # Başarısız ajan parse_usage_data içinde bu süreçte yeniden okunur
+                    print(f"  ⚠️  {futures[future]}: paralel ayrıştırma başarısız ({e})")
+        
+        # İşçilerin yazdığı kontrol noktaları diskten yeniden yüklenir
+        self.usage_reader.forget([key for items in jobs.values() for _, key in items])
+    
+    @staticmethod
+    def _cache_key(agent_id: str, jsonl_file: Path) -> str:
+        return f"{agent_id}_{jsonl_file.stem}"
+    
+    def parse_usage_data(self, jsonl_file: Path, agent_id: str, last_n: Optional[int] = None,
+                        max_minutes: Optional[int] = None) -> UsageSeries:
+        """JSONL dosyasından usage bilgilerini çıkar (artımlı okuma ve zaman sınırı destekli)"""
+        series = self.usage_reader.read(jsonl_file, self._cache_key(agent_id, jsonl_file))
         
+        filtered = self._apply_time_filter(series, max_minutes)
+        if last_n and len(filtered) > last_n:
+            return filtered[-last_n:]
         return filtered
     
-    def calculate_cumulative_tokens(self, usage_entries: List[Dict], cumulative: bool = False) -> List[Tuple[datetime, Dict[str, int]]]:
-        """TODO: Add docstring"""
-        token_data = []
-        total_input = 0
-        total_cache_creation = 0
-        total_cache_read = 0
-        total_output = 0
-        
-        for entry in usage_entries:
-            ts = datetime.fromisoformat(entry['timestamp'].replace('Z', '+00:00'))
-            
-            usage = entry['usage']
-            
-            if cumulative:
-# Varsayılan sayaç tabanlı (token sayısının belirtildiği loglar)
-                total_input += usage.get('input_tokens', 0)
-                total_cache_creation += usage.get('cache_creation_input_tokens', 0)
-                total_cache_read += usage.get('cache_read_input_tokens', 0)
-                total_output += usage.get('output_tokens', 0)
-                
-                token_data.append((ts, {
-# Her ajan için ayrı grafik oluştur
-                    'input': total_input,
-                    'cache_creation': total_cache_creation,
-                    'cache_read': total_cache_read,
-                    'output': total_output,
-                    'total': total_input + total_cache_creation + total_cache_read + total_output
-                }))
-            else:
-                input_tokens = usage.get('input_tokens', 0)
-                cache_creation = usage.get('cache_creation_input_tokens', 0)
-# Uygun zamanlarda birden fazla grafik oluştur
-                cache_read = usage.get('cache_read_input_tokens', 0)
-# Belirtilen zaman sınırı veya kilometre taşında oluştur
-                output = usage.get('output_tokens', 0)
-            # Kilometre taşı zamanında, o zamana kadar grafik oluştur
-                
-                token_data.append((ts, {
-                    'input': input_tokens,
-# Kilometre taşı olmayan zaman belirtimi
-                    'cache_creation': cache_creation,
-                    'cache_read': cache_read,
-# Zaman belirtilmemişse, genel ve kilometre taşı oluştur
-# Genel grafik
-                    'output': output,
-# Proje başlangıcından geçen süreyi kontrol et
-                    'total': input_tokens + cache_creation + cache_read + output
-                }))
-                # Şimdiye kadarki geçen süreyi hesapla
-            
-        return token_data
+    def _apply_time_filter(self, series: UsageSeries, max_minutes: Optional[int]) -> UsageSeries:
+        """İlk kayıttan itibaren max_minutes dakika içindeki kayıtlar"""
+        if not max_minutes or not len(series):
+            return series
+        
+        # Seri zamana göre sıralı: ilk kayıt en eskisidir
+        return series.window(end_ms=int(series.ts[0]) + max_minutes * 60 * 1000)
+    
+    def calculate_cumulative_tokens(self, series: UsageSeries, cumulative: bool = False) -> UsageSeries:
+        """Kümülatif modda token sütunlarının birikimli toplamı, aksi halde her anın bağlam boyutu"""
+        if cumulative:
+            return series.cumulative()
+        return series
     
-    def generate_all_graphs(self, all_agent_data: Dict[str, List[Tuple[datetime, Dict[str, int]]]],
+    def generate_all_graphs(self, all_agent_data: Dict[str, UsageSeries],
 # Sadece geçen süreyi aşan kilometre taşlarını oluştur
                            graph_type: str = 'all', time_unit: str = 'minutes', cumulative: bool = False):
         """Belirtilen türde grafikleri üret"""
@@ -343,11 +324,24 @@ class ContextUsageMonitor:
             
 # max_minutes belirtilmişse, sadece bu aralıktaki verileri kullan
         if graph_type in ['all', 'individual']:
-            for agent_id, cumulative_data in all_agent_data.items():
-                if cumulative_data:
-                    self.generate_agent_detail_graphs(agent_id, cumulative_data)
+            self.generate_all_agent_detail_graphs(all_agent_data)
     
-    def generate_overview_line_graph(self, all_agent_data: Dict[str, List[Tuple[datetime, Dict[str, int]]]], 
+    def generate_all_agent_detail_graphs(self, all_agent_data: Dict[str, UsageSeries]):
+        """Ajan başına ayrıntı grafiklerini üret (birden fazla ajan varsa süreç havuzunda)"""
+        agents = [(agent_id, data) for agent_id, data in all_agent_data.items() if len(data)]
+        if self.workers <= 1 or len(agents) < 2:
+            for agent_id, cumulative_data in agents:
+                self.generate_agent_detail_graphs(agent_id, cumulative_data)
+            return
+        
+        is_cumulative = getattr(self, 'is_cumulative', False)
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(agents))) as pool:
+            futures = [pool.submit(_render_agent_graphs, self.project_root, self.max_minutes,
+                                   is_cumulative, agent_id, data) for agent_id, data in agents]
+            for future in as_completed(futures):
+                future.result()
+    
+    def generate_overview_line_graph(self, all_agent_data: Dict[str, UsageSeries], 
                                     time_unit: str = 'minutes'):
         """Genel görünüm için hafif çizgi grafiği (basamak stili)
         
@@ -370,7 +364,7 @@ class ContextUsageMonitor:
             project_start = self._get_project_start_time(all_agent_data)
             if project_start:
 # X ekseni etiketi (birime göre değişir)
-                latest_time = max([t for data in all_agent_data.values() for t, _ in data]) if all_agent_data else None
+                latest_time = max(data.time_at(-1) for data in all_agent_data.values()) if all_agent_data else None
                 if latest_time:
 # Y ekseni etiketi (kümülatif modda değişir)
                     elapsed_minutes = (latest_time - project_start).total_seconds() / 60
@@ -379,12 +373,9 @@ class ContextUsageMonitor:
                         if elapsed_minutes >= milestone:
                             self._generate_single_overview_graph(all_agent_data, time_unit, milestone)
     
-    def _generate_single_overview_graph(self, all_agent_data: Dict[str, List[Tuple[datetime, Dict[str, int]]]], 
+    def _generate_single_overview_graph(self, all_agent_data: Dict[str, UsageSeries], 
                                        time_unit: str, max_minutes: Optional[int]):
-        """Tek bir genel görünüm grafiği üret"""
-# X ekseni aralığını zaman sınırına göre ayarla
-        plt.figure(figsize=(12, 8))
-        
+        """Tek bir genel görünüm grafiği üret (çizim render_overview_graph ile çizim servisinde)"""
         title_suffix = f" (First {max_minutes} minutes)" if max_minutes else ""
         
 # Dosya adına zaman sınırını dahil et
@@ -393,58 +384,36 @@ class ContextUsageMonitor:
         
         filtered_agent_data = {}
         if project_start:
+            start_ms = int(project_start.timestamp() * 1000)
             for agent_id, cumulative_data in all_agent_data.items():
                 # max_minutes verilmişse o aralıktaki verileri kullan
-                if max_minutes:
-                    filtered_data = [(t, tokens) for t, tokens in cumulative_data 
-                                   if t >= project_start and 
-                                   (t - project_start).total_seconds() / 60 <= max_minutes]
-                else:
-                    filtered_data = [(t, tokens) for t, tokens in cumulative_data if t >= project_start]
-                if filtered_data:
+                filtered_data = cumulative_data.window(
+                    start_ms, start_ms + max_minutes * 60 * 1000 if max_minutes else None)
+                if len(filtered_data):
                     filtered_agent_data[agent_id] = filtered_data
         else:
             filtered_agent_data = all_agent_data
         
+        series = []
         for agent_id, cumulative_data in filtered_agent_data.items():
             if not cumulative_data:
                 continue
                 
             time_divisor = {'seconds': 1, 'minutes': 60, 'hours': 3600}[time_unit]
 # Dosya yoksa tüm verilerin en eski zaman damgasını kullan
-            times = [(t - project_start).total_seconds() / time_divisor for t, _ in cumulative_data]
-            totals = [tokens['total'] for _, tokens in cumulative_data]
-            
-            plt.step(times, totals, where='post', marker='o', markersize=3, 
-                    label=agent_id, alpha=0.8)
-        
-        plt.axhline(y=self.AUTO_COMPACT_THRESHOLD, color='red', 
-                   linestyle='--', linewidth=2, label='Auto-compact (~160K)')
-        plt.axhline(y=self.WARNING_THRESHOLD, color='orange', 
-                   linestyle='--', linewidth=1, label='Warning (140K)')
+            times = (cumulative_data.ts - start_ms) / 1000 / time_divisor
+            series.append({'label': agent_id, 'x': times, 'y': cumulative_data.total})
         
 # Renk haritası (statik → dinamik sırasıyla)
         unit_labels = {'seconds': 'Seconds', 'minutes': 'Minutes', 'hours': 'Hours'}
-        plt.xlabel(f'{unit_labels[time_unit]} from Project Start')
         
         if hasattr(self, 'is_cumulative') and self.is_cumulative:
-            plt.ylabel('Cumulative Token Usage')
-            plt.title(f'Cumulative Token Usage Over Time{title_suffix}')
+            ylabel = 'Cumulative Token Usage'
+            title = f'Cumulative Token Usage Over Time{title_suffix}'
         else:
-            plt.ylabel('Current Context Usage [tokens]')
+            ylabel = 'Current Context Usage [tokens]'
 # Günlük kayıt sayısına dayalı çubuk grafik
-            plt.title(f'Context Usage Monitor{title_suffix}')
-        plt.legend(loc='upper left', bbox_to_anchor=(1.02, 1))
-        plt.grid(True, alpha=0.3)
-        plt.gca().yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{int(x/1000)}K'))
-        
-# En son veri noktasını kullan
-        if max_minutes:
-# X ekseni konumu
-            plt.xlim(0, max_minutes)
-        
-# Yığılmış çubuk grafik (statik olandan)
-        plt.tight_layout()
+            title = f'Context Usage Monitor{title_suffix}'
         
         if max_minutes:
             if max_minutes in [30, 60, 90, 120, 180]:
@@ -455,12 +424,20 @@ class ContextUsageMonitor:
         else:
             output_path = self.output_dir / "context_usage_overview.png"
         
-        plt.savefig(output_path, dpi=120, bbox_inches='tight')
-        plt.close()
-        
-        print(f"✅ Genel görünüm grafiği oluşturuldu: {output_path}")
+        spec = {
+            'output': str(output_path),
+            'series': series,
+            'thresholds': [(self.AUTO_COMPACT_THRESHOLD, 'red', 2, 'Auto-compact (~160K)'),
+                           (self.WARNING_THRESHOLD, 'orange', 1, 'Warning (140K)')],
+            'xlabel': f'{unit_labels[time_unit]} from Project Start',
+            'ylabel': ylabel,
+            'title': title,
+            'xlim': (0, max_minutes) if max_minutes else None,
+        }
+        if self.renderer.render(render_overview_graph, spec) is not None:
+            print(f"✅ Genel görünüm grafiği oluşturuldu: {output_path}")
     
-    def _get_project_start_time(self, all_agent_data: Dict[str, List[Tuple[datetime, Dict[str, int]]]]) -> Optional[datetime]:
+    def _get_project_start_time(self, all_agent_data: Dict[str, UsageSeries]) -> Optional[datetime]:
 # Zaman tabanlı yığılmış alan grafiği
 # En fazla token sayısına sahip ajanı seç
         """TODO: Add docstring"""
@@ -479,18 +456,18 @@ class ContextUsageMonitor:
         
         if project_start is None:
             for agent_data in all_agent_data.values():
-                if agent_data and (project_start is None or agent_data[0][0] < project_start):
-                    project_start = agent_data[0][0]
+                if len(agent_data) and (project_start is None or agent_data.time_at(0) < project_start):
+                    project_start = agent_data.time_at(0)
         
 # Ortak ayarlar
         return project_start
     
-    def generate_stacked_bar_chart(self, all_agent_data: Dict[str, List[Tuple[datetime, Dict[str, int]]]],
+    def generate_stacked_bar_chart(self, all_agent_data: Dict[str, UsageSeries],
                                   x_axis: str = 'count'):
         """Yığılmış çubuk grafik (daha statik olanlar altta)"""
         fig, ax = plt.subplots(figsize=(16, 10))
         
-        token_types = ['cache_read', 'cache_creation', 'input', 'output']
+        token_types = list(TOKEN_TYPES)
         token_colors = {
             'cache_read': '#f39c12',     # turuncu (en statik)
             'cache_creation': '#2ecc71',  # yeşil
@@ -507,7 +484,7 @@ class ContextUsageMonitor:
                 if not cumulative_data:
                     continue
                     
-                latest_time, latest_tokens = cumulative_data[-1]
+                latest_tokens = cumulative_data.latest()
                 
 # Mevcut kullanım oranına göre renk değiştir
                 x_pos = idx
@@ -533,13 +510,13 @@ class ContextUsageMonitor:
         else:  # x_axis == 'time'
 # Alt kısım: Artış oranının görselleştirilmesi
             max_agent = max(all_agent_data.items(), 
-                          key=lambda x: x[1][-1][1]['total'] if x[1] else 0)[0]
+                          key=lambda x: x[1].latest()['total'] if len(x[1]) else 0)[0]
             
-            if all_agent_data[max_agent]:
+            if len(all_agent_data[max_agent]):
                 data = all_agent_data[max_agent]
-                times = [t for t, _ in data]
+                times = data.times
                 
-                token_values = {tt: [tokens[tt] for _, tokens in data] for tt in token_types}
+                token_values = {tt: data[tt] for tt in token_types}
                 
 # 1. Zaman serisi yığılmış alan grafiği
                 bottom = np.zeros(len(times))
@@ -579,7 +556,7 @@ class ContextUsageMonitor:
         print(f"✅ Yığılmış grafik oluşturuldu ({x_axis} ekseni): {output_path}")
     
 # Alt kısım: Her token türünün oran değişimi
-    def generate_timeline_graph(self, all_agent_data: Dict[str, List[Tuple[datetime, Dict[str, int]]]]):
+    def generate_timeline_graph(self, all_agent_data: Dict[str, UsageSeries]):
         """TODO: Add docstring"""
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), 
                                        gridspec_kw={'height_ratios': [2, 1]})
@@ -589,11 +566,11 @@ class ContextUsageMonitor:
             if not cumulative_data:
                 continue
                 
-            times = [t for t, _ in cumulative_data]
-            totals = [tokens['total'] for _, tokens in cumulative_data]
+            times = cumulative_data.times
+            totals = cumulative_data.total
             
 # Her noktadaki oranı hesapla
-            current_usage = totals[-1] if totals else 0
+            current_usage = int(totals[-1]) if len(totals) else 0
             if current_usage >= self.AUTO_COMPACT_THRESHOLD * 0.95:
                 color = 'red'
                 alpha = 1.0
@@ -628,7 +605,7 @@ class ContextUsageMonitor:
         
         print(f"✅ Zaman çizelgesi grafiği oluşturuldu: {output_path}")
     
-    def generate_agent_detail_graphs(self, agent_id: str, cumulative_data: List[Tuple[datetime, Dict[str, int]]]):
+    def generate_agent_detail_graphs(self, agent_id: str, cumulative_data: UsageSeries):
 # Dağılım grafiği ve çizgi
         """TODO: Add docstring"""
         
@@ -636,9 +613,9 @@ class ContextUsageMonitor:
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), 
                                        gridspec_kw={'height_ratios': [2, 1]})
         
-        times = [t for t, _ in cumulative_data]
+        times = cumulative_data.times
         
-        token_types = ['cache_read', 'cache_creation', 'input', 'output']
+        token_types = list(TOKEN_TYPES)
         token_colors = {
             'cache_read': '#f39c12',     # turuncu
             'cache_creation': '#2ecc71',  # yeşil
@@ -646,7 +623,7 @@ class ContextUsageMonitor:
             'output': '#e74c3c'          # kırmızı
         }
         
-        token_values = {tt: [tokens[tt] for _, tokens in cumulative_data] for tt in token_types}
+        token_values = {tt: cumulative_data[tt] for tt in token_types}
         bottom = np.zeros(len(times))
         
         for token_type in token_types:
@@ -657,7 +634,7 @@ class ContextUsageMonitor:
             bottom += values
         
 # Artış oranını hesapla (token/saat)
-        latest_tokens = cumulative_data[-1][1]
+        latest_tokens = cumulative_data.latest()
         total = latest_tokens['total']
         percentage = (total / self.AUTO_COMPACT_THRESHOLD) * 100
         
@@ -685,23 +662,16 @@ class ContextUsageMonitor:
         
         print(f"✅ {agent_id} için bireysel grafik oluşturma tamamlandı")
     
-    def _plot_token_ratios(self, ax, cumulative_data: List[Tuple[datetime, Dict[str, int]]], 
+    def _plot_token_ratios(self, ax, cumulative_data: UsageSeries, 
                           token_types: List[str]):
         """Token türlerinin oran seyrini çiz"""
-        times = [t for t, _ in cumulative_data]
-        
-        ratios = {tt: [] for tt in token_types}
+        times = cumulative_data.times
+        totals = cumulative_data.total
         
-# Ajan verilerini düzenle
-        for _, tokens in cumulative_data:
-            total = tokens['total']
-            if total > 0:
-                for tt in token_types:
-                    ratios[tt].append(100 * tokens[tt] / total)
-            else:
-                for tt in token_types:
-# otomatik sıkıştırmaya kadar tahmini süre
-                    ratios[tt].append(0)
+        # Toplamı 0 olan noktalarda oran 0 kabul edilir
+        safe_totals = np.where(totals > 0, totals, 1)
+        ratios = {tt: np.where(totals > 0, 100 * cumulative_data[tt] / safe_totals, 0.0)
+                  for tt in token_types}
         
 # Son artış oranından tahmin
         for token_type in token_types:
@@ -718,22 +688,15 @@ class ContextUsageMonitor:
         plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
         ax.set_ylim(0, 100)
     
-    def _generate_count_based_graph(self, agent_id: str, cumulative_data: List[Tuple[datetime, Dict[str, int]]]):
+    def _generate_count_based_graph(self, agent_id: str, cumulative_data: UsageSeries):
         """TODO: Add docstring"""
         fig, ax = plt.subplots(figsize=(12, 8))
         
-        log_counts = list(range(1, len(cumulative_data) + 1))
-        totals = [tokens['total'] for _, tokens in cumulative_data]
+        log_counts = np.arange(1, len(cumulative_data) + 1)
+        totals = cumulative_data.total
         
-        colors = []
-        for total in totals:
-            if total >= self.AUTO_COMPACT_THRESHOLD * 0.95:
-                colors.append('red')
-            elif total >= self.WARNING_THRESHOLD:
-                colors.append('orange')
-# Token sayısına göre sırala
-            else:
-                colors.append('blue')
+        colors = np.where(totals >= self.AUTO_COMPACT_THRESHOLD * 0.95, 'red',
+                          np.where(totals >= self.WARNING_THRESHOLD, 'orange', 'blue'))
         
         ax.scatter(log_counts, totals, c=colors, s=50, alpha=0.7, edgecolors='black')
         ax.plot(log_counts, totals, 'b-', alpha=0.3)
@@ -755,28 +718,21 @@ class ContextUsageMonitor:
         plt.savefig(output_path, dpi=120, bbox_inches='tight')
         plt.close()
     
-    def _plot_growth_rates(self, ax, all_agent_data: Dict[str, List[Tuple[datetime, Dict[str, int]]]]):
+    def _plot_growth_rates(self, ax, all_agent_data: Dict[str, UsageSeries]):
         """TODO: Add docstring"""
         
         for agent_id, cumulative_data in all_agent_data.items():
             if len(cumulative_data) < 2:
                 continue
                 
-            times = [t for t, _ in cumulative_data]
-            totals = [tokens['total'] for _, tokens in cumulative_data]
-            
-            growth_rates = []
-            growth_times = []
-            
-            for i in range(1, len(times)):
-                time_diff = (times[i] - times[i-1]).total_seconds() / 3600  # Zaman birimi
-                if time_diff > 0:
-                    token_diff = totals[i] - totals[i-1]
-                    rate = token_diff / time_diff
-                    growth_rates.append(rate)
-                    growth_times.append(times[i])
+            # Ardışık kayıtlar arası artış (token/saat); aynı andaki kayıtlar atlanır
+            time_diff = np.diff(cumulative_data.ts) / 3600 / 1000
+            token_diff = np.diff(cumulative_data.total)
+            valid = time_diff > 0
+            growth_rates = token_diff[valid] / time_diff[valid]
+            growth_times = cumulative_data.times[1:][valid]
             
-            if growth_rates:
+            if len(growth_rates):
                 ax.plot(growth_times, growth_rates, marker='o', markersize=3, 
                        label=agent_id, alpha=0.7)
         
@@ -790,7 +746,24 @@ class ContextUsageMonitor:
         plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
     
 # Tablo formatında çıktı
-    def generate_summary_report(self, all_agent_data: Dict[str, List[Tuple[datetime, Dict[str, int]]]]):
+    def predict_compaction(self, all_agent_data: Dict[str, UsageSeries]) -> Dict[str, Dict]:
+        """Ajan başına auto-compact tahmini (kümülatif modda bağlam boyutu olmadığından boş)"""
+        if getattr(self, 'is_cumulative', False):
+            return {}
+        predictions = {}
+        for agent_id, series in all_agent_data.items():
+            prediction = predict(series, self.AUTO_COMPACT_THRESHOLD)
+            if prediction is not None:
+                predictions[agent_id] = prediction
+        return predictions
+    
+    def publish_predictions(self, predictions: Dict[str, Dict]):
+        """Tahmin modellerini latest_usage.json'a yaz (hızlı durum ve stop hook'ları okur)"""
+        state = LatestUsageState(self.project_root)
+        with state.transaction():
+            state.set_models({agent_id: p['model'] for agent_id, p in predictions.items()})
+    
+    def generate_summary_report(self, all_agent_data: Dict[str, UsageSeries]):
         """TODO: Add docstring"""
 # Verileri düzenle ve sırala
         report_path = self.output_dir / "context_usage_report.md"
@@ -816,20 +789,16 @@ class ContextUsageMonitor:
                 if not cumulative_data:
                     continue
                     
-                latest_time, latest_tokens = cumulative_data[-1]
+                latest_tokens = cumulative_data.latest()
                 total = latest_tokens['total']
                 percentage = (total / self.AUTO_COMPACT_THRESHOLD) * 100
                 
                 # auto-compact için tahmini süre
                 est_hours = "N/A"
-                if len(cumulative_data) >= 2:
-                    # Son artış oranından tahmin edilir
-                    recent_data = cumulative_data[-min(10, len(cumulative_data)):]
-                    time_span = (recent_data[-1][0] - recent_data[0][0]).total_seconds() / 3600
-                    token_increase = recent_data[-1][1]['total'] - recent_data[0][1]['total']
-                    
-                    if time_span > 0 and token_increase > 0:
-                        rate = token_increase / time_span
+                # Son artış oranından tahmin edilir
+                rate = cumulative_data.recent_rate(10)
+                if rate is not None:
+                    if rate > 0:
                         remaining_tokens = self.AUTO_COMPACT_THRESHOLD - total
                         if remaining_tokens > 0:
 # Token sayısına göre sırala
@@ -869,6 +838,21 @@ class ContextUsageMonitor:
                        f"{summary['tokens']['output']:,} | "
                        f"{summary['est_hours']} |\n")
             
+            predictions = self.predict_compaction(all_agent_data)
+            if predictions:
+                f.write("\n## Auto-compact tahmini\n\n")
+                f.write("Son compact'tan sonraki turlara uydurulan doğrusal eğilimden (%90 güven aralığı)\n\n")
+                f.write("| Aracı | Tur başına artış [token] | Kalan | Tahmini zaman |\n")
+                f.write("|-------|--------------------------|-------|---------------|\n")
+                for summary in agent_summaries:
+                    prediction = predictions.get(summary['agent_id'])
+                    if prediction is None:
+                        continue
+                    f.write(f"| {summary['agent_id']} | "
+                           f"{prediction['model']['growth_per_turn']:,.0f} | "
+                           f"{format_prediction(prediction)} | "
+                           f"{prediction['eta'] or 'N/A'} |\n")
+            
             f.write("\n## Görselleştirmeler\n\n")
             f.write("### Global Görünümler\n")
             f.write("- [Overview](context_usage_overview.png) - hafif çizgi grafik\n")
@@ -894,19 +878,20 @@ class ContextUsageMonitor:
             f.write("```\n\n")
             
             f.write("## Cache Status\n\n")
-            if self.use_cache and self.cache_dir.exists():
-                cache_size = sum(f.stat().st_size for f in self.cache_dir.glob('*.pkl.gz'))
+            cache_files = self.usage_reader.cache_files()
+            if self.use_cache and cache_files:
+                cache_size = sum(f.stat().st_size for f in cache_files)
                 f.write(f"- Cache directory: `.cache/context_monitor/`\n")
                 f.write(f"- Total cache size: {cache_size / 1024 / 1024:.1f} MB\n")
 # Her ajanın verilerini topla
-                f.write(f"- Cache files: {len(list(self.cache_dir.glob('*.pkl.gz')))}\n")
+                f.write(f"- Cache files: {len(cache_files)}\n")
             else:
                 f.write("- Cache: Disabled\n")
         
 # Birden fazla dosya varsa birleştir
         print(f"✅ Rapor oluşturma tamamlandı: {report_path}")
     
-    def print_quick_status(self, all_agent_data: Dict[str, List[Tuple[datetime, Dict[str, int]]]], 
+    def print_quick_status(self, all_agent_data: Dict[str, UsageSeries], 
                           target_agent: Optional[str] = None):
         """Konsola mevcut durumu yazdır (hızlı erişim için)"""
                 # Zaman serisine göre sırala
@@ -940,7 +925,7 @@ class ContextUsageMonitor:
 # Gerekli paketlerin yüklü olup olmadığını kontrol et
                 continue
                 
-            latest_time, latest_tokens = cumulative_data[-1]
+            latest_tokens = cumulative_data.latest()
             total = latest_tokens['total']
             percentage = (total / self.AUTO_COMPACT_THRESHOLD) * 100
             
@@ -954,13 +939,9 @@ class ContextUsageMonitor:
             
             # Tahmini süre
             est_time = "N/A"
-            if len(cumulative_data) >= 2:
-                recent_data = cumulative_data[-min(10, len(cumulative_data)):]
-                time_span = (recent_data[-1][0] - recent_data[0][0]).total_seconds() / 3600
-                token_increase = recent_data[-1][1]['total'] - recent_data[0][1]['total']
-                
-                if time_span > 0 and token_increase > 0:
-                    rate = token_increase / time_span
+            rate = cumulative_data.recent_rate(10)
+            if rate is not None:
+                if rate > 0:
                     remaining_tokens = self.AUTO_COMPACT_THRESHOLD - total
                     if remaining_tokens > 0:
                         hours = remaining_tokens / rate
@@ -1027,12 +1008,15 @@ def main():
                        help='Show quick status in console (no graphs)')
     parser.add_argument('--agent', type=str, default=None,
                        help='Show status for specific agent only')
+    parser.add_argument('--workers', type=int, default=None,
+                       help=f'Processes for per-agent parsing and graphs (default: CPU count, max {MAX_IO_WORKERS})')
     
     args = parser.parse_args()
     
     # Proje kök dizinini alır
     project_root = Path(__file__).parent.parent
-    monitor = ContextUsageMonitor(project_root, use_cache=not args.no_cache, max_minutes=args.max_minutes)
+    monitor = ContextUsageMonitor(project_root, use_cache=not args.no_cache, max_minutes=args.max_minutes,
+                                  workers=args.workers)
     
     # Önbellek temizleme
     if args.clear_cache and monitor.cache_dir.exists():
@@ -1044,32 +1028,8 @@ def main():
     def update_once():
         """Sadece bir kez güncelle"""
         print("🔍 Scanning agent_and_pane_id_table.jsonl for session IDs...")
-        jsonl_files = monitor.find_project_jsonl_files()
-        
-        if not jsonl_files:
-            print("❌ No JSONL files found for agents")
-            print(f"   Check: {monitor.project_root / 'Agent-shared' / 'agent_and_pane_id_table.jsonl'}")
-            return
-        
-        print(f"📊 Found {len(jsonl_files)} agents with logs")
-        
-        # Her bir ajan için verileri toplar
-        all_agent_data = {}
-        for agent_id, files in jsonl_files.items():
-            if not args.status:  # Durum gösterilirken ilerleme atlanır
-                print(f"  - Processing {agent_id}...")
-            
-            # Birden fazla dosya varsa birleştirilecek
-            all_usage_entries = []
-            for jsonl_file in sorted(files):
-                entries = monitor.parse_usage_data(jsonl_file, agent_id, args.last_n, args.max_minutes)
-                all_usage_entries.extend(entries)
-            
-            if all_usage_entries:
-                # Zaman serisine göre sıralama
-                all_usage_entries.sort(key=lambda x: x['timestamp'])
-                cumulative_data = monitor.calculate_cumulative_tokens(all_usage_entries, args.cumulative)
-                all_agent_data[agent_id] = cumulative_data
+        # Durum gösterilirken ilerleme atlanır
+        all_agent_data = monitor.collect_agent_data(args.last_n, args.cumulative, verbose=not args.status)
         
         if all_agent_data:
             if args.status:
@@ -1079,6 +1039,9 @@ def main():
                 # Grafik ve rapor oluşturma
                 monitor.generate_all_graphs(all_agent_data, args.graph_type, args.time_unit, args.cumulative)
                 monitor.generate_summary_report(all_agent_data)
+                if not (args.cumulative or args.last_n or args.max_minutes):
+                    # Kısıtlanmamış seriden uydurulan modeller hızlı durum için paylaşılır
+                    monitor.publish_predictions(monitor.predict_compaction(all_agent_data))
                 print("✅ Context usage monitoring complete")
         else:
             print("❌ No usage data found in JSONL files")
@@ -2,16 +2,22 @@
 """
 VibeCodeHPC Bağlam Kullanımı Hızlı Durum
 Gerçek zamanlı token kullanımını hızlıca kontrol etme aracı
+Son usage kayıtları .cache/context_monitor/latest_usage.json durum dosyasından okunur
 
 İleride OpenTelemetry metrikleri olarak gönderim planlanmaktadır
 """
 
 import json
+import sys
 from pathlib import Path
 from datetime import datetime
 import argparse
 from typing import Dict, List, Tuple, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from latest_usage_state import LatestUsageState
+from compact_predictor import format_prediction
+
 class ContextQuickStatus:
     """Bağlam kullanım oranını hızlıca doğrulama sınıfı"""
     
@@ -24,41 +30,47 @@ class ContextQuickStatus:
         self.claude_projects_dir = Path.home() / ".claude" / "projects"
     
     def get_latest_usage(self, agent_id: Optional[str] = None) -> Dict[str, Dict]:
-        """En güncel token kullanım durumunu al (hızlı sürüm)"""
+        """En güncel token kullanım durumunu al (hızlı sürüm)
+
+        Ajan başına son usage kaydı .cache/context_monitor/latest_usage.json içinde tutulur
+        (izleme daemon'u günlükler değiştikçe günceller). Burada yalnızca değişmiş oturum
+        dosyalarının eklenen kısmı taranır; değişmeyen dosyalar için tek bir stat yeterlidir.
+        """
+        state = LatestUsageState(self.project_root)
+        
+        project_claude_dir = self._get_project_claude_dir()
+        if project_claude_dir is not None:
+            # session_id ile ajan arasındaki eşleşmeyi alır
+            agent_sessions = self._get_agent_sessions()
+            if agent_sessions:
+                session_files = [(project_claude_dir / f"{session_id}.jsonl", current_agent_id)
+                                 for session_id, current_agent_id in agent_sessions.items()]
+            else:
+                # Ajan tablosu yoksa dizindeki tüm oturumlar
+                session_files = [(jsonl_file, f"Unknown_{jsonl_file.stem[:8]}")
+                                 for jsonl_file in project_claude_dir.glob("*.jsonl")]
+            
+            # Daemon ve diğer çağıranlarla aynı anda yazılabilir: kilit altında güncellenir
+            with state.transaction():
+                for jsonl_file, current_agent_id in session_files:
+                    # Belirli bir ajan belirtilmişse filtre uygula
+                    if agent_id and agent_id.upper() not in current_agent_id.upper():
+                        continue
+                    if jsonl_file.exists():
+                        state.update_file(jsonl_file, current_agent_id)
         
-        # Proje dizini adını oluşturur
+        return {current_agent_id: usage for current_agent_id, usage in state.agents.items()
+                if not agent_id or agent_id.upper() in current_agent_id.upper()}
+    
+    def _get_project_claude_dir(self) -> Optional[Path]:
+        """Projenin Claude oturum dizini"""
         # Claude Code dönüşüm kuralı: İngilizce harf ve rakamlar dışındaki tüm karakterler '-' ile değiştirilir
         import re
         project_dir_name = re.sub(r'[^a-zA-Z0-9]', '-', str(self.project_root))
-        if project_dir_name.startswith('-'):
-            project_dir_name = project_dir_name[1:]
-            
-        project_claude_dir = self.claude_projects_dir / project_dir_name
-        
-        if not project_claude_dir.exists():
-            return {}
-            
-        # session_id ile ajan arasındaki eşleşmeyi alır
-        agent_sessions = self._get_agent_sessions()
-        
-        # Her JSONL dosyasının yalnızca en son girişini alır
-        agent_status = {}
-        
-        for jsonl_file in project_claude_dir.glob("*.jsonl"):
-            session_id = jsonl_file.stem
-            current_agent_id = agent_sessions.get(session_id, f"Unknown_{session_id[:8]}")
-            
-            # Belirli bir ajan belirtilmişse filtre uygula
-            if agent_id and agent_id.upper() not in current_agent_id.upper():
-                continue
-            
-            # Dosyanın sonundan geriye doğru okuyarak en son usage değerini bulur
-            latest_usage = self._get_latest_usage_from_file(jsonl_file)
-            
-            if latest_usage:
-                agent_status[current_agent_id] = latest_usage
-        
-        return agent_status
+        for name in (project_dir_name, project_dir_name.lstrip('-')):
+            if (self.claude_projects_dir / name).exists():
+                return self.claude_projects_dir / name
+        return None
     
     def _get_agent_sessions(self) -> Dict[str, str]:
         """agent_and_pane_id_table.jsonl içinden session_id ile agent_id eşlemesini al"""
@@ -80,51 +92,6 @@ class ContextQuickStatus:
                             
         return sessions
     
-    def _get_latest_usage_from_file(self, jsonl_file: Path) -> Optional[Dict]:
-        """JSONL dosyasından en güncel kullanım bilgisini al (sondan tarama)"""
-        
-        # Dosyayı ters sırayla okuma (verimli)
-        with open(jsonl_file, 'rb') as f:
-            # Dosyanın sonundan okuma
-            f.seek(0, 2)  # Dosya sonuna kadar
-            file_size = f.tell()
-            
-            # Maksimum 10MB kadar geriye doğru arama yapar
-            search_size = min(file_size, 10 * 1024 * 1024)
-            f.seek(max(0, file_size - search_size))
-            
-            # Kalanı oku
-            content = f.read().decode('utf-8', errors='ignore')
-            lines = content.strip().split('\n')
-            
-            # Ters sırayla işleme
-            for line in reversed(lines):
-                if line.strip():
-                    try:
-                        entry = json.loads(line)
-                        if 'message' in entry and isinstance(entry['message'], dict):
-                            msg = entry['message']
-                            if 'usage' in msg and isinstance(msg['usage'], dict):
-                                # Kümülatif hesaplama
-                                usage = msg['usage']
-                                total = (usage.get('input_tokens', 0) + 
-                                       usage.get('cache_creation_input_tokens', 0) +
-                                       usage.get('cache_read_input_tokens', 0) +
-                                       usage.get('output_tokens', 0))
-                                
-                                return {
-                                    'timestamp': entry.get('timestamp', 'N/A'),
-                                    'total': total,
-                                    'input': usage.get('input_tokens', 0),
-                                    'cache_creation': usage.get('cache_creation_input_tokens', 0),
-                                    'cache_read': usage.get('cache_read_input_tokens', 0),
-                                    'output': usage.get('output_tokens', 0)
-                                }
-                    except (json.JSONDecodeError, KeyError, TypeError):
-                        continue
-        
-        return None
-    
     def print_status(self, agent_status: Dict[str, Dict]):
         """Durumu görüntüle"""
         
@@ -135,7 +102,7 @@ class ContextQuickStatus:
         print("\n" + "="*70)
         print(f"VibeCodeHPC Context Usage - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("="*70)
-        print(f"{'Agent':<10} {'Total':>10} {'%':>6} {'Status':<10} {'Last Update'}")
+        print(f"{'Agent':<10} {'Total':>10} {'%':>6} {'Status':<10} {'Last Update':<12} {'Auto-compact'}")
         print("-"*70)
         
         # Sıralama için veri hazırlığı
@@ -174,7 +141,8 @@ class ContextQuickStatus:
                 'total': total,
                 'percentage': percentage,
                 'status': status,
-                'time_str': time_str
+                'time_str': time_str,
+                'compact': format_prediction(usage.get('prediction'))
             })
         
         # Token sayısına göre sıralama
@@ -183,7 +151,7 @@ class ContextQuickStatus:
         # Çıktı
         for agent in sorted_agents:
             print(f"{agent['agent_id']:<10} {agent['total']:>10,} {agent['percentage']:>5.1f}% "
-                  f"{agent['status']:<10} {agent['time_str']}")
+                  f"{agent['status']:<10} {agent['time_str']:<12} {agent['compact']}")
         
         print("\n" + "="*70)
     
@@ -207,6 +175,27 @@ class ContextQuickStatus:
                 'timestamp': usage.get('timestamp', datetime.now().isoformat())
             }
             metrics.append(metric)
+            
+            # auto-compact tahmini (izleme daemon'u/bağlam izleyicisi model uydurduysa)
+            prediction = usage.get('prediction')
+            if prediction and prediction.get('turns') is not None:
+                for name, unit, key in (('claude_code_context_compact_turns_remaining', 'turns', 'turns'),
+                                        ('claude_code_context_compact_seconds_remaining', 's', 'seconds')):
+                    if prediction.get(key) is None:
+                        continue
+                    metrics.append({
+                        'name': name,
+                        'unit': unit,
+                        'value': prediction[key],
+                        'attributes': {
+                            'agent_id': agent_id,
+                            'project': str(self.project_root.name),
+                            'lower_bound': prediction.get(f'{key}_low'),
+                            'upper_bound': prediction.get(f'{key}_high'),
+                            'confidence': 0.9
+                        },
+                        'timestamp': usage.get('timestamp', datetime.now().isoformat())
+                    })
         
         return metrics
 
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Ajan başına en güncel usage kaydının paylaşılan durum dosyası
+
+.cache/context_monitor/latest_usage.json dosyası her oturum JSONL dosyası için okunan son
+bayt konumunu ve ajanın en son usage kaydını tutar. İzleme daemon'u günlük değiştikçe yalnızca
+eklenen baytları tarayarak dosyayı günceller; context_usage_quick_status.py ve stop hook'ları
+bağlam kullanım oranını bu dosyadan milisaniyeler içinde okur.
+
+Durum dosyası biçimi:
+{
+  "version": 1,
+  "updated_at": "2025-08-20T01:00:00Z",
+  "agents": {"PG1.1": {"timestamp", "total", "input", "cache_creation", "cache_read",
+                       "output", "percentage", "session", "prediction"}},
+  "models": {"PG1.1": {compact_predictor.fit() çıktısı}},
+  "files": {"<jsonl yolu>": {"inode", "size", "offset"}}
+}
+
+Tahmin modeli bağlam izleyicisi tam seriyi okuduğunda güncellenir; yeni kayıt geldikçe
+"prediction" alanı aynı modelle son bağlam boyutuna göre yeniden hesaplanır.
+
+Daemon, hızlı durum, bağlam izleyicisi ve stop hook'u dosyayı transaction() içinde günceller:
+latest_usage.json.lock üzerinde flock alınır, durum diskten yeniden okunur, değiştirilir ve
+yazılır (eşzamanlı yazanların güncellemeleri kaybolmaz). Yazmadan önce eskimiş kayıtlar atılır:
+son kaydı STALE_AGENT_SEC süresinden eski ajanlar, oturumu artık adlı bir ajana ait olan
+Unknown_* kayıtları ve silinmiş oturum dosyalarının konumları.
+"""
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+from compact_predictor import AUTO_COMPACT_THRESHOLD, project
+from usage_log_reader import read_last_usage
+
+STATE_VERSION = 1
+STATE_RELATIVE_PATH = Path(".cache") / "context_monitor" / "latest_usage.json"
+STALE_AGENT_SEC = 24 * 3600  # Bu süreden eski son kayıtlar (bitmiş ajan/oturum) atılır
+
+
+def parse_timestamp(value) -> Optional[datetime]:
+    """Kayıt zamanı ('...Z') → UTC datetime (okunamazsa None)"""
+    try:
+        ts = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def usage_record(entry: Dict, session: str) -> Dict:
+    """extract_usage çıktısından durum kaydı oluştur"""
+    usage = entry['usage']
+    tokens = {
+        'input': usage.get('input_tokens', 0),
+        'cache_creation': usage.get('cache_creation_input_tokens', 0),
+        'cache_read': usage.get('cache_read_input_tokens', 0),
+        'output': usage.get('output_tokens', 0),
+    }
+    total = sum(tokens.values())
+    return {
+        'timestamp': entry.get('timestamp', 'N/A'),
+        'total': total,
+        **tokens,
+        'percentage': round(total / AUTO_COMPACT_THRESHOLD * 100, 1),
+        'session': session,
+    }
+
+
+class LatestUsageState:
+    """latest_usage.json dosyasının okunması ve artımlı güncellenmesi"""
+
+    def __init__(self, project_root: Path):
+        self.path = Path(project_root) / STATE_RELATIVE_PATH
+        self.lock_path = self.path.with_name(f"{self.path.name}.lock")
+        self.state = self.load()
+        self.dirty = False
+
+    @contextmanager
+    def transaction(self):
+        """Kilit altında oku-değiştir-yaz
+
+        Durum diskten yeniden okunur (başka süreçlerin güncellemeleri korunur); blok bitince
+        eskimiş kayıtlar atılır ve değişiklik varsa dosya yazılır. Kilit dosyası açılamazsa
+        (salt okunur ortam) kilitsiz devam edilir.
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError:
+            fd = None
+        try:
+            if fd is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            self.state = self.load()
+            self.dirty = False
+            yield self
+            self.expire()
+            self.save()
+        finally:
+            if fd is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+
+    def load(self) -> Dict:
+        try:
+            state = json.loads(self.path.read_text())
+            if state.get('version') == STATE_VERSION:
+                return state
+        except (OSError, ValueError):
+            pass
+        return {'version': STATE_VERSION, 'updated_at': None, 'agents': {}, 'models': {}, 'files': {}}
+
+    @property
+    def agents(self) -> Dict[str, Dict]:
+        return self.state['agents']
+
+    @property
+    def models(self) -> Dict[str, Dict]:
+        return self.state.setdefault('models', {})
+
+    def _predict(self, agent_id: str):
+        """Ajanın son kaydına kayıtlı modelle auto-compact tahmini ekle"""
+        record = self.agents.get(agent_id)
+        model = self.models.get(agent_id)
+        if record is None:
+            return
+        if model is None:
+            record.pop('prediction', None)
+            return
+        ts = parse_timestamp(record['timestamp'])
+        timestamp_ms = int(ts.timestamp() * 1000) if ts else None
+        record['prediction'] = project(model, record['total'], timestamp_ms)
+
+    def set_models(self, models: Dict[str, Dict]):
+        """Bağlam izleyicisinin uydurduğu tahmin modellerini kaydet ve tahminleri yenile"""
+        for agent_id, model in models.items():
+            self.models[agent_id] = model
+            self._predict(agent_id)
+        self.dirty = True
+
+    def update_file(self, jsonl_file: Path, agent_id: str) -> Optional[Dict]:
+        """Oturum dosyasının yeni eklenen kısmından ajanın son usage kaydını güncelle
+
+        Dosya değişmemişse yalnızca stat yapılır. Eklenen kısımda usage yoksa
+        önceki kayıt korunur.
+
+        Returns:
+            Ajanın güncel kaydı (hiç usage bulunamadıysa None)
+        """
+        key = str(jsonl_file)
+        try:
+            st = os.stat(jsonl_file)
+        except OSError:
+            return self.agents.get(agent_id)
+
+        previous = self.state['files'].get(key)
+        if previous and previous['inode'] == st.st_ino and previous['size'] == st.st_size:
+            return self.agents.get(agent_id)
+
+        # Kontrol noktası yoksa tüm dosya sondan başa, varsa yalnızca eklenen kısım taranır
+        if previous and previous['inode'] == st.st_ino and previous['offset'] <= st.st_size:
+            start = previous['offset']
+        else:
+            start = 0
+
+        with open(jsonl_file, 'rb') as f:
+            # Yazılmakta olan son satır bir sonraki güncellemeye bırakılır
+            entry, offset = read_last_usage(f, start, st.st_size)
+
+        if entry is not None:
+            record = usage_record(entry, Path(jsonl_file).stem)
+            current = self.agents.get(agent_id)
+            # Ajanın birden fazla oturumu varsa en yeni kayıt geçerlidir
+            if (current is None or current.get('session') == record['session']
+                    or str(record['timestamp']) >= str(current.get('timestamp'))):
+                self.agents[agent_id] = record
+                self._predict(agent_id)
+
+        self.state['files'][key] = {'inode': st.st_ino, 'size': st.st_size, 'offset': offset}
+        self.dirty = True
+        return self.agents.get(agent_id)
+
+    def expire(self, max_age_sec: float = STALE_AGENT_SEC):
+        """Eskimiş ajan kayıtlarını, modellerini ve silinmiş oturum dosyalarının konumlarını at
+
+        Unknown_* kayıtları (ajan tablosu yokken oturum kimliğiyle adlandırılanlar) oturum artık
+        adlı bir ajana aitse atılır. Zamanı okunamayan kayıtlar korunur.
+        """
+        now = datetime.now(timezone.utc)
+        named_sessions = {record.get('session') for agent_id, record in self.agents.items()
+                          if not agent_id.startswith('Unknown_')}
+        for agent_id, record in list(self.agents.items()):
+            ts = parse_timestamp(record.get('timestamp'))
+            if ((ts is not None and (now - ts).total_seconds() > max_age_sec)
+                    or (agent_id.startswith('Unknown_') and record.get('session') in named_sessions)):
+                del self.agents[agent_id]
+                self.models.pop(agent_id, None)
+                self.dirty = True
+        for key in list(self.state['files']):
+            if not os.path.exists(key):
+                del self.state['files'][key]
+                self.dirty = True
+
+    def save(self):
+        """Durum dosyasını atomik olarak yaz (değişiklik yoksa yazılmaz)"""
+        if not self.dirty:
+            return
+        self.state['updated_at'] = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self.state, indent=1))
+            tmp_path.replace(self.path)
+            self.dirty = False
+        except OSError:
+            pass  # Salt okunur ortamda durum bir sonraki çağrıda yeniden hesaplanır
@@ -34,6 +34,9 @@ DEFAULT_MILESTONE_INTERVAL_MIN=30  # 30 dakika (kilometre taşı kontrol aralı
 DEFAULT_MAX_RUNTIME_MIN=1440  # 1440 dakika (1 gün) = 24 * 60
 DEFAULT_BUDGET_INTERVAL_MIN=3  # 3 dakika (bütçe toplama aralığı)
 DEFAULT_SOTA_INTERVAL_MIN=15  # 15 dakika (SOTA görselleştirme aralığı)
+DEFAULT_MONITOR_MODE=daemon  # daemon: inotify izleme daemon'u, polling: eski sabit aralıklı döngü
+DEFAULT_WATCH_DEBOUNCE_SEC=2  # 2 saniye (daemon: son olaydan sonraki sessizlik süresi)
+DEFAULT_SOTA_MIN_GAP_SEC=60  # 60 saniye (daemon: SOTA çalıştırmaları arasındaki en kısa süre)
 
 if [ -f "$CONFIG_FILE" ]; then
     source "$CONFIG_FILE"
@@ -44,6 +47,9 @@ MILESTONE_INTERVAL_MIN=${MILESTONE_INTERVAL_MIN:-$DEFAULT_MILESTONE_INTERVAL_MIN
 MAX_RUNTIME_MIN=${MAX_RUNTIME_MIN:-$DEFAULT_MAX_RUNTIME_MIN}
 BUDGET_INTERVAL_MIN=${BUDGET_INTERVAL_MIN:-$DEFAULT_BUDGET_INTERVAL_MIN}
 SOTA_INTERVAL_MIN=${SOTA_INTERVAL_MIN:-$DEFAULT_SOTA_INTERVAL_MIN}
+MONITOR_MODE=${MONITOR_MODE:-$DEFAULT_MONITOR_MODE}
+WATCH_DEBOUNCE_SEC=${WATCH_DEBOUNCE_SEC:-$DEFAULT_WATCH_DEBOUNCE_SEC}
+SOTA_MIN_GAP_SEC=${SOTA_MIN_GAP_SEC:-$DEFAULT_SOTA_MIN_GAP_SEC}
 
 cleanup_existing_processes() {
     if [ -f "$PID_FILE" ]; then
@@ -69,7 +75,7 @@ echo $$ > "$PID_FILE"
 
 echo "[$(date -u +"%Y-%m-%dT%H:%M:%SZ")] Periodic monitor started (PID: $$, Project: ${PROJECT_NAME})" >> "$LOG_FILE"
 echo "[$(date -u +"%Y-%m-%dT%H:%M:%SZ")] Monitoring sessions: ${PM_SESSION}, ${WORKER_SESSION}" >> "$LOG_FILE"
-echo "[$(date -u +"%Y-%m-%dT%H:%M:%SZ")] Config: UPDATE_INTERVAL_SEC=${UPDATE_INTERVAL_SEC}s, MILESTONE_INTERVAL_MIN=${MILESTONE_INTERVAL_MIN}min, MAX_RUNTIME_MIN=${MAX_RUNTIME_MIN}min" >> "$LOG_FILE"
+echo "[$(date -u +"%Y-%m-%dT%H:%M:%SZ")] Config: UPDATE_INTERVAL_SEC=${UPDATE_INTERVAL_SEC}s, MILESTONE_INTERVAL_MIN=${MILESTONE_INTERVAL_MIN}min, MAX_RUNTIME_MIN=${MAX_RUNTIME_MIN}min, MONITOR_MODE=${MONITOR_MODE}" >> "$LOG_FILE"
 
 get_python_cmd() {
     if command -v python3 >/dev/null 2>&1; then
@@ -126,6 +132,19 @@ fi
 START_TIME=$(cat "$START_TIME_FILE")
 START_EPOCH=$(date -d "$START_TIME" +%s 2>/dev/null || date -u +%s)
 
+if [ "$MONITOR_MODE" = "daemon" ]; then
+    # Tek uzun ömürlü süreç: dosya değişikliklerinde yalnızca etkilenen grafikleri günceller
+    echo "[$(date -u +"%Y-%m-%dT%H:%M:%SZ")] Starting watch daemon (debounce: ${WATCH_DEBOUNCE_SEC}s)" >> "$LOG_FILE"
+    $PYTHON_CMD "$PROJECT_ROOT/telemetry/watch_daemon.py" \
+        --sessions "${PM_SESSION},${WORKER_SESSION}" \
+        --debounce-sec "$WATCH_DEBOUNCE_SEC" \
+        --context-gap-sec "$UPDATE_INTERVAL_SEC" \
+        --budget-gap-sec "$UPDATE_INTERVAL_SEC" \
+        --sota-gap-sec "$SOTA_MIN_GAP_SEC" \
+        --budget-interval-min "$BUDGET_INTERVAL_MIN" \
+        --max-runtime-min "$MAX_RUNTIME_MIN" >> "$LOG_FILE" 2>&1 &
+    echo $! > "$CHILD_PID_FILE"
+else
 (
     echo "[$(date -u +"%Y-%m-%dT%H:%M:%SZ")] Starting update subprocess (interval: ${UPDATE_INTERVAL_SEC}s)" >> "$LOG_FILE"
     echo $BASHPID > "$CHILD_PID_FILE"
@@ -168,6 +187,7 @@ START_EPOCH=$(date -d "$START_TIME" +%s 2>/dev/null || date -u +%s)
         sleep $UPDATE_INTERVAL_SEC
     done
 ) &
+fi
 
 LAST_MILESTONE=0
 MILESTONE_CHECK_INTERVAL=$((MILESTONE_INTERVAL_MIN * 60))  # Dakikayı saniyeye çevir
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Grafik çizim servisi (sıcak matplotlib süreçleri)
+
+Grafik üreten modüller (sota_visualizer.py, budget_tracker.py, context_usage_monitor.py)
+çizimi kendi içinde yapmak yerine bir çizim işi gönderir: modül düzeyindeki bir çizim
+fonksiyonu + yalnızca veri içeren bir tanım (spec) sözlüğü. Çizim fonksiyonu tanımdan
+PNG üretir ve çıktı yolunu döndürür.
+
+- workers=0: işler aynı süreçte çizilir (tek seferlik CLI çalıştırmaları)
+- workers>0: matplotlib'i önceden içe aktarmış kalıcı süreç havuzu (izleme daemon'u);
+  içe aktarma ve yazı tipi önbelleği maliyeti her çalıştırmada değil bir kez ödenir
+
+Her süreçte Figure/Axes nesneleri boyuta göre önbelleğe alınır ve temizlenerek yeniden
+kullanılır (reusable_axes); her grafik için yeni Figure oluşturulmaz.
+
+Çok sayıda grafik üreten çağıranlar (SOTA boru hattı) çizim fonksiyonundan PNG baytları alır
+(figure_png) ve dosyaya yazmayı ana süreçte WriteBudget ile yapar: paylaşılan dosya sistemine
+saniyede en fazla belirli bayt ve aynı anda en fazla belirli sayıda yazıcı.
+"""
+
+import importlib
+import io
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Süreç başına yeniden kullanılan Figure/Axes (anahtar: (ad, figsize))
+_FIGURES: Dict[Tuple, Tuple] = {}
+
+
+def _warm_up():
+    """Havuz süreci başlatıcısı: matplotlib'i bir kez içe aktar ve yazı tipi önbelleğini yükle"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=(1, 1))
+    ax.plot([0, 1], [0, 1], label='warm-up')
+    ax.legend()
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def reusable_axes(name: str, figsize: Tuple[float, float]):
+    """Bu süreçte daha önce oluşturulmuş Figure/Axes'i temizleyip döndür (yoksa oluştur)
+
+    Dönen Axes boştur (ax.clear) ve kenar boşlukları varsayılandır; çizim fonksiyonu stil, ölçek ve biçimlendiricileri her seferinde
+    yeniden ayarlamalıdır. Figure kapatılmaz.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    key = (name, tuple(figsize))
+    if key in _FIGURES:
+        fig, ax = _FIGURES[key]
+        ax.clear()
+        # Önceki çizimin tight_layout ile değiştirdiği kenar boşluklarını varsayılana döndür
+        fig.subplots_adjust(**{side: matplotlib.rcParams[f'figure.subplot.{side}']
+                               for side in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')})
+        return fig, ax
+    fig, ax = plt.subplots(figsize=figsize)
+    _FIGURES[key] = (fig, ax)
+    return fig, ax
+
+
+def figure_png(fig, **savefig_kwargs) -> bytes:
+    """Figure'ı dosyaya yazmadan PNG baytlarına çevir"""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', **savefig_kwargs)
+    return buffer.getvalue()
+
+
+def _job_target(function: Callable):
+    """Çizim fonksiyonunu havuz süreçlerine gönderilecek biçime çevir
+
+    Havuz süreçleri ilk işte oluşturulur; çizim modülünün dizini o sırada sys.path'te
+    olmayabilir (ör. daemon SOTA betiğini sonradan içe aktarır). Bu yüzden fonksiyon
+    yerine (modül dizini, modül adı, fonksiyon adı) gönderilir.
+    """
+    module = sys.modules.get(function.__module__)
+    module_file = getattr(module, '__file__', None)
+    if function.__module__ == '__main__' or not module_file:
+        return function
+    return (str(Path(module_file).resolve().parent), function.__module__, function.__name__)
+
+
+def _resolve(target) -> Callable:
+    if callable(target):
+        return target
+    directory, module_name, function_name = target
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def _run(target, spec: Dict) -> Optional[Path]:
+    """Tek çizim işi (hatalar çağırana iletilmez, None döner)"""
+    try:
+        return _resolve(target)(spec)
+    except Exception as e:
+        print(f"  Render error {spec.get('output', '?')}: {e}")
+        return None
+
+
+class RenderService:
+    """Çizim işlerini aynı süreçte ya da sıcak süreç havuzunda çalıştıran servis"""
+
+    def __init__(self, workers: int = 0):
+        """
+        Args:
+            workers: Havuz süreç sayısı (0: aynı süreçte çiz)
+        """
+        self.workers = max(0, workers)
+        self._pool = None
+        if self.workers:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_up)
+
+    def submit(self, function: Callable, spec: Dict) -> Future:
+        """Çizim işini kuyruğa ekle
+
+        Args:
+            function: Modül düzeyinde çizim fonksiyonu (spec → çıktı yolu)
+            spec: Yalnızca veri içeren grafik tanımı (süreçler arası aktarılabilir)
+        """
+        if self._pool is not None:
+            return self._pool.submit(_run, _job_target(function), spec)
+        future = Future()
+        future.set_result(_run(function, spec))
+        return future
+
+    def render(self, function: Callable, spec: Dict) -> Optional[Path]:
+        """Çizim işini çalıştır ve bitmesini bekle"""
+        return self.submit(function, spec).result()
+
+    def render_all(self, jobs: Iterable[Tuple[Callable, Dict]]) -> List[Optional[Path]]:
+        """Birden çok işi gönderip sonuçları gönderim sırasıyla döndür"""
+        futures = [self.submit(function, spec) for function, spec in jobs]
+        return [future.result() for future in futures]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+def default_workers() -> int:
+    """Kalıcı servis için süreç sayısı (bir çekirdek ana sürece bırakılır)"""
+    return max(1, min((os.cpu_count() or 1) - 1, 4))
+
+
+class WriteBudget:
+    """Çizilmiş grafiklerin dosya sistemine bütçeli yazımı
+
+    Yazımlar en fazla max_writers iş parçacığıyla yapılır; bytes_per_sec verilmişse her yazım,
+    önceki yazımların bayt toplamının bu hızla yazılabileceği zamana kadar bekletilir.
+    Dosyalar geçici dosya + yeniden adlandırma ile yazılır (okuyucular yarım PNG görmez).
+    """
+
+    def __init__(self, bytes_per_sec: Optional[float] = None, max_writers: int = 1):
+        """
+        Args:
+            bytes_per_sec: Saniyede yazılacak en fazla bayt (None/0: sınırsız)
+            max_writers: Aynı anda yazan en fazla iş parçacığı
+        """
+        self.bytes_per_sec = bytes_per_sec or None
+        self.max_writers = max(1, max_writers)
+        self.bytes_written = 0
+        self._writers = ThreadPoolExecutor(max_workers=self.max_writers)
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def _wait_for_slot(self, size: int):
+        if not self.bytes_per_sec:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot)
+            self._next_slot = start + size / self.bytes_per_sec
+        if start > now:
+            time.sleep(start - now)
+
+    def _write(self, path: Path, data: bytes) -> Path:
+        self._wait_for_slot(len(data))
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        with self._lock:
+            self.bytes_written += len(data)
+        return path
+
+    def submit(self, path: Path, data: bytes) -> Future:
+        """Yazımı kuyruğa ekle (hata Future üzerinden iletilir)"""
+        return self._writers.submit(self._write, path, data)
+
+    def close(self):
+        """Kuyruktaki tüm yazımların bitmesini bekle"""
+        self._writers.shutdown(wait=True)
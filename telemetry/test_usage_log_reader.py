@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+usage_log_reader.py / usage_series.py için test hata ayıklama kodu
+Dummy oturum JSONL dosyası oluşturarak kontrol noktasından devam etmeyi doğrulama
+(ekleme, yarım son satır, dosyanın kısalması ve inode değişimi)
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from usage_log_reader import UsageLogReader, read_last_usage
+from usage_series import UsageSeries
+
+failures = []
+
+def check(label, ok):
+    """Sonucu yazdır (başarısızlar sonunda toplanır)"""
+    print(f"  - {label}: {'✅' if ok else '❌'}")
+    if not ok:
+        failures.append(label)
+
+def usage_line(index, start):
+    """Tek bir assistant satırı (input_tokens = index)"""
+    ts = (start + timedelta(seconds=index)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+    return json.dumps({
+        'type': 'assistant',
+        'timestamp': ts,
+        'message': {'usage': {'input_tokens': index, 'cache_creation_input_tokens': 10,
+                              'cache_read_input_tokens': 100, 'output_tokens': 1}},
+    })
+
+def tool_line(index):
+    """usage içermeyen satır (araç sonucu)"""
+    return json.dumps({'type': 'user', 'timestamp': '2025-01-01T00:00:00Z',
+                       'message': {'content': f'tool result {index} "usage": yok'}})
+
+def run_test():
+    """Test çalıştırma"""
+    print("=" * 60)
+    print("usage_log_reader.py test başlangıcı")
+    print("=" * 60)
+
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        cache_dir = temp_path / "cache"
+        jsonl = temp_path / "session.jsonl"
+
+        # Test senaryosu 1: İlk okuma
+        print("\n[Test1] İlk okuma")
+        print("-" * 40)
+
+        jsonl.write_text(''.join(f"{usage_line(i, start)}\n{tool_line(i)}\n" for i in range(5)))
+        reader = UsageLogReader(cache_dir)
+        series = reader.read(jsonl, "agent_session")
+        print(f"Kayıt sayısı: {len(series)}, istatistik: {reader.last_stats}")
+        check("5 kayıt okundu", len(series) == 5)
+        check("input sütunu 0..4", series['input'].tolist() == [0, 1, 2, 3, 4])
+        check("ilk okuma reset", reader.last_stats['reset'])
+
+        # Test senaryosu 2: Ekleme + yarım son satır
+        print("\n[Test2] Ekleme ve yarım son satır")
+        print("-" * 40)
+
+        partial = usage_line(6, start)
+        with open(jsonl, 'a') as f:
+            f.write(usage_line(5, start) + "\n")
+            f.write(partial[:len(partial) // 2])  # Yazılmakta olan satır (satır sonu yok)
+        size_before = jsonl.stat().st_size
+        series = reader.read(jsonl, "agent_session")
+        print(f"Kayıt sayısı: {len(series)}, istatistik: {reader.last_stats}")
+        check("yalnızca tam satır eklendi (6 kayıt)", len(series) == 6)
+        check("artımlı okuma (reset yok)", not reader.last_stats['reset'])
+        check("yarım satır okunmadı", reader.last_stats['bytes_read'] < size_before)
+
+        with open(jsonl, 'a') as f:
+            f.write(partial[len(partial) // 2:] + "\n")
+        series = reader.read(jsonl, "agent_session")
+        print(f"Kayıt sayısı: {len(series)}, istatistik: {reader.last_stats}")
+        check("tamamlanan satır okundu (7 kayıt)", len(series) == 7 and series['input'][-1] == 6)
+
+        # Test senaryosu 3: Yeni süreç kontrol noktasından devam eder
+        print("\n[Test3] Kontrol noktasından devam")
+        print("-" * 40)
+
+        reader = UsageLogReader(cache_dir)
+        series = reader.read(jsonl, "agent_session")
+        print(f"Kayıt sayısı: {len(series)}, istatistik: {reader.last_stats}")
+        check("diskteki seri kullanıldı (0 bayt okundu)",
+              len(series) == 7 and reader.last_stats['bytes_read'] == 0 and not reader.last_stats['reset'])
+        with open(jsonl, 'rb') as f:
+            last, _ = read_last_usage(f, 0, jsonl.stat().st_size, block_size=64)
+        check("sondan okuma son kaydı buluyor (küçük bloklar)", last['usage']['input_tokens'] == 6)
+
+        # Test senaryosu 4: Dosya kısaldı (yeniden yazıldı)
+        print("\n[Test4] Dosyanın kısalması")
+        print("-" * 40)
+
+        with open(jsonl, 'r+') as f:
+            f.truncate(0)
+            f.write(''.join(f"{usage_line(i + 100, start)}\n" for i in range(3)))
+        series = reader.read(jsonl, "agent_session")
+        print(f"Kayıt sayısı: {len(series)}, istatistik: {reader.last_stats}")
+        check("seri baştan oluşturuldu", reader.last_stats['reset'] and len(series) == 3)
+        check("eski kayıtlar atıldı", series['input'].tolist() == [100, 101, 102])
+
+        # Test senaryosu 5: inode değişti (baş kısmı aynı, daha büyük yeni dosya)
+        print("\n[Test5] inode değişimi")
+        print("-" * 40)
+
+        replacement = temp_path / "session.new"
+        replacement.write_text(''.join(f"{usage_line(i + 100, start)}\n" for i in range(4)))
+        os.replace(replacement, jsonl)
+        reader = UsageLogReader(cache_dir)
+        series = reader.read(jsonl, "agent_session")
+        print(f"Kayıt sayısı: {len(series)}, istatistik: {reader.last_stats}")
+        check("yeni inode algılandı", reader.last_stats['reset'])
+        check("yeni dosyanın kayıtları", series['input'].tolist() == [100, 101, 102, 103])
+
+        # Test senaryosu 6: Seri işlemleri
+        print("\n[Test6] UsageSeries")
+        print("-" * 40)
+
+        total = series.total.tolist()
+        print(f"Toplam token: {total}")
+        check("total = 4 sütunun toplamı", total == [211, 212, 213, 214])
+        merged = UsageSeries.concat([series, reader.read(jsonl, "agent_session")[:2]])
+        check("concat zamana göre sıralı", bool((merged.ts[1:] >= merged.ts[:-1]).all()) and len(merged) == 6)
+
+if __name__ == "__main__":
+    try:
+        run_test()
+        print("\n" + "=" * 60)
+        if failures:
+            print(f"❌ Başarısız kontroller: {len(failures)}")
+            print("=" * 60)
+            sys.exit(1)
+        print("✅ Test tamamlandı")
+        print("=" * 60)
+    except Exception as e:
+        print(f"\n❌ Hata oluştu: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Claude Code JSONL günlükleri için kontrol noktalı (checkpoint) usage okuyucu
+
+Oturum JSONL dosyaları ajan çalıştıkça sonuna eklenerek büyür. Her izleme döngüsünde
+dosyanın tamamını yeniden ayrıştırmak yerine, dosya başına son tüketilen bayt konumu
+(ve inode/boyut parmak izi) saklanır; yalnızca yeni eklenen satırlar ayrıştırılıp
+diskteki usage serisine eklenir.
+
+Önbellek dosyaları (.cache/context_monitor/):
+- {ajan}_{oturum}.ckpt.json : kontrol noktası (offset, inode, size, head, kayıt sayısı)
+- {ajan}_{oturum}.usage.bin  : yalnızca eklenen usage serisi (usage_series.USAGE_DTYPE kayıtları, memmap ile okunur)
+
+Dosya kısalırsa, inode değişirse ya da baştaki baytlar farklıysa (yeniden yazılmış dosya)
+kontrol noktası geçersiz sayılır ve seri baştan oluşturulur.
+
+Satırların çoğu (araç sonuçları, dosya içerikleri, kullanıcı mesajları) usage içermez.
+Ham baytlar (mmap) üzerinde "usage" anahtarı aranır; yalnızca aday satırlar çözülür.
+Yalnızca son kayıt gerektiğinde (hızlı durum) dosya sondan başa bloklar halinde okunur.
+orjson/ujson kuruluysa JSON çözümü için o kullanılır.
+"""
+
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from usage_series import USAGE_DTYPE, UsageSeries, to_records
+
+try:
+    import orjson
+    _loads = orjson.loads
+    JSON_BACKEND = 'orjson'
+except ImportError:
+    try:
+        import ujson
+        _loads = ujson.loads
+        JSON_BACKEND = 'ujson'
+    except ImportError:
+        _loads = json.loads
+        JSON_BACKEND = 'json'
+
+CHECKPOINT_VERSION = 2
+HEAD_BYTES = 256  # Yeniden yazılmış dosyayı ayırt etmek için saklanan baş kısım
+REVERSE_BLOCK_BYTES = 64 * 1024  # Son usage kaydı aranırken sondan okunan blok boyutu
+
+# Dize içindeki kaçışlı \"usage\" eşleşmez; yanlış adaylar extract_usage içinde elenir
+USAGE_KEY_PATTERN = re.compile(rb'"usage"\s*:\s*\{')
+
+
+def candidate_lines(data, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+    """data[start:end] içinde "usage" anahtarı geçen satırlar (bytes, mmap veya bytearray)
+
+    Yalnızca tam satırlar verilmelidir (end bir satır sonunun hemen ardı olmalı).
+    """
+    end = len(data) if end is None else end
+    pos = start
+    while True:
+        match = USAGE_KEY_PATTERN.search(data, pos, end)
+        if match is None:
+            return
+        line_start = data.rfind(b'\n', start, match.start()) + 1
+        line_end = data.find(b'\n', match.end(), end)
+        if line_end < 0:
+            line_end = end
+        yield data[max(line_start, start):line_end]
+        pos = line_end + 1
+
+
+def read_last_usage(f, start: int, end: int,
+                    block_size: int = REVERSE_BLOCK_BYTES) -> Tuple[Optional[Dict], int]:
+    """Dosyayı sondan başa bloklar halinde okuyup [start, end) aralığındaki son usage girdisini bul
+
+    İlk usage satırında durulur; tipik durumda yalnızca son birkaç blok okunur. Satır sınırı
+    ham baytlarda aranır: çok baytlı UTF-8 dizileri 0x0A içermediği için blok sınırında bölünen
+    karakterler satır birleştirilince bütünleşir. Blokları aşan uzun satırlar (büyük araç sonuçları)
+    parçaları biriktirilerek tamamlanır.
+
+    Args:
+        f: İkili kipte açılmış dosya
+        start: Aranacak aralığın başı (bir satır başı olmalı)
+        end: Aralığın sonu (genellikle dosya boyutu)
+
+    Returns:
+        (son usage girdisi ya da None, son tam satırın bittiği konum)
+        Yazılmakta olan son (satır sonu olmayan) satır dikkate alınmaz.
+    """
+    pos = end
+    complete_end = None
+    pieces: List[bytes] = []  # Tamamlanmamış satırın sondan başa parçaları
+
+    def check(line_pieces: List[bytes]) -> Optional[Dict]:
+        line = b''.join(reversed(line_pieces))
+        return extract_usage(line) if USAGE_KEY_PATTERN.search(line) else None
+
+    while pos > start:
+        block_start = max(start, pos - block_size)
+        f.seek(block_start)
+        block = f.read(pos - block_start)
+        pos = block_start
+        line_end = len(block)
+        while True:
+            newline = block.rfind(b'\n', 0, line_end)
+            if newline < 0:
+                pieces.append(block[:line_end])
+                break
+            if complete_end is None:
+                complete_end = block_start + newline + 1
+            else:
+                pieces.append(block[newline + 1:line_end])
+                entry = check(pieces)
+                if entry is not None:
+                    return entry, complete_end
+            pieces = []
+            line_end = newline
+
+    if complete_end is None:
+        return None, start
+    # Aralığın ilk satırı
+    return (check(pieces) if pieces else None), complete_end
+
+
+def extract_usage(line: bytes) -> Optional[Dict]:
+    """Tek JSONL satırından {'timestamp', 'usage'} çıkar (usage yoksa None)"""
+    try:
+        entry = _loads(line)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if not isinstance(entry, dict) or 'timestamp' not in entry:
+        return None
+    msg = entry.get('message')
+    if isinstance(msg, dict) and isinstance(msg.get('usage'), dict):
+        return {'timestamp': entry['timestamp'], 'usage': msg['usage']}
+    return None
+
+
+def parse_lines(data, start: int = 0, end: Optional[int] = None) -> List[Dict]:
+    """Tam satırlardan oluşan bayt bloğundaki usage girdileri (yalnızca aday satırlar çözülür)"""
+    entries = []
+    for line in candidate_lines(data, start, end):
+        usage = extract_usage(line)
+        if usage is not None:
+            entries.append(usage)
+    return entries
+
+
+class UsageLogReader:
+    """Oturum JSONL dosyalarını artımlı okuyan usage serisi deposu"""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            cache_dir: Kontrol noktası ve serilerin tutulduğu dizin (None ise kalıcılık yok)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # İzleme modunda aynı süreçte seri tekrar diskten okunmaz
+        self._series: Dict[str, np.ndarray] = {}
+        self._checkpoints: Dict[str, Dict] = {}
+        self.last_stats = {'bytes_read': 0, 'new_entries': 0, 'reset': False}
+
+    def _paths(self, key: str):
+        return (self.cache_dir / f"{key}.ckpt.json", self.cache_dir / f"{key}.usage.bin")
+
+    def _load_checkpoint(self, key: str) -> Optional[Dict]:
+        if key in self._checkpoints:
+            return self._checkpoints[key]
+        if not self.cache_dir:
+            return None
+        ckpt_path, _ = self._paths(key)
+        try:
+            ckpt = json.loads(ckpt_path.read_text())
+        except (OSError, ValueError):
+            return None
+        return ckpt if ckpt.get('version') == CHECKPOINT_VERSION else None
+
+    def _map_series(self, key: str, count: int) -> Optional[np.ndarray]:
+        """Seri dosyasının ilk count kaydını salt okunur eşle
+
+        Kontrol noktasından sonra yazılmış (başka süreç/yarım kalmış) kısım okunmaz.
+        """
+        if count == 0:
+            return np.zeros(0, dtype=USAGE_DTYPE)
+        _, series_path = self._paths(key)
+        try:
+            if series_path.stat().st_size < count * USAGE_DTYPE.itemsize:
+                return None
+            return np.memmap(series_path, dtype=USAGE_DTYPE, mode='r', shape=(count,))
+        except (OSError, ValueError):
+            return None
+
+    def _load_series(self, key: str, ckpt: Dict) -> Optional[np.ndarray]:
+        if key in self._series:
+            return self._series[key]
+        return self._map_series(key, ckpt['count'])
+
+    def _save(self, key: str, ckpt: Dict, records: np.ndarray, start: int) -> np.ndarray:
+        """Kayıtları start konumundan itibaren yaz, kontrol noktasını güncelle ve seriyi yeniden eşle
+
+        Önce seri, sonra kontrol noktası yazılır; seri dosyası önce bilinen son boyuta kesildiği için
+        çökme ya da başka bir sürecin yazdığı fazlalık yinelenen kayıt bırakmaz.
+        """
+        ckpt_path, series_path = self._paths(key)
+        try:
+            with open(series_path, 'r+b' if start and series_path.exists() else 'wb') as f:
+                f.seek(start * USAGE_DTYPE.itemsize)
+                f.truncate()
+                f.write(records.tobytes())
+            tmp_path = ckpt_path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(ckpt))
+            tmp_path.replace(ckpt_path)
+        except OSError:
+            return None  # Önbelleğe yazılamazsa bir sonraki çalıştırmada baştan okunur
+        return self._map_series(key, ckpt['count'])
+
+    def read(self, jsonl_file: Path, key: str) -> UsageSeries:
+        """Dosyanın tüm usage serisini döndür (yalnızca yeni eklenen satırlar ayrıştırılır)
+
+        Args:
+            jsonl_file: Oturum JSONL dosyası
+            key: Önbellek anahtarı (ör: "{ajan}_{oturum}")
+        """
+        jsonl_file = Path(jsonl_file)
+        with open(jsonl_file, 'rb') as f:
+            st = os.fstat(f.fileno())
+            head = f.read(HEAD_BYTES)
+
+            ckpt = self._load_checkpoint(key)
+            series = None
+            if (ckpt and ckpt['inode'] == st.st_ino and ckpt['offset'] <= st.st_size
+                    and head.startswith(bytes.fromhex(ckpt['head']))):
+                series = self._load_series(key, ckpt)
+
+            reset = series is None
+            offset = 0 if reset else ckpt['offset']
+            previous_offset = offset
+            if reset:
+                series = np.zeros(0, dtype=USAGE_DTYPE)
+
+            bytes_read = 0
+            new_entries = []
+            if (reset or st.st_size != ckpt['size']) and st.st_size > offset:
+                # Dosya belleğe kopyalanmadan mmap üzerinde taranır
+                with mmap.mmap(f.fileno(), st.st_size, access=mmap.ACCESS_READ) as data:
+                    # Yazılmakta olan son satır bir sonraki okumaya bırakılır
+                    end = data.rfind(b'\n', offset) + 1
+                    if end > offset:
+                        new_entries = parse_lines(data, offset, end)
+                        bytes_read = end - offset
+                        offset = end
+
+        records = to_records(new_entries)
+        start = len(series)
+        ckpt = {
+            'version': CHECKPOINT_VERSION,
+            'inode': st.st_ino,
+            'size': st.st_size,
+            'offset': offset,
+            'count': start + len(records),
+            'head': head[:min(offset, HEAD_BYTES)].hex(),
+        }
+        mapped = None
+        if self.cache_dir and (reset or offset != previous_offset):
+            if start and not self._paths(key)[1].exists():
+                # Seri dosyası silinmişse bellekteki seri baştan yazılır
+                records, start = np.concatenate([series, records]), 0
+            mapped = self._save(key, ckpt, records, start)
+        if mapped is not None:
+            series = mapped
+        elif len(records):
+            series = np.concatenate([series, records])
+        self._series[key] = series
+        self._checkpoints[key] = ckpt
+        self.last_stats = {'bytes_read': bytes_read, 'new_entries': len(records), 'reset': reset}
+        return UsageSeries.from_records(series)
+
+    def pending_bytes(self, jsonl_file: Path, key: str) -> int:
+        """Kontrol noktasından bu yana eklenmiş (henüz ayrıştırılmamış) bayt sayısı
+
+        Kontrol noktası yoksa ya da dosya yeniden yazılmışsa dosyanın tamamı sayılır.
+        """
+        try:
+            st = os.stat(jsonl_file)
+        except OSError:
+            return 0
+        ckpt = self._load_checkpoint(key)
+        if not ckpt or ckpt['inode'] != st.st_ino or ckpt['offset'] > st.st_size:
+            return st.st_size
+        return st.st_size - ckpt['offset']
+
+    def forget(self, keys: Optional[List[str]] = None):
+        """Bellekteki seri/kontrol noktasını bırak (başka bir süreç diske yazdıktan sonra)"""
+        for key in (keys if keys is not None else list(self._series)):
+            self._series.pop(key, None)
+            self._checkpoints.pop(key, None)
+
+    def cache_files(self) -> List[Path]:
+        """Önbellekteki seri ve kontrol noktası dosyaları"""
+        if not self.cache_dir or not self.cache_dir.exists():
+            return []
+        return sorted(list(self.cache_dir.glob('*.usage.bin')) + list(self.cache_dir.glob('*.ckpt.json')))
+
+
+def ingest_files(cache_dir: Path, items: List[tuple]) -> int:
+    """Süreç havuzu işçisi: (jsonl_file, key) çiftlerini artımlı oku ve önbelleğe yaz
+
+    Sonuç diskteki seri ve kontrol noktasıdır; ana süreç bunları memmap ile eşler.
+
+    Returns:
+        Eklenen usage kaydı sayısı
+    """
+    reader = UsageLogReader(cache_dir)
+    added = 0
+    for jsonl_file, key in items:
+        reader.read(jsonl_file, key)
+        added += reader.last_stats['new_entries']
+    return added
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Ajan başına token zaman serisi için sütun tabanlı gösterim
+
+Diskte (.cache/context_monitor/*.usage.bin) her usage kaydı sabit boyutlu bir yapıdır:
+int64 epoch milisaniye zaman damgası + int32 token sütunları (kayıt başına 24 bayt).
+Dosya np.memmap ile eşlenir; grafik, zaman filtresi ve raporlar bu diziler üzerinde çalışır.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+# Tek bir usage kaydının disk biçimi
+USAGE_DTYPE = np.dtype([
+    ('ts', '<i8'),
+    ('input', '<i4'),
+    ('cache_creation', '<i4'),
+    ('cache_read', '<i4'),
+    ('output', '<i4'),
+])
+
+# Grafiklerde yığılma sırası (statik → dinamik)
+TOKEN_TYPES = ('cache_read', 'cache_creation', 'input', 'output')
+
+# usage sözlüğündeki anahtarlar
+USAGE_KEYS = {
+    'input': 'input_tokens',
+    'cache_creation': 'cache_creation_input_tokens',
+    'cache_read': 'cache_read_input_tokens',
+    'output': 'output_tokens',
+}
+
+INT32_MAX = np.iinfo(np.int32).max
+
+
+def parse_timestamps(values: List[str]) -> np.ndarray:
+    """ISO 8601 zaman dizgelerini toplu olarak epoch milisaniyeye çevir
+
+    Claude Code zaman damgaları UTC'dir ('...Z'); bunlar tek bir NumPy dönüşümüyle ayrıştırılır.
+    Saat dilimi farkı içeren ya da NumPy'nin okuyamadığı değerler tek tek çözülür.
+    """
+    if all(v.endswith('Z') for v in values):
+        try:
+            return np.array([v[:-1] for v in values], dtype='datetime64[ms]').astype(np.int64)
+        except ValueError:
+            pass
+    result = np.empty(len(values), dtype=np.int64)
+    for i, value in enumerate(values):
+        ts = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        result[i] = int(ts.timestamp() * 1000)
+    return result
+
+
+def to_records(entries: List[Dict]) -> np.ndarray:
+    """{'timestamp', 'usage'} girdilerini USAGE_DTYPE kayıtlarına dönüştür"""
+    records = np.zeros(len(entries), dtype=USAGE_DTYPE)
+    if not entries:
+        return records
+    records['ts'] = parse_timestamps([entry['timestamp'] for entry in entries])
+    for column, key in USAGE_KEYS.items():
+        values = np.fromiter((v if isinstance(v, int) else 0
+                              for v in (entry['usage'].get(key, 0) for entry in entries)),
+                             dtype=np.int64, count=len(entries))
+        records[column] = np.clip(values, 0, INT32_MAX)
+    return records
+
+
+class UsageSeries:
+    """Tek ajanın zamana göre sıralı token serisi
+
+    series['input'] gibi erişim sütun dizisini (int64), series[a:b] ya da maske alt seriyi döndürür.
+    'total' sütunu dört token türünün toplamıdır.
+    """
+
+    def __init__(self, ts: np.ndarray, columns: Dict[str, np.ndarray]):
+        """
+        Args:
+            ts: epoch milisaniye zaman damgaları (int64)
+            columns: Token türü → değer dizisi
+        """
+        self.ts = ts
+        self.columns = columns
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> 'UsageSeries':
+        """USAGE_DTYPE kayıtlarından (memmap olabilir) seri oluştur"""
+        return cls(np.asarray(records['ts']),
+                   {column: np.asarray(records[column]) for column in USAGE_KEYS})
+
+    @classmethod
+    def empty(cls) -> 'UsageSeries':
+        return cls.from_records(np.zeros(0, dtype=USAGE_DTYPE))
+
+    @classmethod
+    def concat(cls, parts: Iterable['UsageSeries']) -> 'UsageSeries':
+        """Oturum serilerini birleştirip zamana göre sırala (window/ikili arama sıralı seri bekler)"""
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return cls.empty()
+        ts = np.concatenate([p.ts for p in parts]) if len(parts) > 1 else parts[0].ts
+        if len(parts) == 1 and not np.any(ts[1:] < ts[:-1]):
+            return parts[0]  # Zaten sıralı tek oturum: kopyalanmaz
+        order = np.argsort(ts, kind='stable')
+        return cls(ts[order], {column: np.concatenate([p.columns[column] for p in parts])[order]
+                               for column in parts[0].columns})
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    def __getitem__(self, key: Union[str, slice, np.ndarray]):
+        if isinstance(key, str):
+            if key == 'total':
+                return self.total
+            return self.columns[key].astype(np.int64, copy=False)
+        return UsageSeries(self.ts[key], {column: values[key] for column, values in self.columns.items()})
+
+    @property
+    def total(self) -> np.ndarray:
+        total = np.zeros(len(self.ts), dtype=np.int64)
+        for values in self.columns.values():
+            total += values
+        return total
+
+    @property
+    def times(self) -> np.ndarray:
+        """matplotlib için datetime64[ms] (UTC) dizisi"""
+        return self.ts.astype('datetime64[ms]')
+
+    def time_at(self, index: int) -> datetime:
+        """index konumundaki zaman (UTC datetime)"""
+        return datetime.fromtimestamp(int(self.ts[index]) / 1000, timezone.utc)
+
+    def tokens_at(self, index: int) -> Dict[str, int]:
+        """index konumundaki token sayıları (toplam dahil)"""
+        tokens = {column: int(values[index]) for column, values in self.columns.items()}
+        tokens['total'] = sum(tokens.values())
+        return tokens
+
+    def latest(self) -> Optional[Dict[str, int]]:
+        """En son kaydın token sayıları"""
+        return self.tokens_at(-1) if len(self) else None
+
+    def window(self, start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> 'UsageSeries':
+        """[start_ms, end_ms] aralığındaki kayıtlar (seri sıralı olduğundan ikili arama ile)"""
+        lo = 0 if start_ms is None else int(np.searchsorted(self.ts, start_ms, side='left'))
+        hi = len(self) if end_ms is None else int(np.searchsorted(self.ts, end_ms, side='right'))
+        return self[lo:hi]
+
+    def recent_rate(self, n: int = 10) -> Optional[float]:
+        """Son n kaydın toplam token artış hızı (token/saat; hesaplanamazsa None)"""
+        if len(self) < 2:
+            return None
+        k = min(n, len(self))
+        hours = (self.ts[-1] - self.ts[-k]) / 3600 / 1000
+        if hours <= 0:
+            return None
+        return float(self.total[-1] - self.total[-k]) / hours
+
+    def cumulative(self) -> 'UsageSeries':
+        """Kümülatif toplam serisi (int64)"""
+        return UsageSeries(self.ts, {column: np.cumsum(values, dtype=np.int64)
+                                     for column, values in self.columns.items()})
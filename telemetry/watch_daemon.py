@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VibeCodeHPC izleme daemon'u
+periodic_monitor.sh'ın sabit aralıklı yoklama döngüsünün yerine geçen tek, uzun ömürlü süreç
+
+Özellikler:
+- ChangeLog.md, sota_*.txt, agent_and_pane_id_table.jsonl ve ~/.claude/projects/*.jsonl
+  dosyalarını inotify ile izler (inotify yoksa mtime tabanlı yoklamaya düşer)
+- Olaylar kısa bir sessizlik süresi boyunca biriktirilir (debounce)
+- Yalnızca etkilenen hesaplama aynı süreç içinde yeniden çalıştırılır
+  (matplotlib/numpy/scipy içe aktarma maliyeti bir kez ödenir)
+- Oturum günlüğü değişince ajanın son usage kaydı debounce beklenmeden
+  .cache/context_monitor/latest_usage.json dosyasına yazılır (hızlı durum ve stop hook'ları için)
+
+Kullanım:
+    python3 telemetry/watch_daemon.py --sessions Team1_PM,Team1_Workers1
+"""
+
+import os
+import sys
+import time
+import struct
+import select
+import ctypes
+import ctypes.util
+import argparse
+import subprocess
+import traceback
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Iterable
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "Agent-shared" / "change_log"))
+from changelog_index import SKIP_DIRS
+
+# Görev adları
+TASK_CONTEXT = 'context'
+TASK_BUDGET = 'budget'
+TASK_SOTA = 'sota'
+ALL_TASKS = (TASK_CONTEXT, TASK_BUDGET, TASK_SOTA)
+
+AGENT_TABLE_NAME = 'agent_and_pane_id_table.jsonl'
+
+# Proje ağacında izlenmeyen ek dizinler (araçların kendi çıktıları)
+WATCH_SKIP_DIRS = SKIP_DIRS | {'visualizations', 'snapshots'}
+
+# inotify sabitleri (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def log(message: str):
+    """Zaman damgalı günlük satırı (periodic_monitor.log biçimi)"""
+    timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    print(f"[{timestamp}] {message}", flush=True)
+
+
+def classify_path(path: Path, claude_dirs: Set[Path]) -> Set[str]:
+    """Değişen dosyanın hangi hesaplamaları etkilediğini belirle"""
+    name = path.name
+    if name == 'ChangeLog.md':
+        return {TASK_BUDGET, TASK_SOTA}
+    if name.startswith('sota_') and name.endswith('.txt'):
+        return {TASK_SOTA}
+    if name == AGENT_TABLE_NAME:
+        return {TASK_CONTEXT}
+    if name.endswith('.jsonl') and path.parent in claude_dirs:
+        return {TASK_CONTEXT}
+    return set()
+
+
+class InotifyWatcher:
+    """ctypes üzerinden inotify kullanan dizin izleyici"""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name or not sys.platform.startswith('linux'):
+            raise OSError("inotify kullanılamıyor")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 başarısız")
+        self.watches: Dict[int, Path] = {}
+        self.watched_dirs: Dict[Path, int] = {}
+        self.recursive_roots: List[Path] = []
+
+    def add_dir(self, directory: Path, recursive: bool = False):
+        """Dizini (gerekirse alt dizinleriyle) izlemeye ekle"""
+        directory = Path(directory)
+        if recursive:
+            self.recursive_roots.append(directory)
+            for root, dirs, _ in os.walk(directory):
+                dirs[:] = [d for d in dirs if d not in WATCH_SKIP_DIRS]
+                self._add_watch(Path(root))
+        else:
+            self._add_watch(directory)
+
+    def _add_watch(self, directory: Path):
+        if directory in self.watched_dirs:
+            return
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            if errno == 28:  # ENOSPC: max_user_watches sınırı
+                raise OSError(errno, "inotify izleme sınırına ulaşıldı")
+            return
+        self.watches[wd] = directory
+        self.watched_dirs[directory] = wd
+
+    def _is_under_recursive_root(self, path: Path) -> bool:
+        return any(root == path or root in path.parents for root in self.recursive_roots)
+
+    def poll(self, timeout: float) -> Optional[List[Path]]:
+        """Olayları bekle ve değişen yolları döndür
+
+        Returns:
+            Değişen yolların listesi; kuyruk taştıysa None (tam yeniden tarama gerekir)
+        """
+        readable, _, _ = select.select([self.fd], [], [], max(timeout, 0))
+        if not readable:
+            return []
+
+        changed = []
+        overflow = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b'\0')
+                offset += name_len
+
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                directory = self.watches.get(wd)
+                if directory is None:
+                    continue
+                if mask & IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    self.watched_dirs.pop(directory, None)
+                    continue
+                if not name:
+                    continue
+
+                path = directory / os.fsdecode(name)
+                if (mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO)
+                        and path.name not in WATCH_SKIP_DIRS
+                        and self._is_under_recursive_root(path)):
+                    # Yeni dizin: içinde zaten oluşmuş dosyaları da bildir
+                    for root, dirs, files in os.walk(path):
+                        dirs[:] = [d for d in dirs if d not in WATCH_SKIP_DIRS]
+                        self._add_watch(Path(root))
+                        changed.extend(Path(root) / f for f in files)
+                changed.append(path)
+
+        return None if overflow else changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """inotify olmayan ortamlar için mtime/boyut karşılaştırmalı izleyici"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.dirs: List[tuple] = []
+        self.snapshot: Dict[Path, tuple] = {}
+        self.last_scan = 0.0
+
+    def add_dir(self, directory: Path, recursive: bool = False):
+        self.dirs.append((Path(directory), recursive))
+        self.snapshot.update(self._scan_dir(Path(directory), recursive))
+
+    @staticmethod
+    def _scan_dir(directory: Path, recursive: bool) -> Dict[Path, tuple]:
+        result = {}
+        if recursive:
+            walker = os.walk(directory)
+        else:
+            try:
+                walker = [(str(directory), [], os.listdir(directory))]
+            except OSError:
+                walker = []
+        for root, dirs, files in walker:
+            dirs[:] = [d for d in dirs if d not in WATCH_SKIP_DIRS]
+            for name in files:
+                path = Path(root) / name
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                result[path] = (stat.st_mtime_ns, stat.st_size)
+        return result
+
+    def poll(self, timeout: float) -> Optional[List[Path]]:
+        wait = self.last_scan + self.interval - time.monotonic()
+        if wait > 0:
+            time.sleep(min(wait, max(timeout, 0)))
+            if self.last_scan + self.interval > time.monotonic():
+                return []
+        self.last_scan = time.monotonic()
+
+        current = {}
+        for directory, recursive in self.dirs:
+            current.update(self._scan_dir(directory, recursive))
+        changed = [path for path, key in current.items() if self.snapshot.get(path) != key]
+        changed.extend(path for path in self.snapshot if path not in current)
+        self.snapshot = current
+        return changed
+
+    def close(self):
+        pass
+
+
+class WatchDaemon:
+    """Dosya olaylarını biriktirip yalnızca etkilenen hesaplamaları yürüten daemon"""
+
+    def __init__(self, project_root: Path, sessions: Iterable[str] = (),
+                 debounce_sec: float = 2.0, min_gap_sec: Optional[Dict[str, float]] = None,
+                 budget_heartbeat_sec: float = 180, max_runtime_min: Optional[int] = None,
+                 poll_interval_sec: float = 30, force_polling: bool = False,
+                 render_workers: Optional[int] = None):
+        """
+        Args:
+            project_root: Proje kök yolu
+            sessions: Canlılığı denetlenecek tmux oturumları (hiçbiri yoksa daemon biter)
+            debounce_sec: Son olaydan sonra hesaplamadan önce beklenecek sessizlik süresi
+            min_gap_sec: Görev başına iki çalıştırma arasındaki en kısa süre
+            budget_heartbeat_sec: Olay olmasa da bütçenin yeniden hesaplanma aralığı
+                (çalışan işler zamanla puan tüketir)
+            max_runtime_min: Azami çalışma süresi (proje başlangıcından itibaren)
+            poll_interval_sec: Yoklama yedeğinde tarama aralığı
+            force_polling: inotify yerine her zaman yoklama kullan
+            render_workers: Kalıcı çizim servisinin süreç sayısı (None: çekirdek sayısına göre,
+                0: grafikleri daemon sürecinde çiz)
+        """
+        self.project_root = Path(project_root)
+        self.sessions = [s for s in sessions if s]
+        self.debounce_sec = debounce_sec
+        self.min_gap_sec = {TASK_CONTEXT: 30, TASK_BUDGET: 30, TASK_SOTA: 60}
+        self.min_gap_sec.update(min_gap_sec or {})
+        self.budget_heartbeat_sec = budget_heartbeat_sec
+        self.max_runtime_min = max_runtime_min
+        self.poll_interval_sec = poll_interval_sec
+        self.force_polling = force_polling
+        self.render_workers = render_workers
+
+        self.pending: Set[str] = set()
+        self.first_event = 0.0
+        self.last_event = 0.0
+        self.last_run: Dict[str, float] = {}
+        self.claude_dirs: Set[Path] = set()
+        self.session_agents: Dict[Path, str] = {}  # Oturum JSONL dosyası → ajan ID
+
+        self._context_monitor = None
+        self._latest_usage = None
+        self._budget_tracker = None
+        self._renderer = None
+        self.watcher = None
+
+    # ---- İzleme kurulumu ----
+
+    def _create_watcher(self):
+        if not self.force_polling:
+            try:
+                watcher = InotifyWatcher()
+                self._register(watcher)
+                log(f"inotify izleyici etkin ({len(watcher.watches)} dizin)")
+                return watcher
+            except OSError as e:
+                log(f"inotify kullanılamıyor ({e}), yoklamaya geçiliyor")
+        watcher = PollingWatcher(self.poll_interval_sec)
+        self._register(watcher)
+        log(f"Yoklama izleyici etkin (aralık: {self.poll_interval_sec}s)")
+        return watcher
+
+    def _register(self, watcher):
+        watcher.add_dir(self.project_root, recursive=True)
+        self.claude_dirs = self._resolve_claude_dirs()
+        for directory in sorted(self.claude_dirs):
+            watcher.add_dir(directory)
+
+    def _resolve_claude_dirs(self) -> Set[Path]:
+        """Ajan tablosundaki oturumların JSONL dizinlerini bul"""
+        monitor = self._get_context_monitor()
+        try:
+            files = monitor.find_project_jsonl_files()
+        except Exception as e:
+            log(f"Claude oturum dizinleri çözülemedi: {e}")
+            return set()
+        self.session_agents = {path: agent_id for agent_id, paths in files.items() for path in paths}
+        return {path.parent for paths in files.values() for path in paths}
+
+    def _refresh_claude_dirs(self):
+        """Ajan tablosu değişince yeni oturum dizinlerini izlemeye ekle"""
+        for directory in self._resolve_claude_dirs() - self.claude_dirs:
+            self.watcher.add_dir(directory)
+            self.claude_dirs.add(directory)
+            log(f"Yeni oturum dizini izleniyor: {directory}")
+
+    # ---- Görevler ----
+
+    def _get_renderer(self):
+        """Tüm görevlerin paylaştığı kalıcı çizim servisi (matplotlib süreçleri bir kez ısınır)"""
+        if self._renderer is None:
+            sys.path.insert(0, str(PROJECT_ROOT / "telemetry"))
+            from render_service import RenderService, default_workers
+            workers = default_workers() if self.render_workers is None else self.render_workers
+            self._renderer = RenderService(workers)
+            log(f"Çizim servisi: {workers or 'daemon süreci içinde'} süreç")
+        return self._renderer
+
+    def _get_context_monitor(self):
+        if self._context_monitor is None:
+            sys.path.insert(0, str(PROJECT_ROOT / "telemetry"))
+            from context_usage_monitor import ContextUsageMonitor
+            self._context_monitor = ContextUsageMonitor(self.project_root, renderer=self._get_renderer())
+        return self._context_monitor
+
+    def _get_budget_tracker(self):
+        if self._budget_tracker is None:
+            sys.path.insert(0, str(PROJECT_ROOT / "Agent-shared" / "budget"))
+            from budget_tracker import BudgetTracker
+            self._budget_tracker = BudgetTracker(self.project_root, renderer=self._get_renderer())
+        return self._budget_tracker
+
+    def _get_latest_usage(self):
+        if self._latest_usage is None:
+            sys.path.insert(0, str(PROJECT_ROOT / "telemetry"))
+            from latest_usage_state import LatestUsageState
+            self._latest_usage = LatestUsageState(self.project_root)
+        return self._latest_usage
+
+    def update_latest_usage(self, paths: Optional[Iterable[Path]] = None):
+        """Değişen oturum dosyalarının son usage kaydını durum dosyasına yaz
+
+        Yalnızca eklenen baytlar taranır; grafik üretimi gibi debounce beklemez.
+        """
+        state = self._get_latest_usage()
+        with state.transaction():
+            for path in (self.session_agents if paths is None else paths):
+                agent_id = self.session_agents.get(path)
+                if agent_id:
+                    state.update_file(path, agent_id)
+
+    def run_context(self):
+        monitor = self._get_context_monitor()
+        all_agent_data = monitor.collect_agent_data(verbose=False)
+        if not all_agent_data:
+            log("context: kullanım verisi yok")
+            return
+        monitor.generate_all_graphs(all_agent_data, 'overview')
+        monitor.generate_summary_report(all_agent_data)
+        predictions = monitor.predict_compaction(all_agent_data)
+        state = self._get_latest_usage()
+        with state.transaction():
+            state.set_models({agent_id: p['model'] for agent_id, p in predictions.items()})
+        log(f"context: {len(all_agent_data)} ajan güncellendi")
+
+    def run_budget(self):
+        tracker = self._get_budget_tracker()
+        report = tracker.generate_report()
+        tracker.visualize_budget()
+        forecast = tracker.generate_forecast()
+        log(f"budget: {report['total_points']:.1f} puan tüketildi, öneri: {forecast['hints']['status']}")
+
+    def run_sota(self):
+        sys.path.insert(0, str(PROJECT_ROOT / "Agent-shared" / "sota"))
+        from sota_visualizer import SOTAVisualizer
+        success = SOTAVisualizer(self.project_root, renderer=self._get_renderer()).run('pipeline')
+        log(f"sota: pipeline {'tamamlandı' if success else 'atlandı/başarısız'}")
+
+    def _run_task(self, task: str):
+        start = time.monotonic()
+        self.last_run[task] = start
+        try:
+            getattr(self, f'run_{task}')()
+        except Exception as e:
+            log(f"{task}: hata: {e}")
+            traceback.print_exc()
+        log(f"{task}: {time.monotonic() - start:.1f}s")
+
+    # ---- Ana döngü ----
+
+    def _mark(self, tasks: Iterable[str]):
+        tasks = set(tasks)
+        if not tasks:
+            return
+        now = time.monotonic()
+        if not self.pending:
+            self.first_event = now
+        self.pending |= tasks
+        self.last_event = now
+
+    def _handle_changes(self, changed: Optional[List[Path]]):
+        if changed is None:
+            log("inotify kuyruğu taştı, tüm görevler işaretlendi")
+            self._mark(ALL_TASKS)
+            return
+        tasks = set()
+        table_changed = False
+        session_files = set()
+        for path in changed:
+            path_tasks = classify_path(path, self.claude_dirs)
+            if TASK_CONTEXT in path_tasks and path.suffix == '.jsonl':
+                session_files.add(path)
+            tasks |= path_tasks
+            table_changed = table_changed or path.name == AGENT_TABLE_NAME
+        if table_changed:
+            self._refresh_claude_dirs()
+        if session_files:
+            try:
+                self.update_latest_usage(session_files)
+            except Exception as e:
+                log(f"latest_usage: hata: {e}")
+        self._mark(tasks)
+
+    def _due_tasks(self) -> List[str]:
+        """Sessizlik süresi dolmuş ve en kısa aralığı geçmiş görevler"""
+        now = time.monotonic()
+        due = []
+        # Sürekli yazılan günlükler nedeniyle debounce sonsuza kadar ertelenmesin
+        quiet = now - self.last_event >= self.debounce_sec
+        overdue = now - self.first_event >= self.debounce_sec * 10
+        if self.pending and (quiet or overdue):
+            for task in ALL_TASKS:
+                if task in self.pending and now - self.last_run.get(task, -1e9) >= self.min_gap_sec[task]:
+                    due.append(task)
+        if TASK_BUDGET not in due and now - self.last_run.get(TASK_BUDGET, now) >= self.budget_heartbeat_sec:
+            due.append(TASK_BUDGET)
+        return due
+
+    def _next_timeout(self) -> float:
+        now = time.monotonic()
+        candidates = [self.last_run.get(TASK_BUDGET, now) + self.budget_heartbeat_sec - now]
+        if self.pending:
+            candidates.append(self.last_event + self.debounce_sec - now)
+            for task in self.pending:
+                candidates.append(self.last_run.get(task, -1e9) + self.min_gap_sec[task] - now)
+        return max(0.1, min(min(candidates), 60))
+
+    def _sessions_alive(self) -> bool:
+        if not self.sessions:
+            return True
+        for session in self.sessions:
+            result = subprocess.run(['tmux', 'has-session', '-t', session],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if result.returncode == 0:
+                return True
+        return False
+
+    def _runtime_exceeded(self) -> bool:
+        if not self.max_runtime_min:
+            return False
+        start_file = self.project_root / "Agent-shared" / "project_start_time.txt"
+        try:
+            start = datetime.fromisoformat(start_file.read_text().strip().replace('Z', '+00:00'))
+        except (OSError, ValueError):
+            return False
+        elapsed_min = (datetime.now(timezone.utc) - start).total_seconds() / 60
+        return elapsed_min > self.max_runtime_min
+
+    def run(self, once: bool = False):
+        """Daemon döngüsü
+
+        Args:
+            once: Tüm görevleri bir kez çalıştırıp çık (test/elle güncelleme için)
+        """
+        log(f"İzleme daemon'u başladı (PID: {os.getpid()}, kök: {self.project_root})")
+        self.watcher = self._create_watcher()
+        self.update_latest_usage()
+
+        # Başlangıçta tüm çıktılar bir kez üretilir
+        for task in ALL_TASKS:
+            self._run_task(task)
+        if once:
+            self.close()
+            return
+
+        last_liveness = time.monotonic()
+        try:
+            while True:
+                self._handle_changes(self.watcher.poll(self._next_timeout()))
+
+                for task in self._due_tasks():
+                    self.pending.discard(task)
+                    self._run_task(task)
+
+                if time.monotonic() - last_liveness >= 60:
+                    last_liveness = time.monotonic()
+                    if not self._sessions_alive():
+                        log("Proje tmux oturumu bulunamadı, daemon sonlanıyor")
+                        break
+                    if self._runtime_exceeded():
+                        log(f"Azami çalışma süresine ulaşıldı ({self.max_runtime_min}min), daemon sonlanıyor")
+                        break
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+            log("İzleme daemon'u sonlandı")
+
+    def close(self):
+        self.watcher.close()
+        if self._renderer is not None:
+            self._renderer.close()
+            self._renderer = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VibeCodeHPC izleme daemon'u (inotify + debounce)")
+    parser.add_argument('--root', type=str, default=str(PROJECT_ROOT),
+                        help='Proje kök dizini (varsayılan: bu betiğin üst dizini)')
+    parser.add_argument('--sessions', type=str, default='',
+                        help='Canlılığı denetlenecek tmux oturumları (virgülle ayrılmış)')
+    parser.add_argument('--debounce-sec', type=float, default=2.0,
+                        help='Son olaydan sonraki sessizlik süresi (varsayılan: 2)')
+    parser.add_argument('--context-gap-sec', type=float, default=30,
+                        help='Bağlam grafikleri arasındaki en kısa süre (varsayılan: 30)')
+    parser.add_argument('--budget-gap-sec', type=float, default=30,
+                        help='Bütçe hesapları arasındaki en kısa süre (varsayılan: 30)')
+    parser.add_argument('--sota-gap-sec', type=float, default=60,
+                        help='SOTA boru hattı çalıştırmaları arasındaki en kısa süre (varsayılan: 60)')
+    parser.add_argument('--budget-interval-min', type=float, default=3,
+                        help='Olay olmasa da bütçenin yeniden hesaplanma aralığı (varsayılan: 3)')
+    parser.add_argument('--max-runtime-min', type=int, default=None,
+                        help='Azami çalışma süresi (dakika)')
+    parser.add_argument('--poll-interval-sec', type=float, default=30,
+                        help='Yoklama yedeğinde tarama aralığı (varsayılan: 30)')
+    parser.add_argument('--polling', action='store_true',
+                        help='inotify yerine yoklama kullan')
+    parser.add_argument('--once', action='store_true',
+                        help='Tüm görevleri bir kez çalıştırıp çık')
+    parser.add_argument('--render-workers', type=int, default=None,
+                        help='Kalıcı çizim servisinin süreç sayısı (0: daemon süreci içinde çiz)')
+    args = parser.parse_args()
+
+    daemon = WatchDaemon(
+        Path(args.root),
+        sessions=args.sessions.split(','),
+        debounce_sec=args.debounce_sec,
+        min_gap_sec={TASK_CONTEXT: args.context_gap_sec,
+                     TASK_BUDGET: args.budget_gap_sec,
+                     TASK_SOTA: args.sota_gap_sec},
+        budget_heartbeat_sec=args.budget_interval_min * 60,
+        max_runtime_min=args.max_runtime_min,
+        poll_interval_sec=args.poll_interval_sec,
+        force_polling=args.polling,
+        render_workers=args.render_workers,
+    )
+    daemon.run(once=args.once)
+
+
+if __name__ == "__main__":
+    main()